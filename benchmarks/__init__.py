@@ -0,0 +1,9 @@
+"""
+Elysia Engine Benchmarks
+========================
+
+Timing harnesses for the hot loops of the simulation.
+
+    python -m benchmarks                  # core-loop suite (see runner.py)
+    python -m benchmarks.neighbor_index   # single-purpose harnesses
+"""
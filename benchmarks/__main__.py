@@ -0,0 +1,9 @@
+import os
+import sys
+
+# Quiet the engine's import-time INFO logging unless asked otherwise
+os.environ.setdefault("ELYSIA_LOG_LEVEL", "WARNING")
+
+from .runner import main  # noqa: E402
+
+sys.exit(main())
@@ -0,0 +1,76 @@
+"""
+Neighbour Index Benchmark
+=========================
+
+Times one full dimensional-binding pass (every active entity checks its
+surroundings) at constant spatial density, so the work per entity stays
+constant and total cost should grow linearly with N.
+
+    python -m benchmarks.neighbor_index [--sizes 1000 10000 100000]
+"""
+
+from __future__ import annotations
+
+import argparse
+import math
+import random
+import time
+from typing import List
+
+from elysia_engine.entities import Entity
+from elysia_engine.math_utils import Vector3
+from elysia_engine.physics import PhysicsWorld
+from elysia_engine.tensor import SoulTensor
+
+DEFAULT_SIZES = [1_000, 10_000, 100_000]
+DENSITY = 0.05  # entities per unit^3 (~1.7 neighbours inside the binding radius)
+
+
+def build_world(n: int, seed: int = 0) -> PhysicsWorld:
+    rng = random.Random(seed)
+    extent = (n / DENSITY) ** (1.0 / 3.0) / 2.0
+    physics = PhysicsWorld()
+    for i in range(n):
+        ent = Entity(
+            id=f"e{i}",
+            soul=SoulTensor(
+                amplitude=rng.uniform(1, 30),
+                frequency=rng.uniform(0.5, 3.0),
+                phase=rng.uniform(0, 2 * math.pi),
+            ),
+        )
+        ent.physics.position = Vector3(
+            rng.uniform(-extent, extent),
+            rng.uniform(-extent, extent),
+            rng.uniform(-extent, extent),
+        )
+        physics.entities.append(ent)
+    physics.refresh_neighbor_index()
+    return physics
+
+
+def time_binding_pass(physics: PhysicsWorld) -> float:
+    start = time.perf_counter()
+    physics.refresh_neighbor_index()
+    for ent in physics.entities:
+        physics.check_dimensional_binding(ent)
+    return time.perf_counter() - start
+
+
+def run(sizes: List[int]) -> None:
+    print(f"{'N':>10} {'pass (s)':>10} {'us/entity':>10}")
+    for n in sizes:
+        physics = build_world(n)
+        elapsed = time_binding_pass(physics)
+        print(f"{n:>10} {elapsed:>10.3f} {elapsed / n * 1e6:>10.2f}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES)
+    args = parser.parse_args()
+    run(args.sizes)
+
+
+if __name__ == "__main__":
+    main()
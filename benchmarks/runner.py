@@ -0,0 +1,231 @@
+"""
+Benchmark Runner
+================
+
+Runs the cases in `benchmarks.suite`, writes the timings as JSON and, given
+a stored baseline, flags every (case, N) whose median got slower than the
+tolerance allows.
+
+    python -m benchmarks                              # full suite
+    python -m benchmarks --quick --only world field   # first two sizes, filtered
+    python -m benchmarks --output results.json
+    python -m benchmarks --compare baseline.json --tolerance 0.25
+    python -m benchmarks --current results.json --compare baseline.json
+
+The exit status is 1 when a regression is flagged, so the compare mode can
+gate CI. Medians are compared (not means) to damp scheduler noise; the
+baseline should come from the same machine.
+
+A size whose single warm-up run exceeds `--budget` seconds is recorded from
+that run alone and larger sizes of the same case are skipped, so quadratic
+paths do not stall the suite.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import logging
+import platform
+import statistics
+import sys
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Sequence
+
+from elysia_engine.logging_config import set_log_level
+
+from .suite import CASES, Case
+
+DEFAULT_REPEAT = 5
+DEFAULT_BUDGET = 30.0  # seconds
+DEFAULT_TOLERANCE = 0.2  # 20% slower than baseline
+
+Results = Dict[str, Dict[str, Dict[str, Any]]]  # case -> str(N) -> stats
+
+
+def measure(op, repeat: int = DEFAULT_REPEAT, budget: float = DEFAULT_BUDGET) -> Dict[str, Any]:
+    """
+    Times `op` after one warm-up call. The warm-up also sizes the run: at
+    most `repeat` samples, fewer if they would not fit in `budget`.
+    """
+    start = time.perf_counter()
+    op()
+    warmup = time.perf_counter() - start
+
+    if warmup >= budget:
+        samples = [warmup]
+    else:
+        count = max(1, min(repeat, int(budget / max(warmup, 1e-9))))
+        samples = []
+        for _ in range(count):
+            start = time.perf_counter()
+            op()
+            samples.append(time.perf_counter() - start)
+
+    return {
+        "median_s": statistics.median(samples),
+        "min_s": min(samples),
+        "mean_s": statistics.fmean(samples),
+        "samples": len(samples),
+        "over_budget": warmup >= budget,
+    }
+
+
+def run_case(
+    bench: Case,
+    sizes: Optional[Sequence[int]] = None,
+    repeat: int = DEFAULT_REPEAT,
+    budget: float = DEFAULT_BUDGET,
+    seed: int = 0,
+    log=None,
+) -> Dict[str, Dict[str, Any]]:
+    out: Dict[str, Dict[str, Any]] = {}
+    for n in sizes if sizes is not None else bench.sizes:
+        try:
+            op = bench.setup(n, seed)
+            stats = measure(op, repeat=repeat, budget=budget)
+        finally:
+            if bench.teardown is not None:
+                bench.teardown()
+        out[str(n)] = stats
+        if log:
+            log(f"{bench.name:<26} {n:>9} {stats['median_s'] * 1000:>12.3f} ms  (x{stats['samples']})")
+        if stats["over_budget"]:
+            if log:
+                log(f"{bench.name:<26} {'':>9} over budget; skipping larger sizes")
+            break
+    return out
+
+
+def select(only: Optional[Sequence[str]] = None) -> List[Case]:
+    """Cases whose name contains any of the `only` substrings (all by default)."""
+    return [c for name, c in CASES.items() if not only or any(key in name for key in only)]
+
+
+def run(
+    only: Optional[Sequence[str]] = None,
+    quick: bool = False,
+    repeat: int = DEFAULT_REPEAT,
+    budget: float = DEFAULT_BUDGET,
+    seed: int = 0,
+    log=None,
+) -> Dict[str, Any]:
+    results: Results = {}
+    for bench in select(only):
+        sizes = bench.sizes[:2] if quick else bench.sizes
+        results[bench.name] = run_case(bench, sizes, repeat=repeat, budget=budget, seed=seed, log=log)
+    return {
+        "meta": {
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "python": platform.python_version(),
+            "implementation": platform.python_implementation(),
+            "machine": platform.machine(),
+            "platform": platform.platform(),
+            "repeat": repeat,
+            "seed": seed,
+        },
+        "results": results,
+    }
+
+
+# --- Baseline comparison ---
+
+@dataclass
+class Comparison:
+    case: str
+    size: str
+    baseline_s: float
+    current_s: float
+
+    @property
+    def ratio(self) -> float:
+        return self.current_s / self.baseline_s if self.baseline_s > 0 else float("inf")
+
+    def is_regression(self, tolerance: float) -> bool:
+        return self.ratio > 1.0 + tolerance
+
+
+def compare(baseline: Dict[str, Any], current: Dict[str, Any]) -> List[Comparison]:
+    """Pairs up the medians of every (case, N) present in both reports."""
+    out: List[Comparison] = []
+    base_results = baseline.get("results", {})
+    for name, sizes in current.get("results", {}).items():
+        base_sizes = base_results.get(name, {})
+        for size, stats in sizes.items():
+            if size in base_sizes:
+                out.append(Comparison(name, size, base_sizes[size]["median_s"], stats["median_s"]))
+    return out
+
+
+def regressions(comparisons: Sequence[Comparison], tolerance: float = DEFAULT_TOLERANCE) -> List[Comparison]:
+    return [c for c in comparisons if c.is_regression(tolerance)]
+
+
+def format_comparison(comparisons: Sequence[Comparison], tolerance: float) -> str:
+    lines = [f"{'case':<26} {'N':>9} {'base ms':>12} {'now ms':>12} {'ratio':>7}"]
+    for c in comparisons:
+        flag = "  REGRESSION" if c.is_regression(tolerance) else ""
+        lines.append(
+            f"{c.case:<26} {c.size:>9} {c.baseline_s * 1000:>12.3f} {c.current_s * 1000:>12.3f} {c.ratio:>7.2f}{flag}"
+        )
+    return "\n".join(lines)
+
+
+def load(path: str) -> Dict[str, Any]:
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def save(report: Dict[str, Any], path: str) -> None:
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2, sort_keys=True)
+        f.write("\n")
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks", description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--only", nargs="+", help="run cases whose name contains any of these")
+    parser.add_argument("--list", action="store_true", help="list cases and exit")
+    parser.add_argument("--quick", action="store_true", help="only the two smallest sizes per case")
+    parser.add_argument("--repeat", type=int, default=DEFAULT_REPEAT)
+    parser.add_argument("--budget", type=float, default=DEFAULT_BUDGET, help="seconds per size")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", "-o", help="write results JSON here")
+    parser.add_argument("--current", help="compare this results JSON instead of running")
+    parser.add_argument("--compare", metavar="BASELINE", help="baseline results JSON")
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE)
+    args = parser.parse_args(argv)
+
+    # Engine INFO logging (tune_in, births, ...) would swamp the table
+    set_log_level(logging.WARNING)
+
+    if args.list:
+        for bench in select(args.only):
+            print(f"{bench.name:<26} {bench.sizes}  {bench.description}")
+        return 0
+
+    if args.current:
+        report = load(args.current)
+    else:
+        report = run(args.only, args.quick, args.repeat, args.budget, args.seed, log=print)
+        if args.output:
+            save(report, args.output)
+
+    if not args.compare:
+        return 0
+
+    comparisons = compare(load(args.compare), report)
+    print()
+    print(format_comparison(comparisons, args.tolerance))
+    flagged = regressions(comparisons, args.tolerance)
+    if flagged:
+        print(f"\n{len(flagged)} regression(s) beyond {args.tolerance:.0%}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,335 @@
+"""
+Core Loop Benchmark Cases
+=========================
+
+Each case builds a fixture for a given size N (untimed) and returns the
+operation to time. Fixtures are seeded, so two runs on the same machine
+measure the same work.
+
+Sizes mean:
+    world.* / physics.* / system.* / field.*  -> number of entities (sources)
+    hypersphere.query                          -> number of stored patterns
+    boundary.*                                 -> number of shell samples
+    soul.*                                     -> number of soul pairs
+    ether.emit                                 -> number of listeners in band
+"""
+
+from __future__ import annotations
+
+import math
+import random
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional, Tuple
+
+from elysia_engine.entities import Entity
+from elysia_engine.ether import Ether, Wave
+from elysia_engine.field import FieldSystem
+from elysia_engine.hypersphere import HypersphereMemory, HypersphericalCoord
+from elysia_engine.math_utils import Vector3, Vector4
+from elysia_engine.physics import HolographicBoundary, PhysicsWorld
+from elysia_engine.systems.fractal_evolution import FractalEvolutionSystem
+from elysia_engine.systems.genesis import GenesisSystem
+from elysia_engine.systems.thermodynamics import ThermodynamicsSystem
+from elysia_engine.systems.void import VoidSystem
+from elysia_engine.tensor import SoulTensor
+from elysia_engine.world import World
+
+DENSITY = 0.05  # entities per unit^3, as in benchmarks.neighbor_index
+ENTITY_SIZES = [100, 1_000, 10_000, 50_000]
+
+Operation = Callable[[], None]
+
+
+@dataclass
+class Case:
+    name: str
+    sizes: List[int]
+    setup: Callable[[int, int], Operation]  # (n, seed) -> timed operation
+    description: str = ""
+    teardown: Optional[Callable[[], None]] = None
+
+
+CASES: Dict[str, Case] = {}
+
+
+def case(name: str, sizes: List[int], teardown: Optional[Callable[[], None]] = None):
+    def register(setup: Callable[[int, int], Operation]) -> Callable[[int, int], Operation]:
+        doc = (setup.__doc__ or "").strip().splitlines()
+        CASES[name] = Case(name, list(sizes), setup, doc[0] if doc else "", teardown)
+        return setup
+
+    return register
+
+
+# --- Fixtures ---
+
+def make_soul(rng: random.Random) -> SoulTensor:
+    return SoulTensor(
+        amplitude=rng.uniform(1, 30),
+        frequency=rng.uniform(0.5, 3.0),
+        phase=rng.uniform(0, 2 * math.pi),
+    )
+
+
+def build_world(n: int, seed: int = 0, tick: int = 0, array_backend: bool = False) -> World:
+    """A World with PhysicsWorld attached and n entities at constant density."""
+    rng = random.Random(seed)
+    extent = (n / DENSITY) ** (1.0 / 3.0) / 2.0
+    physics = PhysicsWorld(array_backend=array_backend)
+    world = World(physics=physics)
+    world.tick = tick
+    for i in range(n):
+        ent = Entity(id=f"e{i}", soul=make_soul(rng))
+        ent.physics.position = Vector3(
+            rng.uniform(-extent, extent),
+            rng.uniform(-extent, extent),
+            rng.uniform(-extent, extent),
+        )
+        ent.physics.velocity = Vector3(rng.uniform(-1, 1), rng.uniform(-1, 1), rng.uniform(-1, 1))
+        world.add_entity(ent)
+        physics.register_entity(ent)
+    return world
+
+
+def field_sources(n: int, seed: int) -> List:
+    rng = random.Random(seed)
+    extent = (n / DENSITY) ** (1.0 / 3.0) / 2.0
+    return [
+        (
+            Vector4(0, rng.uniform(-extent, extent), rng.uniform(-extent, extent), rng.uniform(-extent, extent)),
+            make_soul(rng),
+        )
+        for _ in range(n)
+    ]
+
+
+# --- Simulation loop ---
+
+@case("world.step", ENTITY_SIZES)
+def world_step(n: int, seed: int) -> Operation:
+    """One World.step with PhysicsWorld attached (entity update + geodesic flow + binding)."""
+    world = build_world(n, seed)
+    return lambda: world.step(1.0)
+
+
+@case("physics.step", ENTITY_SIZES)
+def physics_step(n: int, seed: int) -> Operation:
+    """One PhysicsWorld.step (field bloom, integration, binding, sediment)."""
+    physics = build_world(n, seed).physics
+    return lambda: physics.step(1.0)
+
+
+@case("physics.step_arrays", ENTITY_SIZES)
+def physics_step_arrays(n: int, seed: int) -> Operation:
+    """physics.step on the array backend (PhysicsWorld(array_backend=True))."""
+    physics = build_world(n, seed, array_backend=True).physics
+    return lambda: physics.step(1.0)
+
+
+@case("physics.register_entity", ENTITY_SIZES)
+def physics_register(n: int, seed: int) -> Operation:
+    """PhysicsWorld.register_entity of n fresh entities (identity membership check + grid insert)."""
+    rng = random.Random(seed)
+    extent = (n / DENSITY) ** (1.0 / 3.0) / 2.0
+    entities = []
+    for i in range(n):
+        ent = Entity(id=f"e{i}")
+        ent.physics.position = Vector3(rng.uniform(-extent, extent), rng.uniform(-extent, extent), rng.uniform(-extent, extent))
+        entities.append(ent)
+
+    def op() -> None:
+        physics = PhysicsWorld()
+        for ent in entities:
+            physics.register_entity(ent)
+
+    return op
+
+
+@case("world.fork", ENTITY_SIZES)
+def world_fork(n: int, seed: int) -> Operation:
+    """
+    World.fork (prophecy timeline copy) of an n-entity world. An eager copy:
+    ~0.3-0.6 s at 20k entities, about a tenth of World.clone, dominated by
+    per-entity object creation (see elysia_engine/fork.py).
+    """
+    world = build_world(n, seed)
+    return world.fork
+
+
+def _system_case(name: str, make_system: Callable[[], object], tick: int = 0) -> None:
+    def setup(n: int, seed: int) -> Operation:
+        world = build_world(n, seed, tick=tick)
+        system = make_system()
+        return lambda: system.step(world, 1.0)
+
+    setup.__doc__ = f"One {name} step over the whole population."
+    case(f"system.{name}", ENTITY_SIZES)(setup)
+
+
+_system_case("thermodynamics", ThermodynamicsSystem)
+# Past the replication cooldown, so every parent is eligible
+_system_case("genesis", GenesisSystem, tick=1_000)
+_system_case("void", VoidSystem)
+_system_case("fractal_evolution", FractalEvolutionSystem)
+
+
+@case("system.thermodynamics_hot", ENTITY_SIZES)
+def thermodynamics_hot(n: int, seed: int) -> Operation:
+    """ThermodynamicsSystem step with every soul hot enough to stay uncollapsed (heat transfer active)."""
+    world = build_world(n, seed)
+    rng = random.Random(seed)
+    for ent in world.entities.values():
+        ent.soul.frequency = rng.uniform(60.0, 400.0)
+    system = ThermodynamicsSystem()
+    return lambda: system.step(world, 1.0)
+
+
+# --- Field ---
+
+@case("field.update_field", ENTITY_SIZES)
+def field_update(n: int, seed: int) -> Operation:
+    """FieldSystem.update_field painting n sources."""
+    fs = FieldSystem()
+    sources = field_sources(n, seed)
+    return lambda: fs.update_field(sources)
+
+
+def field_bounds(n: int) -> Tuple[Vector4, Vector4]:
+    """Box enclosing field_sources(n, ...) for the dense grid backend."""
+    extent = (n / DENSITY) ** (1.0 / 3.0) / 2.0 + 1.0
+    return Vector4(-1, -extent, -extent, -extent), Vector4(1, extent, extent, extent)
+
+
+@case("field.update_field_dense", ENTITY_SIZES)
+def field_update_dense(n: int, seed: int) -> Operation:
+    """FieldSystem.update_field painting n sources into a DenseFieldGrid."""
+    fs = FieldSystem(bounds=field_bounds(n))
+    sources = field_sources(n, seed)
+    return lambda: fs.update_field(sources)
+
+
+@case("field.update_field_fft", ENTITY_SIZES)
+def field_update_fft(n: int, seed: int) -> Operation:
+    """update_field on a DenseFieldGrid in propagation mode (Gaussian, sigma 2); compare field.update_field_dense."""
+    from elysia_engine.field_grid import gaussian_kernel
+
+    fs = FieldSystem(bounds=field_bounds(n), propagation=gaussian_kernel(2.0))
+    sources = field_sources(n, seed)
+    return lambda: fs.update_field(sources)
+
+
+@case("field.get_local_forces", ENTITY_SIZES)
+def field_forces(n: int, seed: int) -> Operation:
+    """FieldSystem.get_local_forces for each of n sources on a bloomed field."""
+    fs = FieldSystem()
+    sources = field_sources(n, seed)
+    fs.update_field(sources)
+
+    def op() -> None:
+        for pos, soul in sources:
+            fs.get_local_forces(pos, soul)
+
+    return op
+
+
+# --- Holographic boundary ---
+
+BOUNDARY_SIZES = [200, 2_000, 20_000]
+BOUNDARY_PROBES = 100
+
+
+def _boundary_case(name: str, accuracy: float) -> None:
+    def setup(n: int, seed: int) -> Operation:
+        rng = random.Random(seed)
+        # spherical_shell holds 2 * resolution^2 samples
+        boundary = HolographicBoundary.spherical_shell(radius=10.0, resolution=max(1, int(math.sqrt(n / 2))), accuracy=accuracy)
+        points = [Vector3(rng.uniform(-10, 10), rng.uniform(-10, 10), rng.uniform(-10, 10)) for _ in range(BOUNDARY_PROBES)]
+        boundary.sample_many(points[:1])  # Builds the cell index outside the timed call
+        return lambda: boundary.sample_many(points)
+
+    setup.__doc__ = f"HolographicBoundary.sample_many over {BOUNDARY_PROBES} points (accuracy={accuracy})."
+    case(name, BOUNDARY_SIZES)(setup)
+
+
+_boundary_case("boundary.sample_exact", 0.0)
+_boundary_case("boundary.sample_cells", 0.3)
+
+
+# --- Soul resonance (per-pair cost: divide by n) ---
+
+RESONANCE_SIZES = [1_000, 10_000, 100_000]
+
+
+def _soul_pairs(n: int, seed: int) -> Tuple[List[SoulTensor], List[SoulTensor]]:
+    rng = random.Random(seed)
+    return [make_soul(rng) for _ in range(n)], [make_soul(rng) for _ in range(n)]
+
+
+@case("soul.resonate", RESONANCE_SIZES)
+def soul_resonate(n: int, seed: int) -> Operation:
+    """SoulTensor.resonate (rich dict) over n pairs; compare soul.resonance_value."""
+    left, right = _soul_pairs(n, seed)
+    return lambda: [a.resonate(b)["resonance"] for a, b in zip(left, right)]
+
+
+@case("soul.resonance_value", RESONANCE_SIZES)
+def soul_resonance_value(n: int, seed: int) -> Operation:
+    """SoulTensor.resonance_value (float fast path) over n pairs."""
+    left, right = _soul_pairs(n, seed)
+    return lambda: [a.resonance_value(b) for a, b in zip(left, right)]
+
+
+@case("soul.resonance_values", RESONANCE_SIZES)
+def soul_resonance_values(n: int, seed: int) -> Operation:
+    """SoulTensor.resonance_values (batch form): one soul against n others."""
+    left, right = _soul_pairs(n, seed)
+    probe = left[0]
+    return lambda: probe.resonance_values(right)
+
+
+@case("soul.array_resonance_values", RESONANCE_SIZES)
+def soul_array_resonance_values(n: int, seed: int) -> Operation:
+    """SoulTensorArray.resonance_values: one soul against n stored rows (numpy)."""
+    from elysia_engine.tensor_array import SoulTensorArray
+
+    left, right = _soul_pairs(n, seed)
+    store = SoulTensorArray(capacity=n)
+    for soul in right:
+        store.attach(soul)
+    probe = left[0]
+    return lambda: store.resonance_values(probe)
+
+
+# --- Memory ---
+
+@case("hypersphere.query", [10_000, 100_000, 1_000_000])
+def hypersphere_query(n: int, seed: int) -> Operation:
+    """One HypersphereMemory.query (radius 0.1) against n stored patterns."""
+    rng = random.Random(seed)
+    memory = HypersphereMemory()
+    soul = SoulTensor(amplitude=1.0, frequency=1.0, phase=0.0)  # shared: patterns differ by coord
+    two_pi = 2 * math.pi
+    for i in range(n):
+        coord = HypersphericalCoord(rng.uniform(0, two_pi), rng.uniform(0, two_pi), rng.uniform(0, two_pi), 1.0)
+        memory.store(i, coord, soul)
+    probe = HypersphericalCoord(1.0, 2.0, 3.0, 1.0)
+    return lambda: memory.query(probe, radius=0.1)
+
+
+# --- Ether ---
+
+def _reset_ether() -> None:
+    Ether().reset()
+
+
+@case("ether.emit", [10, 100, 1_000, 10_000], teardown=_reset_ether)
+def ether_emit(n: int, seed: int) -> Operation:
+    """One Ether.emit fanned out to n listeners inside the +-10% band."""
+    ether = Ether()
+    ether.reset()
+    base = 10.0
+    for i in range(n):
+        # Distinct frequencies spread across the band (all resonate, attenuated)
+        ether.tune_in(base * (0.9 + 0.2 * (i + 0.5) / n), lambda wave: None)
+    wave = Wave(sender="bench", frequency=base, amplitude=1.0, phase="thought", payload=None)
+    return lambda: ether.emit(wave)
@@ -1,12 +1,13 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import List, Optional, TYPE_CHECKING, Tuple, Dict
+from typing import Dict, Iterable, List, Optional, TYPE_CHECKING, Tuple
 
 from .math_utils import Vector3, Vector4, Quaternion, Rotor
 from .tensor import SoulTensor
 from .field import FieldSystem
 from .entities import Entity
+from .registry import EntityRegistry
 
 # --- Atmospheric Governance Constants ---
 GOLDEN_RATIO = (1 + 5 ** 0.5) / 2
@@ -32,8 +33,8 @@ class PhysicsWorld:
     """
     def __init__(self) -> None:
         self.attractors: List[Attractor] = []
-        self.entities: List[Entity] = []
-        self.sediments: List[Entity] = []
+        self._active = EntityRegistry()
+        self._abyss = EntityRegistry()
 
         self.gravity_constant: float = 1.0
         self.coupling_constant: float = 0.5
@@ -43,19 +44,37 @@ class PhysicsWorld:
         self.spacetime_torsion: Optional[Quaternion] = None
         self.field_system = FieldSystem()
 
+    @property
+    def entities(self) -> EntityRegistry:
+        """Active entities (id-indexed; see registry)."""
+        return self._active
+
+    @entities.setter
+    def entities(self, entities: Iterable[Entity]) -> None:
+        self._active.replace(entities)
+
+    @property
+    def sediments(self) -> EntityRegistry:
+        """Entities in the Abyss."""
+        return self._abyss
+
+    @sediments.setter
+    def sediments(self, entities: Iterable[Entity]) -> None:
+        self._abyss.replace(entities)
+
     def add_attractor(self, attractor: Attractor) -> None:
         self.attractors.append(attractor)
 
     def register_entity(self, entity: Entity) -> None:
-        if entity not in self.entities and entity not in self.sediments:
-            self.entities.append(entity)
+        if entity not in self._active and entity not in self._abyss:
+            self._active.add(entity)
 
     def add_entity(self, entity: Entity) -> None:
         self.register_entity(entity)
 
     def update_field(self) -> None:
         active_data = []
-        all_entities = self.entities + self.sediments
+        all_entities = [*self._active, *self._abyss]
 
         for ent in all_entities:
             if ent.soul:
@@ -152,7 +171,7 @@ class PhysicsWorld:
         for entity in self.entities:
             self.apply_atmospheric_governance(entity)
             if entity.physics.mass > ABYSS_THRESHOLD:
-                self.sediments.append(entity)
+                self._abyss.add(entity)
                 continue
 
             force = self.get_geodesic_flow(entity)
@@ -168,7 +187,7 @@ class PhysicsWorld:
             for entity in self.sediments:
                 self.apply_atmospheric_governance(entity)
                 if entity.physics.mass <= ABYSS_THRESHOLD:
-                    self.entities.append(entity)
+                    self._active.add(entity)
                     continue
                 entity.physics.velocity *= 0.9
                 entity.physics.step(dt)
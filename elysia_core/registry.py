@@ -0,0 +1,108 @@
+"""
+Entity Registry
+===============
+
+Entities indexed by id. A dense list keeps them in insertion order for the
+per-tick loops; a dict maps id -> slot for O(1) add, lookup and removal
+(the last entity moves into the freed slot).
+
+`EntityRegistry.view` is a live, read-only id -> Entity mapping over the
+same storage, so `World.entities` hands systems the registry itself instead
+of building a fresh dict on every access.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Mapping
+from typing import Dict, Iterable, Iterator, List, Optional, Union
+
+from .entities import Entity
+
+
+class EntityRegistry:
+    """Id-indexed, densely stored entity set shared by World and PhysicsWorld."""
+
+    def __init__(self, entities: Iterable[Entity] = ()) -> None:
+        self._dense: List[Entity] = []
+        self._slots: Dict[str, int] = {}
+        self.view = EntityView(self)
+        for entity in entities:
+            self.add(entity)
+
+    def add(self, entity: Entity) -> bool:
+        """
+        Registers an entity; one with the same id is replaced in place.
+        Returns False if this very entity was already registered.
+        """
+        slot = self._slots.get(entity.id)
+        if slot is not None:
+            if self._dense[slot] is entity:
+                return False
+            self._dense[slot] = entity
+            return True
+        self._slots[entity.id] = len(self._dense)
+        self._dense.append(entity)
+        return True
+
+    def remove(self, entity_id: str) -> Optional[Entity]:
+        """Unregisters by id and returns the entity (None if unknown)."""
+        slot = self._slots.pop(entity_id, None)
+        if slot is None:
+            return None
+        dense = self._dense
+        entity = dense[slot]
+        last = dense.pop()
+        if slot < len(dense):
+            dense[slot] = last
+            self._slots[last.id] = slot
+        return entity
+
+    def replace(self, entities: Iterable[Entity]) -> None:
+        """Swaps in a new member list (in order); `view` stays valid."""
+        self._dense = []
+        self._slots = {}
+        for entity in entities:
+            self.add(entity)
+
+    def get(self, entity_id: str, default: Optional[Entity] = None) -> Optional[Entity]:
+        slot = self._slots.get(entity_id)
+        return default if slot is None else self._dense[slot]
+
+    def __contains__(self, item: Union[Entity, str]) -> bool:
+        """Membership by id for strings, by identity for entities."""
+        if isinstance(item, str):
+            return item in self._slots
+        slot = self._slots.get(getattr(item, "id", None))
+        return slot is not None and self._dense[slot] is item
+
+    def __iter__(self) -> Iterator[Entity]:
+        return iter(self._dense)
+
+    def __len__(self) -> int:
+        return len(self._dense)
+
+
+class EntityView(Mapping):
+    """Read-only id -> Entity mapping over an EntityRegistry (never copied)."""
+
+    __slots__ = ("_registry",)
+
+    def __init__(self, registry: EntityRegistry) -> None:
+        self._registry = registry
+
+    def __getitem__(self, entity_id: str) -> Entity:
+        registry = self._registry
+        return registry._dense[registry._slots[entity_id]]
+
+    def __contains__(self, entity_id: object) -> bool:
+        return entity_id in self._registry._slots
+
+    def __iter__(self) -> Iterator[str]:
+        return (entity.id for entity in self._registry._dense)
+
+    def __len__(self) -> int:
+        return len(self._registry)
+
+    def values(self) -> EntityRegistry:  # type: ignore[override]
+        # The registry is already a sized, iterable collection of the entities
+        return self._registry
@@ -1,5 +1,5 @@
 from __future__ import annotations
-from typing import Dict, Any
+from typing import Any, Mapping
 from dataclasses import dataclass, field
 from .physics import PhysicsWorld
 from .entities import Entity
@@ -10,9 +10,9 @@ class World:
     tick: int = 0
 
     @property
-    def entities(self) -> Dict[str, Entity]:
-        # View of entities as a dict for compatibility with systems
-        return {e.id: e for e in self.physics.entities}
+    def entities(self) -> Mapping[str, Entity]:
+        # Live id -> entity view of the active registry (no per-access copy)
+        return self.physics.entities.view
 
     def add_entity(self, entity: Entity) -> None:
         self.physics.add_entity(entity)
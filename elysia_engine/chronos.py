@@ -1,11 +1,106 @@
 from __future__ import annotations
-from typing import TYPE_CHECKING, Optional, List, Dict
+import math
+import random
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Optional, List, Dict, Iterable, Sequence
 
+from .math_utils import Vector3
+from .snapshot import WorldSnapshot
 from .systems import System
 
 if TYPE_CHECKING:
     from .world import World
 
+
+@dataclass
+class TimelineMetrics:
+    """Reduced outcome of one perturbed timeline at one horizon."""
+
+    variation: int
+    seed: int
+    horizon: int
+    tick: int
+    entropy: float          # GlobalConsciousness.global_entropy
+    alignment: float        # GlobalConsciousness.alignment_score
+    population: int
+    total_amplitude: float  # Sum of soul amplitudes (mass-energy)
+    total_frequency: float  # Sum of soul frequencies (GlobalConsciousness "energy")
+    kinetic_energy: float   # Sum of 0.5 * m * v^2
+
+
+# Snapshot installed in each worker process by the pool initializer
+_worker_snapshot: Optional[WorldSnapshot] = None
+
+
+def _init_prophecy_worker(blob: bytes) -> None:
+    global _worker_snapshot
+    _worker_snapshot = WorldSnapshot.from_bytes(blob)
+
+
+def _prophecy_worker_task(
+    variation: int, seed: int, horizons: Sequence[int], perturbation: float
+) -> List[TimelineMetrics]:
+    return _run_timeline(_worker_snapshot, variation, seed, horizons, perturbation)
+
+
+def _run_timeline(
+    snapshot: WorldSnapshot,
+    variation: int,
+    seed: int,
+    horizons: Sequence[int],
+    perturbation: float,
+) -> List[TimelineMetrics]:
+    """
+    Restores the snapshot, perturbs it with `seed` and records metrics at
+    each horizon. The module-level `random` (used by Genesis/Void) is seeded
+    too and restored afterwards, so the outcome depends only on the seed.
+    """
+    from .consciousness import GlobalConsciousness
+
+    saved_state = random.getstate()
+    random.seed(seed)
+    try:
+        world = snapshot.restore()
+        start_tick = world.tick
+
+        rng = random.Random(seed)
+        if perturbation > 0:
+            for ent in world.entities.values():
+                if ent.soul is not None and not ent.soul.is_collapsed:
+                    ent.soul.phase += rng.uniform(-1.0, 1.0) * perturbation * math.pi
+                v = ent.physics.velocity
+                ent.physics.velocity = v + Vector3(
+                    rng.uniform(-perturbation, perturbation),
+                    rng.uniform(-perturbation, perturbation),
+                    rng.uniform(-perturbation, perturbation),
+                )
+
+        observer = GlobalConsciousness(physics=None)
+        results = []
+        for horizon in horizons:
+            while world.tick - start_tick < horizon:
+                world.step(dt=1.0)
+            observer.calculate_metrics(world)
+            results.append(TimelineMetrics(
+                variation=variation,
+                seed=seed,
+                horizon=horizon,
+                tick=world.tick,
+                entropy=observer.global_entropy,
+                alignment=observer.alignment_score,
+                population=len(world.entities),
+                total_amplitude=sum(e.soul.amplitude for e in world.entities.values() if e.soul),
+                total_frequency=sum(e.soul.frequency for e in world.entities.values() if e.soul),
+                kinetic_energy=sum(
+                    0.5 * e.physics.mass * e.physics.velocity.magnitude ** 2
+                    for e in world.entities.values()
+                ),
+            ))
+        return results
+    finally:
+        random.setstate(saved_state)
+
 class DreamSystem(System):
     """
     Implements the 'Chronos' capability: Time Transcendence.
@@ -37,8 +132,8 @@ class DreamSystem(System):
         This constitutes 'Reverse Causality' planning:
         We see the result, then we change the present.
         """
-        # 1. Fork Reality (Deep Copy)
-        future_world = world.clone()
+        # 1. Fork Reality (isolated fast copy)
+        future_world = world.fork()
 
         # 2. Fast-Forward Simulation
         # We disable the DreamSystem in the dream to prevent recursive dreaming (Inception)
@@ -65,6 +160,63 @@ class DreamSystem(System):
 
         return future_world
 
+    def prophecy_many(
+        self,
+        world: World,
+        horizons: Iterable[int] = (50,),
+        variations: int = 8,
+        workers: Optional[int] = None,
+        seed: int = 0,
+        perturbation: float = 0.01,
+    ) -> List[TimelineMetrics]:
+        """
+        Many-worlds Prophecy: simulates `variations` perturbed timelines in
+        parallel and reports reduced metrics at every horizon.
+
+        The world is flattened once into a compact WorldSnapshot and shipped
+        to each worker process at start-up; workers return only
+        TimelineMetrics. Timeline k uses seed `seed + k` for both its
+        perturbation (phase jitter of +-perturbation*pi, velocity jitter of
+        +-perturbation) and the global RNG, so results are reproducible and
+        independent of the worker count.
+
+        Args:
+            horizons: Ticks ahead at which to measure (one run to the largest).
+            variations: Number of timelines.
+            workers: Process count (None = CPU count; 0 or 1 = in-process).
+            seed: Base seed.
+            perturbation: Jitter scale; 0 runs identical timelines.
+
+        Returns:
+            Metrics ordered by (variation, horizon).
+        """
+        from .consciousness import GlobalConsciousness
+
+        horizon_list = sorted({int(h) for h in horizons if int(h) >= 0})
+        # No recursive dreaming, no interventions (as in prophecy)
+        systems = [s for s in world.systems if not isinstance(s, (DreamSystem, GlobalConsciousness))]
+        snapshot = WorldSnapshot.capture(world, systems=systems)
+        seeds = [seed + k for k in range(variations)]
+
+        if workers is not None and workers <= 1:
+            timelines = [
+                _run_timeline(snapshot, k, s, horizon_list, perturbation)
+                for k, s in enumerate(seeds)
+            ]
+        else:
+            with ProcessPoolExecutor(
+                max_workers=workers,
+                initializer=_init_prophecy_worker,
+                initargs=(snapshot.to_bytes(),),
+            ) as pool:
+                futures = [
+                    pool.submit(_prophecy_worker_task, k, s, horizon_list, perturbation)
+                    for k, s in enumerate(seeds)
+                ]
+                timelines = [f.result() for f in futures]
+
+        return [m for timeline in timelines for m in timeline]
+
     def analyze_entropy(self, world: World) -> float:
         """
         Helper to measure the chaos of a world state.
@@ -75,7 +227,7 @@ class DreamSystem(System):
 
         for sys in world.systems:
             if isinstance(sys, GlobalConsciousness):
-                # Ensure metrics are up to date
+                # Ensure metrics are up to date (O(1) off World.soul_totals)
                 sys.calculate_metrics(world)
                 return sys.global_entropy
 
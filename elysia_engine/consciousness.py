@@ -1,6 +1,5 @@
 from __future__ import annotations
 from typing import TYPE_CHECKING, Optional
-import math
 
 from .systems import System
 from .math_utils import Vector3
@@ -34,21 +33,9 @@ class GlobalConsciousness(System):
             self.divine_intervention(world, "restore_order")
 
     def calculate_metrics(self, world: World) -> None:
-        total_energy = 0.0
-        phase_vectors = Vector3(0,0,0) # We'll map phase to a unit vector
-        count = 0
-
-        for entity in world.entities.values():
-            if not entity.soul: continue
-
-            count += 1
-            total_energy += entity.soul.frequency
-
-            # Map phase to vector to check alignment
-            # Phase is 0-2pi. Map to x,y on unit circle
-            px = math.cos(entity.soul.phase)
-            py = math.sin(entity.soul.phase)
-            phase_vectors = phase_vectors + Vector3(px, py, 0)
+        # Phases mapped to unit vectors; the sums are shared per tick (World.soul_totals)
+        totals = world.soul_totals()
+        count = totals.count
 
         if count == 0:
             self.global_entropy = 0.0
@@ -56,7 +43,7 @@ class GlobalConsciousness(System):
 
         # Alignment: Magnitude of the average phase vector.
         # If everyone is phase-aligned, mag is 1.0. If random, it's close to 0.
-        avg_phase_vec = phase_vectors * (1.0 / count)
+        avg_phase_vec = Vector3(totals.cos_sum, totals.sin_sum, 0) * (1.0 / count)
         self.alignment_score = avg_phase_vec.magnitude
 
         # Entropy is inverse of alignment (Simple definition)
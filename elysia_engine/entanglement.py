@@ -0,0 +1,147 @@
+"""
+Entanglement Groups
+
+Entangled souls form groups held in a union-find forest (union by size,
+path halving), compared by identity only. Each group root carries the
+shared phase slot and the member list, so
+
+    - `SoulTensor.entangle` is a find on each side plus one union,
+    - an entangled soul reads and writes its phase through the root
+      (`SoulTensor.phase` follows the soul's `entanglement` reference), so
+      stepping one member moves the whole group without touching the others,
+    - `SoulTensor.entangled_group()` lists the members.
+
+A collapsed member keeps the phase it had when it collapsed (the group
+moves on without it) and follows the group again once it melts. Entangling
+sets both souls to the mean of their phases, collapsed or not.
+
+Souls keep their class: array handles (`ArraySoulTensor`) consult the group
+from their own phase accessor and are flagged in their store's `entangled`
+column.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, List, Optional
+
+from .tensor import SoulTensor
+
+if TYPE_CHECKING:
+    from .tensor_array import ArraySoulTensor
+
+
+class EntanglementGroup:
+    """
+    Union-find node. Only a root's `phase` and `members` are meaningful.
+    """
+
+    __slots__ = ("parent", "size", "phase", "members")
+
+    def __init__(self, phase: float, member: SoulTensor):
+        self.parent: Optional[EntanglementGroup] = None
+        self.size = 1
+        self.phase = phase
+        self.members: List[SoulTensor] = [member]
+
+    def __getstate__(self):
+        return (self.parent, self.size, self.phase, self.members)
+
+    def __setstate__(self, state) -> None:
+        self.parent, self.size, self.phase, self.members = state
+
+    def find(self) -> EntanglementGroup:
+        node = self
+        while node.parent is not None:
+            parent = node.parent
+            if parent.parent is not None:
+                node.parent = parent.parent  # Path halving
+            node = parent
+        return node
+
+
+def _group_of(soul: SoulTensor) -> EntanglementGroup:
+    """The soul's root group, enrolling it in a group of its own if needed."""
+    group = soul.entanglement
+    if group is not None:
+        return group.find()
+    group = EntanglementGroup(soul.phase, soul)
+    enroll(soul, group)
+    return group
+
+
+def enroll(soul: SoulTensor, group: EntanglementGroup) -> None:
+    """Points `soul` at `group` (already listing it) without touching phases."""
+    soul.entanglement = group
+    store = getattr(soul, "store", None)
+    if store is not None:
+        store.entangled[soul.row] = True
+
+
+def link(a: SoulTensor, b: SoulTensor) -> bool:
+    """
+    Merges the groups of `a` and `b`; both souls (and the group slot) take
+    the mean of their two phases. Returns False when they were already in
+    one group.
+    """
+    ra, rb = _group_of(a), _group_of(b)
+    if ra is rb:
+        return False
+    if ra.size < rb.size:
+        ra, rb = rb, ra
+    phase = (a.phase + b.phase) / 2
+    rb.parent = ra
+    ra.size += rb.size
+    ra.members.extend(rb.members)
+    rb.members = []
+    ra.phase = phase
+    # A collapsed soul is synchronized too; it just stays locked afterwards
+    a.phase = phase
+    b.phase = phase
+    return True
+
+
+def group_members(soul: SoulTensor) -> List[SoulTensor]:
+    """Members of the soul's group (just the soul when it is not entangled)."""
+    group = soul.entanglement
+    if group is None:
+        return [soul]
+    return list(group.find().members)
+
+
+def replace_member(old: SoulTensor, new: ArraySoulTensor) -> None:
+    """Points `old`'s group slot at `new` (when a soul is moved into an array)."""
+    group = old.entanglement
+    if group is None:
+        return
+    members = group.find().members
+    for i, member in enumerate(members):
+        if member is old:
+            members[i] = new
+            break
+    enroll(new, group)
+
+
+def detach(soul: SoulTensor) -> None:
+    """
+    Drops a soul leaving the world from its group's member list and from
+    its peers' `entangled_peers` (O(group size + peers)). The group keeps
+    its phase slot; the detached soul still reads it but no longer counts
+    as a member.
+    """
+    for peer in soul.entangled_peers:
+        peers = peer.entangled_peers
+        for i, other in enumerate(peers):
+            if other is soul:
+                del peers[i]
+                break
+    group = soul.entanglement
+    if group is None:
+        return
+    root = group.find()
+    members = root.members
+    for i, member in enumerate(members):
+        if member is soul:
+            members[i] = members[-1]
+            members.pop()
+            root.size -= 1
+            break
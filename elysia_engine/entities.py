@@ -4,8 +4,9 @@ from dataclasses import dataclass, field, asdict
 from typing import Any, Dict, Optional, Protocol, TYPE_CHECKING
 
 from .roles import ROLE_PROFILES, RoleProfile
-from .physics import PhysicsState
-from .tensor import SoulTensor
+from .physics import PhysicsState, note_position_write
+from .tensor import SoulTensor, note_axis_write
+from .tracking import TrackedDict, TrackedList
 
 if TYPE_CHECKING:
     from .tensor_coil import CoilStructure
@@ -38,6 +39,18 @@ class Entity:
 
     dimension: int = 0 # 0=Point, 1=Line, 2=Plane
 
+    def __setattr__(self, name: str, value: Any) -> None:
+        # data/bonds are kept change-tracked so entropy caches can skip unchanged entities
+        if name == "data" and type(value) is not TrackedDict:
+            value = TrackedDict(value)
+        elif name == "bonds" and type(value) is not TrackedList:
+            value = TrackedList(value)
+        elif name == "soul":
+            note_axis_write()  # Swapped soul: World.soul_totals must recount
+        elif name == "physics":
+            note_position_write()  # Swapped state: the neighbour grid must re-bucket
+        object.__setattr__(self, name, value)
+
     def update_force_components(self, world: WorldLike) -> None:
         """Subclass hook to fill f_body/f_soul/f_spirit."""
         return None
@@ -94,6 +107,8 @@ class Entity:
 
         # Step physics (Integrate velocity -> position)
         self.physics.step(dt)
+        if world_physics:
+            world_physics.notify_moved(self)
 
     def step(self, world: WorldLike, dt: float = 1.0) -> None:
         self.update_force(world)
@@ -2,11 +2,21 @@ from __future__ import annotations
 
 import math
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Tuple, Any
+from typing import TYPE_CHECKING, Dict, List, Optional, Sequence, Tuple, Any
 
 from elysia_engine.math_utils import Vector4, Rotor
 from elysia_engine.tensor import SoulTensor
 
+if TYPE_CHECKING:
+    from elysia_engine.field_grid import PropagationKernel
+
+GRADIENT_STEP = 0.1   # Finite-difference step for field gradients
+TORQUE_GAIN = 0.01    # Z-field -> torque rotor angle (radians)
+
+# Sparse node eviction (FractalSpatialMap)
+NODE_MAX_AGE = 64          # Ticks without a touch before a node is dropped
+EVICTION_SWEEP_INTERVAL = 16  # Ticks between eviction sweeps
+
 @dataclass
 class FieldNode:
     """
@@ -54,17 +64,65 @@ class SanctuaryZone:
             node.y_field = 7.0
             node.z_field = 0.0
 
+@dataclass
+class LodPolicy:
+    """
+    Distance-based level of detail for field reads.
+    Within `near` of a focus (observer/attractor) entities read depth 0;
+    every doubling of distance beyond that drops one coarser level.
+    With no foci everything reads full resolution.
+    """
+    near: float = 16.0
+    foci: List[Vector4] = field(default_factory=list)
+
+    def depth_for(self, position: Vector4, levels: int) -> int:
+        """Depth to sample at `position` (0 or -1 .. -levels)."""
+        if not self.foci or levels <= 0:
+            return 0
+        dist = min((position - f).magnitude for f in self.foci)
+        if dist <= self.near:
+            return 0
+        return -min(levels, int(math.log2(dist / self.near)) + 1)
+
+
 class FractalSpatialMap:
     """
     A Sparse Hashing implementation of a Fractal Grid.
     Instead of a full Octree, we hash (depth, x, y, z, w).
     This allows O(1) access to any fractal layer.
+
+    Nodes are evicted generationally: every touch files the node under the
+    tick it happened on, and every EVICTION_SWEEP_INTERVAL ticks the
+    generations older than `max_age` are dropped (skipping nodes touched
+    again since). Tick-aware reads treat such nodes as void already, so
+    eviction is invisible to them. `max_nodes` adds an LRU cap that evicts
+    whole generations, oldest first, but never the current tick's nodes.
+
+    Depth 0 is the painted level. Negative depths are coarser (cell size
+    doubles per level) and hold aggregates built by `aggregate`.
     """
-    def __init__(self, resolution_scale: float = 1.0):
+    def __init__(self, resolution_scale: float = 1.0, max_age: Optional[int] = NODE_MAX_AGE, max_nodes: Optional[int] = None):
+        """
+        Args:
+            resolution_scale: Base cell size.
+            max_age: Ticks a node may go untouched before eviction (None = never).
+            max_nodes: Soft cap on live nodes (None = unbounded).
+        """
         self.nodes: Dict[Tuple[int, int, int, int, int], FieldNode] = {}
         self.resolution_scale = resolution_scale # Base unit size
         self.sanctuary = SanctuaryZone()
 
+        self.max_age = max_age
+        self.max_nodes = max_nodes
+        self.evicted_count: int = 0
+        # tick -> nodes touched on that tick (a node may sit in several)
+        self._generations: Dict[int, List[FieldNode]] = {}
+        self._evicted_since_compact: int = 0
+
+    @property
+    def live_count(self) -> int:
+        return len(self.nodes)
+
     def _hash_coord(self, position: Vector4, depth: int) -> Tuple[int, int, int, int, int]:
         """
         Converts a continuous position to a grid key at a specific depth.
@@ -98,10 +156,110 @@ class FractalSpatialMap:
             self.sanctuary.apply_protection(position, node)
 
             self.nodes[key] = node
+            self._file(node, node.last_update)
             return node
 
         return None
 
+    def aggregate(self, touched: List[FieldNode], levels: int, tick: int) -> None:
+        """
+        Rebuilds the coarse levels above the depth-0 nodes painted this tick.
+        A parent holds the mean of its children touched on `tick`; only
+        parents of touched nodes are visited.
+        """
+        nodes = self.nodes
+        children = touched
+        for depth in range(-1, -levels - 1, -1):
+            sums: Dict[Tuple[int, int, int, int, int], List[float]] = {}
+            for child in children:
+                c = child.coord
+                key = (depth, c[0] >> 1, c[1] >> 1, c[2] >> 1, c[3] >> 1)
+                acc = sums.get(key)
+                if acc is None:
+                    sums[key] = [child.w_field, child.x_field, child.y_field, child.z_field, 1]
+                else:
+                    acc[0] += child.w_field
+                    acc[1] += child.x_field
+                    acc[2] += child.y_field
+                    acc[3] += child.z_field
+                    acc[4] += 1
+
+            parents = []
+            for key, (w, x, y, z, n) in sums.items():
+                node = nodes.get(key)
+                if node is None:
+                    node = nodes[key] = FieldNode(coord=key[1:], depth=depth, is_leaf=False)
+                node.w_field = w / n
+                node.x_field = x / n
+                node.y_field = y / n
+                node.z_field = z / n
+                self.touch(node, tick)
+                parents.append(node)
+            children = parents
+
+    # --- Eviction ---
+
+    def touch(self, node: FieldNode, tick: int) -> None:
+        """Marks node as updated on `tick` (keeps it alive for max_age ticks)."""
+        node.last_update = tick
+        self._file(node, tick)
+
+    def _file(self, node: FieldNode, tick: int) -> None:
+        if self.max_age is None and self.max_nodes is None:
+            return  # Eviction disabled: nothing will ever read the generations
+        bucket = self._generations.get(tick)
+        if bucket is None:
+            bucket = self._generations[tick] = []
+        bucket.append(node)
+
+    def collect(self, tick: int) -> None:
+        """
+        Amortized eviction pass; FieldSystem calls it once per field tick.
+        Sweeps expired generations every EVICTION_SWEEP_INTERVAL ticks and
+        enforces max_nodes whenever it is exceeded. The sweep also drops the
+        stale entries of nodes re-filed under a newer generation, so the
+        generations hold about one entry per live node.
+        """
+        if tick % EVICTION_SWEEP_INTERVAL == 0:
+            if self.max_age is not None:
+                cutoff = tick - self.max_age
+                for generation in [g for g in self._generations if g <= cutoff]:
+                    self._evict_generation(generation)
+            self._drop_stale_entries()
+
+        if self.max_nodes is not None and len(self.nodes) > self.max_nodes:
+            for generation in sorted(self._generations):
+                if generation >= tick or len(self.nodes) <= self.max_nodes:
+                    break
+                self._evict_generation(generation)
+
+        # dicts never shrink on delete; rebuild once most of the table is holes
+        if self._evicted_since_compact > max(len(self.nodes), 1024):
+            self.nodes = dict(self.nodes)
+            self._evicted_since_compact = 0
+
+    def _drop_stale_entries(self) -> None:
+        generations = self._generations
+        for generation, bucket in list(generations.items()):
+            current = [node for node in bucket if node.last_update == generation]
+            if current:
+                generations[generation] = current
+            else:
+                del generations[generation]
+
+    def _evict_generation(self, generation: int) -> None:
+        nodes = self.nodes
+        evicted = 0
+        for node in self._generations.pop(generation):
+            if node.last_update > generation:
+                continue  # Touched again since; filed under a newer generation
+            key = (node.depth,) + node.coord
+            if nodes.get(key) is node:
+                del nodes[key]
+                evicted += 1
+        self.evicted_count += evicted
+        self._evicted_since_compact += evicted
+
     def sample_field(self, position: Vector4, depth: int = 0, current_tick: int = -1) -> Tuple[float, float, float, float]:
         """
         Samples the field values at a position.
@@ -136,9 +294,45 @@ class FieldSystem:
 
     Replaces the "Particle Interaction" loop.
     """
-    def __init__(self):
-        self.spatial_map = FractalSpatialMap()
+    def __init__(
+        self,
+        bounds: Optional[Tuple[Vector4, Vector4]] = None,
+        resolution_scale: float = 1.0,
+        max_age: Optional[int] = NODE_MAX_AGE,
+        max_nodes: Optional[int] = None,
+        lod_levels: int = 0,
+        propagation: Optional[PropagationKernel] = None,
+    ):
+        """
+        Args:
+            bounds: (lo, hi) corners of a bounded world. When given, the field
+                is kept in a dense NumPy grid over that box (see field_grid)
+                instead of the sparse node dict. Requires numpy.
+            resolution_scale: Depth-0 cell size.
+            max_age / max_nodes: Sparse node eviction (see FractalSpatialMap).
+            lod_levels: Coarse levels aggregated above depth 0 each tick
+                (sparse map only). Reads pick a level through `self.lod`,
+                a default LodPolicy whose foci PhysicsWorld fills in from
+                its attractors and observers.
+            propagation: Kernel the W/Y channels are convolved with each
+                tick (dense grid only; see field_grid.PropagationKernel).
+        """
+        if bounds is not None and lod_levels:
+            raise ValueError("lod_levels requires the sparse field (no bounds)")
+        if bounds is None and propagation is not None:
+            raise ValueError("propagation requires the dense field (pass bounds)")
+        if bounds is not None:
+            from .field_grid import DenseFieldGrid
+            self.spatial_map = DenseFieldGrid(bounds[0], bounds[1], resolution_scale, propagation)
+        else:
+            self.spatial_map = FractalSpatialMap(resolution_scale, max_age, max_nodes)
         self.time_tick: int = 0
+        self.lod_levels = lod_levels
+        self.lod: Optional[LodPolicy] = LodPolicy() if lod_levels else None
+
+    @property
+    def is_dense(self) -> bool:
+        return not isinstance(self.spatial_map, FractalSpatialMap)
 
     def update_field(self, active_entities_pos: List[Tuple[Vector4, SoulTensor]]) -> None:
         """
@@ -149,6 +343,12 @@ class FieldSystem:
         """
         self.time_tick += 1
 
+        if self.is_dense:
+            # Same rules, one vectorized pass (DenseFieldGrid.paint)
+            self.spatial_map.paint(active_entities_pos, self.time_tick)
+            self.spatial_map.propagate(self.time_tick)
+            return
+
         # 1. Decay/Reset Field (optional, or just cumulative?)
         # For a dynamic wave simulation, values should propagate or decay.
         # Simple approach: Reset and Re-accumulate (Static Field from Sources)
@@ -156,6 +356,7 @@ class FieldSystem:
 
         # Given "1060 3GB" constraints, full diffusion is expensive.
         # We stick to "Local Influence Mapping".
+        # (Bounded worlds can diffuse via FFT instead: DenseFieldGrid propagation.)
         # We assume the field is mostly static (Void) unless excited by an entity.
 
         # Reset is too expensive (iterating all nodes).
@@ -166,6 +367,7 @@ class FieldSystem:
         # Field values are ephemeral or persistent?
         # The prompt says: "Space itself blooms".
 
+        touched: List[FieldNode] = []
         for pos, soul in active_entities_pos:
             # Map entity to a node
             node = self.spatial_map.get_node(pos, depth=0)
@@ -188,7 +390,8 @@ class FieldSystem:
                      node.y_field = 0.0
                      node.z_field = 0.0
 
-                node.last_update = self.time_tick
+                self.spatial_map.touch(node, self.time_tick)
+                touched.append(node)
 
             # Update Node values based on Soul
             # W-Field (Scale) <- Amplitude (Mass)
@@ -208,15 +411,32 @@ class FieldSystem:
             # Z-Field (Torque) <- Spin * Polarity
             node.z_field += soul.spin * soul.polarity * 0.1
 
-    def get_local_forces(self, position: Vector4, soul: SoulTensor) -> Tuple[Vector4, Rotor]:
+        if self.lod_levels:
+            self.spatial_map.aggregate(touched, self.lod_levels, self.time_tick)
+        self.spatial_map.collect(self.time_tick)
+
+    def depth_for(self, position: Vector4) -> int:
+        """Sampling depth for `position` under the LOD policy (0 without one)."""
+        if self.lod is None or not self.lod_levels:
+            return 0
+        return self.lod.depth_for(position, self.lod_levels)
+
+    def get_local_forces(self, position: Vector4, soul: SoulTensor, depth: Optional[int] = None) -> Tuple[Vector4, Rotor]:
         """
         The Main Loop Step 2: Entity reads Field.
         Calculates the Force Vector and Rotation Rotor acting on an entity.
+
+        Args:
+            depth: Level to read (default: chosen by the LOD policy). The
+                gradient step scales with that level's cell size.
         """
+        if depth is None:
+            depth = self.depth_for(position)
+        tick = self.time_tick
         # Sample local gradient
-        step = 0.1
+        step = GRADIENT_STEP * 2.0 ** -depth
         # Pass current_tick to ensure we don't read stale ghost trails
-        center = self.spatial_map.sample_field(position, current_tick=self.time_tick)
+        center = self.spatial_map.sample_field(position, depth, current_tick=tick)
 
         # Gradient of Y-Field (Frequency/Potential) drives "Geodesic Flow"
         # High Frequency (Joy) is an attractor? Or Low Potential?
@@ -227,11 +447,11 @@ class FieldSystem:
         # We treat Y-Field as V.
 
         val_c = center[2] # Y
-        val_x = self.spatial_map.sample_field(position + Vector4(0, step, 0, 0), current_tick=self.time_tick)[2]
-        val_y = self.spatial_map.sample_field(position + Vector4(0, 0, step, 0), current_tick=self.time_tick)[2]
-        val_z = self.spatial_map.sample_field(position + Vector4(0, 0, 0, step), current_tick=self.time_tick)[2]
+        val_x = self.spatial_map.sample_field(position + Vector4(0, step, 0, 0), depth, current_tick=tick)[2]
+        val_y = self.spatial_map.sample_field(position + Vector4(0, 0, step, 0), depth, current_tick=tick)[2]
+        val_z = self.spatial_map.sample_field(position + Vector4(0, 0, 0, step), depth, current_tick=tick)[2]
         # W gradient? Usually we don't move in W unless scaling.
-        val_w = self.spatial_map.sample_field(position + Vector4(step, 0, 0, 0), current_tick=self.time_tick)[2]
+        val_w = self.spatial_map.sample_field(position + Vector4(step, 0, 0, 0), depth, current_tick=tick)[2]
 
         grad = Vector4(
             (val_w - val_c)/step,
@@ -262,6 +482,68 @@ class FieldSystem:
         # Torque magnitude = center[3] (Z-field)
         # We apply a spin to the entity's orientation.
 
-        torque_rotor = Rotor.from_plane_angle('xy', center[3] * 0.01) # Small step rotation
+        torque_rotor = Rotor.from_plane_angle('xy', center[3] * TORQUE_GAIN) # Small step rotation
 
         return force, torque_rotor
+
+    def get_local_forces_batch(
+        self,
+        positions: Sequence[Tuple[float, float, float, float]],
+        souls: Sequence[SoulTensor],
+    ) -> Tuple[List[Tuple[float, float, float, float]], List[float]]:
+        """
+        get_local_forces for many entities in one pass over the field.
+
+        Args:
+            positions: (W, X, Y, Z) per entity.
+            souls: Matching souls (only the frequency is read).
+            Each entity reads the level chosen by the LOD policy.
+
+        Returns:
+            (forces, torque_angles): forces[i] is the (W, X, Y, Z) force on
+            entity i; its torque rotor is Rotor.from_plane_angle('xy', torque_angles[i]).
+        """
+        if self.is_dense:
+            return self.spatial_map.local_forces(positions, souls, self.time_tick, GRADIENT_STEP, TORQUE_GAIN)
+
+        tick = self.time_tick
+        smap = self.spatial_map
+        nodes = smap.nodes
+        radius = smap.sanctuary.radius
+        floor = math.floor
+        sqrt = math.sqrt
+        lod = self.lod if self.lod_levels else None
+        # Per-level cell size and gradient step (depth 0 .. -lod_levels)
+        cells = {d: smap.resolution_scale * (0.5 ** d) for d in range(-self.lod_levels, 1)}
+        steps = {d: GRADIENT_STEP * 2.0 ** -d for d in cells}
+
+        def sample_y(d: int, cell: float, w: float, x: float, y: float, z: float) -> float:
+            # Inlined sample_field(..., depth=d, current_tick=tick)[2]
+            node = nodes.get((d, int(floor(x / cell)), int(floor(y / cell)), int(floor(z / cell)), int(floor(w / cell))))
+            if node is not None and node.last_update >= tick:
+                return node.y_field
+            return 7.0 if sqrt(w**2 + x**2 + y**2 + z**2) < radius else 0.0
+
+        forces: List[Tuple[float, float, float, float]] = []
+        angles: List[float] = []
+        d = 0
+        for (w, x, y, z), soul in zip(positions, souls):
+            if lod is not None:
+                d = lod.depth_for(Vector4(w, x, y, z), self.lod_levels)
+            cell, step = cells[d], steps[d]
+            node = nodes.get((d, int(floor(x / cell)), int(floor(y / cell)), int(floor(z / cell)), int(floor(w / cell))))
+            if node is not None and node.last_update >= tick:
+                val_c, torque = node.y_field, node.z_field
+            else:
+                val_c = 7.0 if sqrt(w**2 + x**2 + y**2 + z**2) < radius else 0.0
+                torque = 0.0
+            # -(Y_field - Y_soul) * Grad(Y_field)
+            k = -1.0 * (val_c - soul.frequency)
+            forces.append((
+                (sample_y(d, cell, w + step, x, y, z) - val_c) / step * k,
+                (sample_y(d, cell, w, x + step, y, z) - val_c) / step * k,
+                (sample_y(d, cell, w, x, y + step, z) - val_c) / step * k,
+                (sample_y(d, cell, w, x, y, z + step) - val_c) / step * k,
+            ))
+            angles.append(torque * TORQUE_GAIN)
+        return forces, angles
@@ -0,0 +1,334 @@
+"""
+Dense Field Grid
+
+Alternative backend for `FieldSystem` in bounded worlds. Instead of a dict
+of `FieldNode`s, the W/X/Y/Z channels and the last-update tick of every
+depth-0 cell live in flat NumPy arrays covering a fixed 4D box.
+
+`paint` applies one tick of sources at once: the reset-on-first-touch rule
+becomes a vectorized reset of every touched cell (baseline chosen by the
+first source in that cell, as in the sparse loop), W/X/Z contributions are
+a single scatter-add each, and the sequential Y blend is evaluated in
+closed form per cell.
+
+Sources outside the box are not painted and samples outside it read the
+ambient (void/sanctuary) values. Only depth 0 is stored.
+
+Propagation mode (`propagation` set to a `PropagationKernel`): after each
+paint the W/Y excess of the painted cells over their baseline is convolved
+with a radial X/Y/Z kernel through the FFT (each W slice separately), so
+every source reaches every cell within the kernel radius in O(G log G)
+for G cells. The whole box is then
+fresh; X/Z stay local to painted cells. Baselines are chosen by cell centre
+(sanctuary or void). The convolution is zero-padded, not periodic.
+
+Requires numpy (imported only when the backend is selected).
+"""
+
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass
+from functools import partial
+from typing import Any, Callable, List, Optional, Sequence, Tuple
+
+from .math_utils import Vector4
+from .tensor import SoulTensor
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - exercised only without numpy
+    np = None
+
+# Same coefficients as the sparse FieldSystem.update_field
+W_GAIN = 0.01
+X_GAIN = 0.01
+Y_BLEND = 0.1
+Z_GAIN = 0.1
+SANCTUARY_BASELINE = (1.0, 1.0, 7.0, 0.0)
+VOID_BASELINE = (1.0, 0.0, 0.0, 0.0)
+
+
+@dataclass
+class PropagationKernel:
+    """
+    Radial kernel the W/Y channels are convolved with in propagation mode.
+
+    Args:
+        profile: Weight as a function of distance (world units), applied to
+            an ndarray. Must be picklable (module-level function or partial)
+            so the grid survives snapshots and process pools.
+        radius: Support radius (world units); weights beyond it are dropped.
+        normalize: Scale weights to sum 1, so the painted total is conserved
+            (diffusion). Otherwise the profile is used as given.
+    """
+    profile: Callable[[Any], Any]
+    radius: float
+    normalize: bool = True
+
+
+def _gaussian(distance, sigma: float):
+    return np.exp(-0.5 * (distance / sigma) ** 2)
+
+
+def _inverse_square(distance, softening: float):
+    return 1.0 / (1.0 + (distance / softening) ** 2)
+
+
+def gaussian_kernel(sigma: float, radius: Optional[float] = None) -> PropagationKernel:
+    """Diffusion: normalized Gaussian of width `sigma` (support 3 sigma by default)."""
+    return PropagationKernel(partial(_gaussian, sigma=sigma), 3.0 * sigma if radius is None else radius)
+
+
+def inverse_square_kernel(softening: float = 1.0, radius: float = 8.0) -> PropagationKernel:
+    """Long-range propagation: 1 / (1 + (d/softening)^2), unit weight at the source."""
+    return PropagationKernel(partial(_inverse_square, softening=softening), radius, normalize=False)
+
+
+class DenseFieldGrid:
+    """
+    Drop-in replacement for FractalSpatialMap over the box [lo, hi).
+
+    Args:
+        lo / hi: Corners of the box (W, X, Y, Z).
+        resolution_scale: Cell size (same meaning as FractalSpatialMap).
+        propagation: Kernel for propagation mode (None = per-source painting).
+    """
+
+    def __init__(
+        self,
+        lo: Vector4,
+        hi: Vector4,
+        resolution_scale: float = 1.0,
+        propagation: Optional[PropagationKernel] = None,
+    ):
+        if np is None:
+            raise ImportError("DenseFieldGrid requires numpy (pip install numpy)")
+        from .field import SanctuaryZone
+
+        if resolution_scale <= 0:
+            raise ValueError("resolution_scale must be positive")
+        self.resolution_scale = resolution_scale
+        self.sanctuary = SanctuaryZone()
+        self.origin = np.array([lo.w, lo.x, lo.y, lo.z], dtype=np.float64)
+        self._origin = (lo.w, lo.x, lo.y, lo.z)  # scalar path avoids numpy indexing
+        extent = np.array([hi.w, hi.x, hi.y, hi.z], dtype=np.float64) - self.origin
+        self.shape: Tuple[int, ...] = tuple(max(1, int(math.ceil(e / resolution_scale))) for e in extent)
+
+        size = int(np.prod(self.shape))
+        self.w = np.ones(size, dtype=np.float64)
+        self.x = np.zeros(size, dtype=np.float64)
+        self.y = np.zeros(size, dtype=np.float64)
+        self.z = np.zeros(size, dtype=np.float64)
+        # 0 = never painted (FieldNode ticks start at 1)
+        self.last_update = np.zeros(size, dtype=np.int64)
+
+        self._spectrum = None
+        self._padded: Tuple[int, ...] = ()
+        self._base_x = self._base_y = None
+        self.propagation = propagation
+
+    @property
+    def size(self) -> int:
+        return len(self.last_update)
+
+    @property
+    def propagation(self) -> Optional[PropagationKernel]:
+        return self._propagation
+
+    @propagation.setter
+    def propagation(self, kernel: Optional[PropagationKernel]) -> None:
+        """Toggles propagation mode; the kernel spectrum is built once here."""
+        self._propagation = kernel
+        if kernel is None:
+            self._spectrum = self._base_x = self._base_y = None
+            return
+        if kernel.radius < 0:
+            raise ValueError("kernel radius must be non-negative")
+
+        scale = self.resolution_scale
+        # Spatial kernel over X/Y/Z; W slices (scales) do not mix
+        reach = int(kernel.radius / scale)
+        offsets = np.meshgrid(*[np.arange(-reach, reach + 1) * scale] * 3, indexing="ij")
+        distance = np.sqrt(sum(o * o for o in offsets))
+        weights = np.where(distance <= kernel.radius, kernel.profile(distance), 0.0)
+        if kernel.normalize:
+            weights = weights / weights.sum()
+        # n + reach per axis is enough padding for a wrap-free linear convolution
+        self._padded = tuple(n + reach for n in self.shape[1:])
+        full = np.zeros(self._padded, dtype=np.float64)
+        wrapped = np.arange(-reach, reach + 1)
+        full[np.ix_(*[wrapped % p for p in self._padded])] = weights
+        self._spectrum = np.fft.rfftn(full)
+
+        centres = np.meshgrid(
+            *[self.origin[axis] + (np.arange(n) + 0.5) * scale for axis, n in enumerate(self.shape)],
+            indexing="ij",
+        )
+        in_sanctuary = (np.sqrt(sum(c * c for c in centres)) < self.sanctuary.radius).ravel()
+        self._base_x = np.where(in_sanctuary, SANCTUARY_BASELINE[1], VOID_BASELINE[1])
+        self._base_y = np.where(in_sanctuary, SANCTUARY_BASELINE[2], VOID_BASELINE[2])
+
+    # --- Indexing ---
+
+    def cells_of(self, positions: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Flat cell index for an (N, 4) array of W/X/Y/Z positions.
+        Returns (indices, in_bounds); indices of out-of-bounds rows are 0.
+        """
+        with np.errstate(invalid="ignore", over="ignore"):
+            scaled = np.floor((positions - self.origin) / self.resolution_scale)
+        shape = np.array(self.shape)
+        in_bounds = np.all((scaled >= 0) & (scaled < shape), axis=1)
+        cells = np.where(in_bounds[:, None], scaled, 0).astype(np.int64)
+        return np.ravel_multi_index(cells.T, self.shape), in_bounds
+
+    def _cell_of(self, position: Vector4) -> Optional[int]:
+        idx = 0
+        scale = self.resolution_scale
+        for axis, value in enumerate((position.w, position.x, position.y, position.z)):
+            try:
+                c = math.floor((value - self._origin[axis]) / scale)
+            except (OverflowError, ValueError):
+                return None
+            n = self.shape[axis]
+            if c < 0 or c >= n:
+                return None
+            idx = idx * n + c
+        return idx
+
+    # --- Painting ---
+
+    def paint(self, sources: Sequence[Tuple[Vector4, SoulTensor]], tick: int) -> None:
+        """One tick of `FieldSystem.update_field` for (position, soul) sources."""
+        if not sources:
+            return
+        positions = np.array([(p.w, p.x, p.y, p.z) for p, _ in sources], dtype=np.float64)
+        axes = np.array([(s.amplitude, s.frequency, s.spin * s.polarity) for _, s in sources], dtype=np.float64)
+        amplitude, frequency, torque = axes.T
+        self.paint_arrays(positions, amplitude, frequency, torque, tick)
+
+    def paint_arrays(
+        self,
+        positions: np.ndarray,
+        amplitude: np.ndarray,
+        frequency: np.ndarray,
+        torque: np.ndarray,
+        tick: int,
+    ) -> None:
+        """
+        Array form of `paint`. `torque` is spin * polarity per source.
+        Sources are applied in row order (this matters for the Y blend).
+        """
+        flat, in_bounds = self.cells_of(positions)
+        if not in_bounds.all():
+            flat = flat[in_bounds]
+            positions = positions[in_bounds]
+            amplitude = amplitude[in_bounds]
+            frequency = frequency[in_bounds]
+            torque = torque[in_bounds]
+        if len(flat) == 0:
+            return
+
+        cells, first, group = np.unique(flat, return_index=True, return_inverse=True)
+        counts = np.bincount(group, minlength=len(cells))
+
+        # Reset on first touch: the first source in a cell picks the baseline
+        in_sanctuary = np.sqrt(np.einsum("ij,ij->i", positions[first], positions[first])) < self.sanctuary.radius
+        base_x = np.where(in_sanctuary, SANCTUARY_BASELINE[1], VOID_BASELINE[1])
+        base_y = np.where(in_sanctuary, SANCTUARY_BASELINE[2], VOID_BASELINE[2])
+
+        self.w[cells] = VOID_BASELINE[0] + np.bincount(group, amplitude * W_GAIN, len(cells))
+        self.x[cells] = base_x + np.bincount(group, np.abs(frequency) * X_GAIN, len(cells))
+        self.z[cells] = VOID_BASELINE[3] + np.bincount(group, torque * Z_GAIN, len(cells))
+
+        # y <- y * (1 - r) + f * r, applied k times in source order, in closed form:
+        # y_k = y_0 (1-r)^k + r * sum_i f_i (1-r)^(k-1-rank_i)
+        keep = 1.0 - Y_BLEND
+        order = np.argsort(group, kind="stable")
+        rank = np.empty(len(group), dtype=np.int64)
+        rank[order] = np.arange(len(group)) - np.repeat(np.cumsum(counts) - counts, counts)
+        weight = keep ** (counts[group] - 1 - rank)
+        self.y[cells] = base_y * keep ** counts + Y_BLEND * np.bincount(group, frequency * weight, len(cells))
+
+        self.last_update[cells] = tick
+
+    # --- Propagation ---
+
+    def propagate(self, tick: int) -> None:
+        """
+        Spreads the W/Y excess painted on `tick` through the kernel and
+        marks every cell fresh. No-op unless propagation mode is on.
+        The FFT only adds round-off: each cell is within 1e-12 times the
+        channel's summed absolute excess of the direct convolution.
+        """
+        if self._spectrum is None:
+            return
+        painted = self.last_update == tick
+        excess = np.stack((
+            np.where(painted, self.w - VOID_BASELINE[0], 0.0),
+            np.where(painted, self.y - self._base_y, 0.0),
+        )).reshape((2,) + self.shape)
+        axes = (2, 3, 4)
+        spread = np.fft.irfftn(np.fft.rfftn(excess, self._padded, axes) * self._spectrum, self._padded, axes)
+        spread = spread[(slice(None), slice(None)) + tuple(slice(0, n) for n in self.shape[1:])].reshape(2, -1)
+
+        self.w = VOID_BASELINE[0] + spread[0]
+        self.y = self._base_y + spread[1]
+        self.x = np.where(painted, self.x, self._base_x)
+        self.z = np.where(painted, self.z, VOID_BASELINE[3])
+        self.last_update[:] = tick
+
+    # --- Sampling ---
+
+    def sample_field(self, position: Vector4, depth: int = 0, current_tick: int = -1) -> Tuple[float, float, float, float]:
+        """Same contract as FractalSpatialMap.sample_field (depth 0 only)."""
+        if depth != 0:
+            raise ValueError("DenseFieldGrid only stores depth 0")
+        idx = self._cell_of(position)
+        if idx is not None:
+            updated = self.last_update[idx]
+            if updated > 0 and (current_tick < 0 or updated >= current_tick):
+                return (float(self.w[idx]), float(self.x[idx]), float(self.y[idx]), float(self.z[idx]))
+
+        if position.magnitude < self.sanctuary.radius:
+            return SANCTUARY_BASELINE
+        return VOID_BASELINE
+
+    def sample_arrays(self, positions: np.ndarray, current_tick: int = -1) -> np.ndarray:
+        """sample_field for an (N, 4) array of positions; returns (N, 4) W/X/Y/Z."""
+        flat, in_bounds = self.cells_of(positions)
+        updated = self.last_update[flat]
+        fresh = in_bounds & (updated > 0)
+        if current_tick >= 0:
+            fresh &= updated >= current_tick
+
+        in_sanctuary = np.sqrt(np.einsum("ij,ij->i", positions, positions)) < self.sanctuary.radius
+        out = np.where(in_sanctuary[:, None], SANCTUARY_BASELINE, VOID_BASELINE)
+        idx = flat[fresh]
+        out[fresh] = np.column_stack((self.w[idx], self.x[idx], self.y[idx], self.z[idx]))
+        return out
+
+    def local_forces(
+        self,
+        positions: Sequence[Tuple[float, float, float, float]],
+        souls: Sequence[SoulTensor],
+        current_tick: int,
+        step: float,
+        torque_gain: float,
+    ) -> Tuple[List[Tuple[float, float, float, float]], List[float]]:
+        """Vectorized FieldSystem.get_local_forces_batch (same return shape)."""
+        if len(positions) == 0:
+            return [], []
+        pos = np.asarray(positions, dtype=np.float64).reshape(-1, 4)
+        frequency = np.fromiter((s.frequency for s in souls), dtype=np.float64, count=len(pos))
+
+        center = self.sample_arrays(pos, current_tick)
+        val_c = center[:, 2]
+        grad = np.empty_like(pos)
+        for axis in range(4):
+            shifted = pos.copy()
+            shifted[:, axis] += step
+            grad[:, axis] = (self.sample_arrays(shifted, current_tick)[:, 2] - val_c) / step
+        forces = grad * (-1.0 * (val_c - frequency))[:, None]
+        return list(map(tuple, forces.tolist())), (center[:, 3] * torque_gain).tolist()
@@ -320,12 +320,8 @@ class HypersphereMemory:
         Resonance Query: Find memories that are spatially near AND harmonically resonant.
         """
         candidates = self.query(coord, radius)
-        results = []
-        for pat in candidates:
-            res_data = soul_tensor.resonate(pat.soul_tensor)
-            if res_data["resonance"] >= resonance_threshold:
-                results.append(pat)
-        return results
+        resonances = soul_tensor.resonance_values([pat.soul_tensor for pat in candidates])
+        return [pat for pat, resonance in zip(candidates, resonances) if resonance >= resonance_threshold]
 
     def zoom_query(
         self,
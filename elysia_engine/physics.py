@@ -1,16 +1,29 @@
 from __future__ import annotations
 
+from collections import deque
 from dataclasses import dataclass, field
-from typing import List, Optional, TYPE_CHECKING, Tuple
+from typing import Any, Callable, Deque, Dict, Iterable, Iterator, List, Optional, Sequence, TYPE_CHECKING, Tuple
 import math
 import random
 
 from .math_utils import Vector3, Vector4, Quaternion, Rotor
 from .tensor import SoulTensor
 from .field import FieldSystem
+from .spatial import SpatialHashGrid
+from .tracking import TrackedList, version_of
+from .profiling import (
+    DIMENSIONAL_BINDING,
+    FIELD_BLOOM,
+    GEODESIC_FLOW,
+    NEIGHBOR_INDEX,
+    SEDIMENT,
+    TickProfiler,
+    clock,
+)
 
 if TYPE_CHECKING:
     from .entities import Entity
+    from .physics_store import PhysicsArrayStore
 
 # --- Atmospheric Governance Constants ---
 GOLDEN_RATIO = (1 + 5 ** 0.5) / 2
@@ -23,17 +36,70 @@ DATA_ENTROPY_SCALE = 0.01         # 100 chars = 1.0 Entropy
 BOND_ENTROPY_SCALE = 1.0          # Each bond = 1.0 Entropy
 RESONANCE_PENALTY_SCALE = 10.0    # 1.0 Hz deviation = 10.0 Entropy
 
+# Dimensional Binding
+BINDING_RADIUS = 2.0              # Max distance for bonding (also the neighbour grid cell size)
+ENTANGLEMENT_RADIUS = 0.5         # Max distance for quantum entanglement
+
+class _BoundaryCells:
+    """
+    Samples of a HolographicBoundary bucketed into cubic cells. Each cell
+    keeps its members (with their list index) plus the aggregates the far
+    field needs: centroid, member count, potential sum and the radius of
+    the sphere around the centroid enclosing every member.
+    """
+
+    def __init__(self, samples: List[Tuple[Vector3, float]], cell_size: Optional[float]):
+        self.count = len(samples)
+        if cell_size is None:
+            # ~sqrt(n) occupied cells on a surface: balances far cells vs near members
+            lo = Vector3(*(min(getattr(p, a) for p, _ in samples) for a in "xyz"))
+            hi = Vector3(*(max(getattr(p, a) for p, _ in samples) for a in "xyz"))
+            extent = max(hi.x - lo.x, hi.y - lo.y, hi.z - lo.z)
+            cell_size = extent / max(1.0, self.count ** 0.25) or 1.0
+        grid: SpatialHashGrid = SpatialHashGrid(cell_size, lambda sample: sample[0])
+
+        members: dict = {}
+        for i, (pos, potential) in enumerate(samples):
+            members.setdefault(grid.cell_of(pos), []).append((i, pos, potential))
+
+        # (members, cx, cy, cz, count, potential_sum, reach)
+        self.cells: List[Tuple[list, float, float, float, int, float, float]] = []
+        for bucket in members.values():
+            n = len(bucket)
+            cx = sum(pos.x for _, pos, _ in bucket) / n
+            cy = sum(pos.y for _, pos, _ in bucket) / n
+            cz = sum(pos.z for _, pos, _ in bucket) / n
+            reach = max(math.sqrt((pos.x - cx) ** 2 + (pos.y - cy) ** 2 + (pos.z - cz) ** 2) for _, pos, _ in bucket)
+            self.cells.append((bucket, cx, cy, cz, n, sum(p for _, _, p in bucket), reach))
+
+
 @dataclass
 class HolographicBoundary:
     """
     Boundary-only sampler (Holographic Principle).
     Stores potential values on a surface and interpolates for interior points.
+
+    With `accuracy` > 0 queries go through a cell index built on first use:
+    a cell whose members all lie within `accuracy * distance` of its
+    centroid is weighted as one point (count and potential sum at the
+    centroid); nearer cells are summed sample by sample. The relative
+    weight error per far sample is below `accuracy`. 0 keeps exact IDW over
+    every sample. Call `rebuild_index` after editing `samples` in place.
     """
     samples: List[Tuple[Vector3, float]] = field(default_factory=list)
     thickness: float = 0.1
+    accuracy: float = 0.0
+    cell_size: Optional[float] = None  # Index cell edge (None = sized from the samples)
+    _cells: Optional[_BoundaryCells] = field(default=None, init=False, repr=False, compare=False)
 
     @staticmethod
-    def spherical_shell(radius: float = 10.0, resolution: int = 6, center: Optional[Vector3] = None, base_potential: float = -1.0) -> 'HolographicBoundary':
+    def spherical_shell(
+        radius: float = 10.0,
+        resolution: int = 6,
+        center: Optional[Vector3] = None,
+        base_potential: float = -1.0,
+        accuracy: float = 0.0,
+    ) -> 'HolographicBoundary':
         """
         Builds a simple spherical shell by sampling longitude/latitude rings.
         """
@@ -50,7 +116,11 @@ class HolographicBoundary:
                 y = radius * math.cos(theta) + center.y
                 z = radius * math.sin(theta) * math.sin(phi) + center.z
                 samples.append((Vector3(x, y, z), base_potential))
-        return HolographicBoundary(samples=samples, thickness=0.25)
+        return HolographicBoundary(samples=samples, thickness=0.25, accuracy=accuracy)
+
+    def rebuild_index(self) -> None:
+        """Drops the cell index; the next approximate query rebuilds it."""
+        self._cells = None
 
     def sample(self, point: Vector3) -> Optional[float]:
         """
@@ -59,6 +129,8 @@ class HolographicBoundary:
         """
         if not self.samples:
             return None
+        if self.accuracy > 0:
+            return self._sample_cells(point.x, point.y, point.z)
 
         weighted = 0.0
         weight_sum = 0.0
@@ -76,6 +148,66 @@ class HolographicBoundary:
             return None
         return weighted / weight_sum
 
+    def sample_many(self, points: List[Vector3]) -> List[Optional[float]]:
+        """`sample` for each point (the cell index is built once and shared)."""
+        if not self.samples:
+            return [None] * len(points)
+        if self.accuracy > 0:
+            return [self._sample_cells(p.x, p.y, p.z) for p in points]
+        return [self.sample(p) for p in points]
+
+    def _sample_cells(self, x: float, y: float, z: float) -> Optional[float]:
+        cells = self._cells
+        if cells is None or cells.count != len(self.samples):
+            cells = self._cells = _BoundaryCells(self.samples, self.cell_size)
+
+        sqrt = math.sqrt
+        accuracy = self.accuracy
+        thickness = self.thickness
+        weighted = 0.0
+        weight_sum = 0.0
+        hit_index = -1
+        hit_potential = 0.0
+        for members, cx, cy, cz, n, potential_sum, reach in cells.cells:
+            dist = sqrt((cx - x) ** 2 + (cy - y) ** 2 + (cz - z) ** 2)
+            if reach <= accuracy * dist and dist - reach > thickness:
+                weight = 1.0 / (dist + 1e-6)
+                weighted += weight * potential_sum
+                weight_sum += weight * n
+                continue
+            for i, pos, potential in members:
+                d = sqrt((pos.x - x) ** 2 + (pos.y - y) ** 2 + (pos.z - z) ** 2)
+                if d <= thickness:
+                    # Exact IDW returns the first sample (in list order) in contact
+                    if hit_index < 0 or i < hit_index:
+                        hit_index, hit_potential = i, potential
+                    continue
+                weight = 1.0 / (d + 1e-6)
+                weighted += weight * potential
+                weight_sum += weight
+
+        if hit_index >= 0:
+            return hit_potential
+        if weight_sum == 0:
+            return None
+        return weighted / weight_sum
+
+# Position assignments across all PhysicsStates (and Entity.physics swaps);
+# PhysicsWorld compares it with the count its neighbour grid is current for
+_position_writes = 0
+
+
+def position_writes() -> int:
+    """Number of position assignments so far, process-wide."""
+    return _position_writes
+
+
+def note_position_write() -> None:
+    """Counts a position change made outside PhysicsState attributes (array rows)."""
+    global _position_writes
+    _position_writes += 1
+
+
 @dataclass
 class PhysicsState:
     """
@@ -86,6 +218,12 @@ class PhysicsState:
     velocity: Vector3 = field(default_factory=lambda: Vector3(0, 0, 0))
     mass: float = 1.0
 
+    def __setattr__(self, name: str, value: Any) -> None:
+        if name == "position":
+            global _position_writes
+            _position_writes += 1
+        object.__setattr__(self, name, value)
+
     def apply_force(self, force: Vector3, dt: float) -> None:
         """F = ma -> a = F/m"""
         if self.mass <= 0:
@@ -126,16 +264,231 @@ class Attractor:
         return direction * magnitude
 
 
+def entropy_mass(entropy: float) -> float:
+    """Virtual mass under Complexity Entropy Pressure (heavy things sink)."""
+    return max(1.0, 1.0 + entropy * 0.5)
+
+
+class StateKey:
+    """
+    Everything calculate_entropy depends on: the versions of the tracked
+    data/bonds containers, the soul frequency, and the len() of every sized,
+    non-string data value. The versions only see top-level writes, so those
+    values (lists, dicts, ...) are kept and their lengths re-read on each
+    check; an entity whose data holds only scalars and strings checks in O(1).
+    """
+
+    __slots__ = ("data_version", "bonds_version", "frequency", "sized", "sizes")
+
+    def __init__(self, entity: Entity):
+        data = entity.data
+        self.data_version = version_of(data)
+        self.bonds_version = version_of(entity.bonds)
+        self.frequency = entity.soul.frequency if entity.soul else None
+        self.sized = [v for v in data.values() if not isinstance(v, str) and hasattr(v, "__len__")]
+        self.sizes = [len(v) for v in self.sized]
+
+    def matches(self, entity: Entity) -> bool:
+        """False when the entropy may have changed (always, for untracked containers)."""
+        if self.data_version is None or self.bonds_version is None:
+            return False
+        if version_of(entity.data) != self.data_version or version_of(entity.bonds) != self.bonds_version:
+            return False
+        if (entity.soul.frequency if entity.soul else None) != self.frequency:
+            return False
+        for value, size in zip(self.sized, self.sizes):
+            if len(value) != size:
+                return False
+        return True
+
+
+class SedimentEntry:
+    """Bookkeeping for one entity in the Abyss."""
+
+    __slots__ = ("entity", "key", "entropy", "settled")
+
+    def __init__(self, entity: Entity, settled: int):
+        self.entity: Optional[Entity] = entity  # None once removed (lazy delete)
+        self.key: Optional[StateKey] = None
+        self.entropy: float = 0.0
+        self.settled = settled  # Tick up to which drift has been applied
+
+
+class SedimentLayer:
+    """
+    The Abyss: entities too heavy for the active loop.
+
+    Each entry caches the entity's entropy (and so its mass) under its
+    `StateKey`; governance is only re-run when data, bonds or soul
+    frequency changed. Entries are visited round-robin, about
+    len / rate per tick, so every sediment is looked at once per `rate`
+    ticks without a sweep over the whole layer on any single tick. Inertia
+    drift is applied lazily on visit, in closed form for all the `rate`
+    periods elapsed since the entity was last settled.
+    """
+
+    def __init__(self, rate: int = SEDIMENT_RATE):
+        self.rate = rate
+        self._queue: Deque[SedimentEntry] = deque()
+        self._members: Dict[int, SedimentEntry] = {}  # id(entity) -> entry
+
+    def __len__(self) -> int:
+        return len(self._members)
+
+    def __contains__(self, entity: object) -> bool:
+        return id(entity) in self._members
+
+    def __iter__(self) -> Iterator[Entity]:
+        return (entry.entity for entry in self._queue if entry.entity is not None)
+
+    def add(self, entity: Entity, tick: int) -> None:
+        if id(entity) in self._members:
+            return
+        entry = SedimentEntry(entity, tick)
+        self._members[id(entity)] = entry
+        self._queue.append(entry)
+
+    def discard(self, entity: Entity) -> None:
+        entry = self._members.pop(id(entity), None)
+        if entry is not None:
+            entry.entity = None
+            # Dead entries are dropped as the round-robin reaches them; compact
+            # early if they ever outnumber the living.
+            if len(self._queue) > 2 * len(self._members) + 64:
+                self._queue = deque(e for e in self._queue if e.entity is not None)
+
+    def remapped(self, translate: Callable[[Entity], Entity]) -> SedimentLayer:
+        """Copy holding translate(entity) in place of every entity (world forks)."""
+        new = SedimentLayer(self.rate)
+        for entry in self._queue:
+            if entry.entity is None:
+                continue
+            moved = SedimentEntry(translate(entry.entity), entry.settled)
+            moved.entropy = entry.entropy  # key stays None: it watches the source's data
+            new._members[id(moved.entity)] = moved
+            new._queue.append(moved)
+        return new
+
+    def visit(self, physics: PhysicsWorld, tick: int, dt: float) -> List[Entity]:
+        """
+        Processes this tick's share of the layer. Returns the entities whose
+        mass fell to ABYSS_THRESHOLD or below; they have left the layer.
+        """
+        queue = self._queue
+        budget = -(-len(self._members) // self.rate)  # ceil
+        risen: List[Entity] = []
+        while budget > 0 and queue:
+            entry = queue.popleft()
+            entity = entry.entity
+            if entity is None:
+                continue
+            budget -= 1
+
+            if entry.key is None or not entry.key.matches(entity):
+                entry.key = StateKey(entity)
+                entry.entropy = physics.calculate_entropy(entity)
+                entity.physics.mass = entropy_mass(entry.entropy)
+
+            if entity.physics.mass <= ABYSS_THRESHOLD:
+                # Redemption: rises with the governance drag of this visit
+                if entry.entropy > 10.0:
+                    entity.physics.velocity *= 0.95
+                del self._members[id(entity)]
+                risen.append(entity)
+                continue
+
+            self._settle(entry, tick, dt)
+            queue.append(entry)
+        return risen
+
+    def _settle(self, entry: SedimentEntry, tick: int, dt: float) -> None:
+        periods = (tick - entry.settled) // self.rate
+        if periods <= 0:
+            return
+        entry.settled += periods * self.rate
+        # Per period: governance drag (dissonant only), inertia damping 0.9, one step
+        c = 0.9 * (0.95 if entry.entropy > 10.0 else 1.0)
+        state = entry.entity.physics
+        v = state.velocity
+        state.position = state.position + v * (dt * c * (1.0 - c ** periods) / (1.0 - c))
+        state.velocity = v * (c ** periods)
+
+
+class SedimentView:
+    """
+    `PhysicsWorld.sediments`: a live, list-like view of the Abyss. Reads and
+    the list mutators callers used on the former plain list (append, extend,
+    remove, clear) go straight to the world's sediment layer; other list
+    mutators do not exist.
+    """
+
+    __slots__ = ("_physics",)
+
+    def __init__(self, physics: PhysicsWorld):
+        self._physics = physics
+
+    def __len__(self) -> int:
+        return len(self._physics.sediment_layer)
+
+    def __iter__(self) -> Iterator[Entity]:
+        return iter(self._physics.sediment_layer)
+
+    def __contains__(self, entity: object) -> bool:
+        return entity in self._physics.sediment_layer
+
+    def __getitem__(self, index):
+        return list(self)[index]
+
+    def __add__(self, other: List[Entity]) -> List[Entity]:
+        return list(self) + list(other)
+
+    def __radd__(self, other: List[Entity]) -> List[Entity]:
+        return list(other) + list(self)
+
+    def __eq__(self, other: object) -> bool:
+        return list(self) == list(other) if isinstance(other, (list, SedimentView)) else NotImplemented
+
+    def __repr__(self) -> str:
+        return f"SedimentView({list(self)!r})"
+
+    def append(self, entity: Entity) -> None:
+        self._physics.sediment_layer.add(entity, self._physics.tick)
+
+    def extend(self, entities: Iterable[Entity]) -> None:
+        for entity in entities:
+            self.append(entity)
+
+    def remove(self, entity: Entity) -> None:
+        if entity not in self._physics.sediment_layer:
+            raise ValueError("entity is not in the Abyss")
+        self._physics.sediment_layer.discard(entity)
+
+    def clear(self) -> None:
+        physics = self._physics
+        physics.sediment_layer = SedimentLayer(physics.sediment_layer.rate)
+
+
 class PhysicsWorld:
     """
     Manages the Digital Physics interactions.
     TRANSITION: Moving from O(N^2) Particle Interaction to O(Res) Field System.
     Now includes 'Atmospheric Governance' to manage complexity and entropy.
     """
-    def __init__(self) -> None:
+    def __init__(self, array_backend: bool = False) -> None:
+        """
+        Args:
+            array_backend: Store entity position/velocity/mass in contiguous
+                NumPy arrays (see physics_store) and integrate them in one
+                vectorized pass per step. Requires numpy.
+        """
         self.attractors: List[Attractor] = []
         self.entities: List[Entity] = []
-        self.sediments: List[Entity] = []  # The Abyss: Low frequency updates
+        # id(entity) -> index in entities, valid while entities.version matches
+        self._entity_slots: Dict[int, int] = {}
+        self._entity_slots_version: Optional[int] = None
+        self.sediment_layer = SedimentLayer()  # The Abyss: Low frequency updates
+        # id(entity) -> (StateKey, entropy); see cached_entropy
+        self._entropy_cache: Dict[int, Tuple[StateKey, float]] = {}
 
         self.gravity_constant: float = 1.0
         self.coupling_constant: float = 0.5
@@ -147,13 +500,150 @@ class PhysicsWorld:
 
         # New Field System
         self.field_system = FieldSystem()
+        # Entities that keep the field at full resolution around them
+        # (together with attractors) when field_system.lod is set
+        self.observers: List[Entity] = []
+
+        # Cell list over active entities for binding/entanglement scans.
+        # Mirrors self.entities (same members, same order).
+        self.neighbor_index: SpatialHashGrid[Entity] = SpatialHashGrid(
+            BINDING_RADIUS, lambda ent: ent.physics.position
+        )
+        # position_writes() and entities.version when the grid last matched
+        # every active entity and position
+        self._grid_writes = _position_writes
+        self._grid_version: Optional[int] = self.entities.version
+
+        # Optional Struct-of-Arrays state (None = per-object PhysicsState)
+        self.state_store: Optional[PhysicsArrayStore] = None
+        if array_backend:
+            from .physics_store import PhysicsArrayStore
+            self.state_store = PhysicsArrayStore()
+
+        # Optional instrumentation (attached by World.enable_profiling)
+        self.profiler: Optional[TickProfiler] = None
+
+    def __setattr__(self, name: str, value: object) -> None:
+        # entities is kept change-tracked so register_entity can check membership in O(1)
+        if name == "entities" and type(value) is not TrackedList:
+            value = TrackedList(value)
+        object.__setattr__(self, name, value)
+
+    @property
+    def sediments(self) -> SedimentView:
+        """Entities in the Abyss (a live view of sediment_layer)."""
+        return SedimentView(self)
+
+    @sediments.setter
+    def sediments(self, entities: List[Entity]) -> None:
+        self.sediment_layer = SedimentLayer(self.sediment_layer.rate)
+        for entity in entities:
+            self.sediment_layer.add(entity, self.tick)
 
     def add_attractor(self, attractor: Attractor) -> None:
         self.attractors.append(attractor)
 
+    def _slots(self) -> Dict[int, int]:
+        """id(entity) -> index in entities; rebuilt only after the list was changed elsewhere."""
+        entities = self.entities
+        if self._entity_slots_version != entities.version:
+            self._entity_slots = {id(e): i for i, e in enumerate(entities)}
+            self._entity_slots_version = entities.version
+        return self._entity_slots
+
     def register_entity(self, entity: Entity) -> None:
-        if entity not in self.entities and entity not in self.sediments:
-            self.entities.append(entity)
+        """
+        Adds an entity to the active loop unless it is already active or in
+        the Abyss. Membership is by identity, in O(1) amortized.
+        """
+        slots = self._slots()
+        if id(entity) in slots or entity in self.sediment_layer:
+            return
+        entities = self.entities
+        grid_current = self._grid_version == entities.version
+        slots[id(entity)] = len(entities)
+        entities.append(entity)
+        self._entity_slots_version = entities.version
+        if self.state_store is not None:
+            self.state_store.attach_entity(entity)
+        self.neighbor_index.insert(entity)
+        if grid_current:
+            self._grid_version = entities.version
+
+    def unregister_entity(self, entity: Entity) -> None:
+        """
+        Removes an entity from the active loop or the Abyss and from every
+        physics index, in O(1) amortized. The last active entity takes over
+        the freed slot. A store-backed state is copied out and its row freed.
+        """
+        slots = self._slots()
+        slot = slots.pop(id(entity), None)
+        entities = self.entities
+        grid_current = self._grid_version == entities.version
+        if slot is not None:
+            last = entities.pop()
+            if last is not entity:
+                entities[slot] = last
+                slots[id(last)] = slot
+                grid_current = False  # Grid order no longer matches the list
+            self._entity_slots_version = entities.version
+        self.sediment_layer.discard(entity)
+        self.neighbor_index.remove(entity)
+        if grid_current:
+            self._grid_version = entities.version
+        self._entropy_cache.pop(id(entity), None)
+        for i, observer in enumerate(self.observers):
+            if observer is entity:
+                del self.observers[i]
+                break
+        state = entity.physics
+        if self.state_store is not None and getattr(state, "store", None) is self.state_store:
+            entity.physics = state.detach()
+            self.state_store.release(state)
+
+    def refresh_neighbor_index(self) -> None:
+        """
+        Rebuilds the neighbour grid from the active entity list (O(N)).
+        Called once per tick, and before a neighbour query whenever positions
+        were assigned since the grid was last current (see _current_neighbors).
+        In-place edits of a position's components are not seen; call it
+        manually after those.
+        """
+        prof = self.profiler
+        if not prof:
+            self._rebuild_neighbor_index()
+            return
+        t0 = clock()
+        self._rebuild_neighbor_index()
+        prof.add(NEIGHBOR_INDEX, clock() - t0)
+
+    def _rebuild_neighbor_index(self) -> None:
+        if self.state_store is not None:
+            self.neighbor_index.rebuild(self.entities, self.state_store.positions(self.entities))
+        else:
+            self.neighbor_index.rebuild(self.entities)
+        self._grid_writes = _position_writes
+        self._grid_version = self.entities.version
+
+    def notify_moved(self, entity: Entity) -> None:
+        """Keeps the neighbour grid current after an entity was integrated."""
+        self.neighbor_index.relocate(entity)
+        if _position_writes == self._grid_writes + 1:
+            # The only write since the grid was current: this entity's step
+            self._grid_writes = _position_writes
+
+    def _grid_current(self) -> bool:
+        """
+        True while no position was assigned and the entity list was not
+        changed (e.g. appended to directly) since the grid was last current.
+        """
+        return _position_writes == self._grid_writes and self.entities.version == self._grid_version
+
+    def _current_neighbors(self) -> SpatialHashGrid[Entity]:
+        """The neighbour grid, rebuilt first if positions were assigned elsewhere."""
+        if not self._grid_current():
+            self._rebuild_neighbor_index()  # Timed as part of the calling section
+        return self.neighbor_index
 
     def configure_holographic_boundary(self, boundary: HolographicBoundary) -> None:
         """
@@ -174,12 +664,11 @@ class PhysicsWorld:
         # This gives the world "Depth" from the Abyss.
         all_entities = self.entities + self.sediments
 
-        for ent in all_entities:
+        for ent, (x, y, z) in zip(all_entities, self._positions(all_entities)):
             if ent.soul:
                 # Convert Vec3 to Vec4 (W=0 for now, or use mass as W scale?)
                 # Default W=0 implies standard depth.
-                pos4 = Vector4(0, ent.physics.position.x, ent.physics.position.y, ent.physics.position.z)
-                active_data.append((pos4, ent.soul))
+                active_data.append((Vector4(0, x, y, z), ent.soul))
 
         # Include Attractors in the Field Logic
         # Attractors are effectively static, heavy entities
@@ -196,6 +685,17 @@ class PhysicsWorld:
 
         self.field_system.update_field(active_data)
 
+        lod = self.field_system.lod
+        if lod is not None:
+            lod.foci = [Vector4(0, a.position.x, a.position.y, a.position.z) for a in self.attractors]
+            lod.foci += [Vector4(0, x, y, z) for x, y, z in self._positions(self.observers)]
+
+    def _positions(self, entities: List[Entity]) -> List[Sequence[float]]:
+        """(x, y, z) of each entity; one array gather on the array backend."""
+        if self.state_store is not None:
+            return self.state_store.positions(entities)
+        return [(p.x, p.y, p.z) for p in (ent.physics.position for ent in entities)]
+
     def calculate_potential(self, position: Vector3, target_soul: Optional[SoulTensor] = None) -> float:
         """
         Legacy: Calculates Potential from Field System instead of Iteration.
@@ -229,75 +729,91 @@ class PhysicsWorld:
         # Get Force from Field
         force4, rotor = self.field_system.get_local_forces(pos4, target_entity.soul)
 
-        # Convert back to Vec3 (ignore W force for now)
-        force = Vector3(force4.x, force4.y, force4.z)
+        # get_local_forces only produces xy-plane torque rotors
+        return self._spiral_flow(target_entity.soul, force4.x, force4.y, force4.z, rotor.a, rotor.b_xy)
+
+    def geodesic_flows(self, entities: List[Entity]) -> List[Vector3]:
+        """
+        get_geodesic_flow for many entities, reading the field in one
+        batched pass (FieldSystem.get_local_forces_batch).
+        """
+        souled = [ent for ent in entities if ent.soul]
+        forces, angles = self.field_system.get_local_forces_batch(
+            [(0.0, x, y, z) for x, y, z in self._positions(souled)],
+            [ent.soul for ent in souled],
+        )
+        field_forces = iter(zip(forces, angles))
+        flows = []
+        for ent in entities:
+            if not ent.soul:
+                flows.append(Vector3(0, 0, 0))
+                continue
+            (_, fx, fy, fz), angle = next(field_forces)
+            # Rotor.from_plane_angle('xy', angle) without building it
+            half = angle * 0.5
+            flows.append(self._spiral_flow(ent.soul, fx, fy, fz, math.cos(half), -math.sin(half)))
+        return flows
 
-        # Apply Rotor Torque?
-        # If the field spins, the entity's velocity vector should rotate.
-        # v' = R v R~
-        # We apply this to the current velocity, not force.
-        # But here we return Force/Flow vector.
+    def _spiral_flow(self, soul: SoulTensor, fx: float, fy: float, fz: float, rotor_a: float, rotor_b_xy: float) -> Vector3:
+        """
+        Turns a field force into the entity's flow: rotates it by the
+        dampened xy torque rotor and adds the soul's self-propulsion.
+        """
+        if soul.is_collapsed:
+            return Vector3(fx, fy, fz)
 
         # [Rotor Integration]
-        # Rotate the Soul's Orientation based on field torque.
-        # This re-aligns the "Intent Vector" dynamically.
-        if target_entity.soul and not target_entity.soul.is_collapsed:
-             # Apply slight rotation to the soul orientation
-             # We dampen the rotor effect to prevent chaos
-             # [FIX] Mapped correct Rotor attributes from math_utils (a, b_xy, b_yz, b_xz)
-             # Note: bivector_zx corresponds to -b_xz, but for dampening magnitude it doesn't matter much.
-             # We reconstruct a simplified rotor for dampening.
-             dampened_rotor = Rotor(
-                 a=rotor.a,
-                 b_wx=0, b_wy=0, b_wz=0, # Assuming mostly spatial rotation for torque
-                 b_xy=rotor.b_xy * 0.1,
-                 b_xz=rotor.b_xz * 0.1,
-                 b_yz=rotor.b_yz * 0.1,
-                 p=0
-             )
-             # Note: Rotor application to Quaternion is complex.
-             # Simpler approach: Rotate the velocity vector (Coriolis Effect)
-
-             # Rotate the FORCE vector to simulate the spiral path
-             # F_spiral = R * F * R_conj
-             # Convert force to Vector4 for rotor operation (w=0)
-             force4_rotated = dampened_rotor.rotate(Vector4(0, force.x, force.y, force.z))
-             force = Vector3(force4_rotated.x, force4_rotated.y, force4_rotated.z)
+        # Rotate the FORCE vector to simulate the spiral path (Coriolis Effect):
+        # F_spiral = R F R~ with the rotor's bivector dampened to prevent chaos.
+        # For R = a + b e_xy the sandwich product reduces to a 2D map on (x, y)
+        # with c = a^2 - b^2, s = 2ab, and a uniform a^2 + b^2 scale on z.
+        a = rotor_a
+        b = rotor_b_xy * 0.1
+        c = a * a - b * b
+        s = 2.0 * a * b
+        force = Vector3(c * fx + s * fy, c * fy - s * fx, (a * a + b * b) * fz)
 
         # Add Intent (Self-Propulsion)
-        intent_force = Vector3(0,0,0)
-        if target_entity.soul and not target_entity.soul.is_collapsed:
-             forward_ref = Vector3(0, 0, 1)
-             intent_direction = target_entity.soul.orientation.rotate(forward_ref)
-             intent_mag = target_entity.soul.amplitude * 0.1
-             intent_force = intent_direction * intent_mag
-
-        total_force = force + intent_force
+        forward_ref = Vector3(0, 0, 1)
+        intent_direction = soul.orientation.rotate(forward_ref)
+        intent_mag = soul.amplitude * 0.1
+        return force + intent_direction * intent_mag
 
-        return total_force
-
-    def check_dimensional_binding(self, entity: Entity) -> None:
+    def check_dimensional_binding(self, entity: Entity, positions: Optional[Dict[int, Sequence[float]]] = None) -> None:
         """
         Checks if the entity should evolve dimensionally (Point -> Line).
         And promotes Entanglement.
+        `positions` (id(entity) -> (x, y, z) for every active entity) lets
+        the array backend skip the per-entity position reads.
         """
         if not entity.soul or entity.soul.is_collapsed:
             return
 
-        # Scan active entities for binding
+        # Scan nearby active entities for binding
         # (Sediments are too deep to bind quickly, we only check active for performance)
-        for other in self.entities:
+        # The neighbour grid yields candidates in self.entities order, so results
+        # match a full scan exactly.
+        if positions is None:
+            position = entity.physics.position
+        else:
+            x, y, z = positions[id(entity)]
+            position = Vector3(x, y, z)
+        for other in self._current_neighbors().neighbors(position, BINDING_RADIUS):
             if other.id == entity.id: continue
             if not other.soul: continue
 
             # Check proximity
-            dist = (entity.physics.position - other.physics.position).magnitude
-            if dist < 2.0:
+            if positions is None:
+                dist = (position - other.physics.position).magnitude
+            else:
+                ox, oy, oz = positions[id(other)]
+                dist = math.sqrt((x - ox) ** 2 + (y - oy) ** 2 + (z - oz) ** 2)
+            if dist < BINDING_RADIUS:
                 # Check Resonance
-                res = entity.soul.resonate(other.soul)
+                resonance = entity.soul.resonance_value(other.soul)
 
                 # BINDING (Fractal Evolution)
-                if res['resonance'] > 0.9: # Very high harmony
+                if resonance > 0.9: # Very high harmony
                     # Bind them!
                     if other.id not in entity.bonds:
                         entity.bonds.append(other.id)
@@ -315,7 +831,7 @@ class PhysicsWorld:
 
                 # ENTANGLEMENT (Quantum Link)
                 # If they are very close and harmonic, they entangle
-                if dist < 0.5 and res['resonance'] > 0.95:
+                if dist < ENTANGLEMENT_RADIUS and resonance > 0.95:
                     entity.soul.entangle(other.soul)
 
     def calculate_entropy(self, entity: Entity) -> float:
@@ -348,6 +864,27 @@ class PhysicsWorld:
 
         return base_entropy + resonance_penalty
 
+    def cached_entropy(self, entity: Entity) -> float:
+        """
+        calculate_entropy, memoized under the entity's StateKey. An entity
+        whose data, bonds and soul frequency are unchanged costs a key check
+        instead of a walk over its data.
+        """
+        hit = self._entropy_cache.get(id(entity))
+        if hit is not None and hit[0].matches(entity):
+            return hit[1]
+        entropy = self.calculate_entropy(entity)
+        self._entropy_cache[id(entity)] = (StateKey(entity), entropy)
+        return entropy
+
+    def _prune_entropy_cache(self) -> None:
+        # Keys carry never-reused container versions, so entries of departed
+        # entities can only miss; drop them once they dominate the cache
+        # (they also keep the departed entities' data values alive).
+        cache = self._entropy_cache
+        if len(cache) > 2 * len(self.entities) + 64:
+            self._entropy_cache = {id(e): cache[id(e)] for e in self.entities if id(e) in cache}
+
     def apply_atmospheric_governance(self, entity: Entity) -> None:
         """
         Applies the 3 Pillars of Guidance:
@@ -355,12 +892,12 @@ class PhysicsWorld:
         2. Horizon Anchor -> Resonance Check
         3. Aesthetic Filter -> Dampening
         """
-        entropy = self.calculate_entropy(entity)
+        entropy = self.cached_entropy(entity)
 
         # 1. Complexity Entropy Pressure
         # Increase virtual mass based on entropy. Heavy things sink.
         # Base mass is 1.0, adds entropy weight.
-        entity.physics.mass = max(1.0, 1.0 + entropy * 0.5)
+        entity.physics.mass = entropy_mass(entropy)
 
         # 2. Aesthetic Filter (Dampening)
         # If entity is dissonant (high entropy), dampen its velocity
@@ -374,62 +911,144 @@ class PhysicsWorld:
         2. Move Entities (Lagrangian Step) - with Sedimentation Logic
         """
         self.tick += 1
-
+        prof = self.profiler
+        if prof:
+            prof.begin_tick(self.tick)
+        try:
+            self._advance(dt, prof)
+        finally:
+            # Close the tick even on errors, or later ticks would count as nested
+            if prof:
+                prof.end_tick()
+
+    def _advance(self, dt: float, prof: Optional[TickProfiler]) -> None:
+        """The three phases of step (tick bookkeeping is done by the caller)."""
         # 1. Bloom the Field (Eulerian Step)
+        if prof:
+            t0 = clock()
         self.update_field()
+        if prof:
+            prof.add(FIELD_BLOOM, clock() - t0)
+        # Array rows change only through assignments, which the grid stamp
+        # sees; per-object positions may also have been edited in place
+        if self.state_store is None or not self._grid_current():
+            self.refresh_neighbor_index()
 
         # 2. Process Active Entities
+        # Flow depends only on an entity's own position and soul, which the
+        # loop below does not touch before reaching it, so read the field once.
+        flows = self._timed_flows(self.entities)
         active_survivors = []
-        for entity in self.entities:
+        movers_flow = []
+        for entity, flow in zip(self.entities, flows):
             self.apply_atmospheric_governance(entity)
 
             # Check Sedimentation (The Abyss)
             if entity.physics.mass > ABYSS_THRESHOLD:
                 # Sink to Abyss
-                self.sediments.append(entity)
+                self.sediment_layer.add(entity, self.tick)
                 # Do not add to active_survivors
                 continue
 
+            active_survivors.append(entity)
+
+            if self.state_store is not None:
+                movers_flow.append(flow)
+                continue  # Integrated below in one vectorized pass
+
             # Standard Physics
-            force = self.get_geodesic_flow(entity)
-            entity.physics.apply_force(force, dt)
+            entity.physics.apply_force(flow, dt)
             entity.physics.step(dt)
-            self.check_dimensional_binding(entity)
+            self.notify_moved(entity)
+            self._timed_binding(entity)
+
+        if self.state_store is not None:
+            self._integrate_batch(active_survivors, movers_flow, dt)
 
-            active_survivors.append(entity)
 
+        sunk = len(active_survivors) != len(self.entities)
         self.entities = active_survivors
 
         # 3. Process Sediment Layer (The Abyss)
-        # Only update every SEDIMENT_RATE ticks
-        if self.tick % SEDIMENT_RATE == 0:
-            sediment_survivors = []
-            for entity in self.sediments:
-                # Check if it became lighter (Redemption)
-                self.apply_atmospheric_governance(entity)
-
-                if entity.physics.mass <= ABYSS_THRESHOLD:
-                    # Rise from Abyss
-                    self.entities.append(entity)
-                    continue
+        # A 1/SEDIMENT_RATE slice per tick; unchanged sediments skip governance
+        risen: List[Entity] = []
+        if self.sediment_layer:
+            if prof:
+                t0 = clock()
+            # Rise from Abyss (Redemption)
+            risen = self.sediment_layer.visit(self, self.tick, dt)
+            self.entities.extend(risen)
+            if prof:
+                prof.add(SEDIMENT, clock() - t0)
+
+        # Membership changed (sedimentation / redemption)
+        if sunk or risen or _position_writes != self._grid_writes:
+            self.refresh_neighbor_index()
+        else:
+            self._grid_version = self.entities.version  # Same members, same order
+        self._prune_entropy_cache()
+
+    def _timed_flow(self, entity: Entity) -> Vector3:
+        """get_geodesic_flow, reported to the profiler when one is attached."""
+        prof = self.profiler
+        if not prof:
+            return self.get_geodesic_flow(entity)
+        t0 = clock()
+        flow = self.get_geodesic_flow(entity)
+        prof.add(GEODESIC_FLOW, clock() - t0)
+        return flow
+
+    def _timed_flows(self, entities: List[Entity]) -> List[Vector3]:
+        """geodesic_flows, reported to the profiler when one is attached."""
+        prof = self.profiler
+        if not prof:
+            return self.geodesic_flows(entities)
+        t0 = clock()
+        flows = self.geodesic_flows(entities)
+        prof.add(GEODESIC_FLOW, clock() - t0)
+        return flows
+
+    def _timed_binding(self, entity: Entity, positions: Optional[Dict[int, Sequence[float]]] = None) -> None:
+        """check_dimensional_binding, reported to the profiler when one is attached."""
+        prof = self.profiler
+        if prof:
+            t0 = clock()
+        if positions is None:
+            self.check_dimensional_binding(entity)
+        else:
+            self.check_dimensional_binding(entity, positions)
+        if prof:
+            prof.add(DIMENSIONAL_BINDING, clock() - t0)
+
+    def _integrate_batch(self, movers: List[Entity], flows: List[Vector3], dt: float) -> None:
+        """
+        Array-backend Lagrangian step: every mover is integrated at once
+        with its precomputed flow. Binding runs afterwards against
+        the end-of-tick positions (the per-object path interleaves them).
+        """
+        from .physics_store import forces_to_array
 
-                # Minimal movement in Abyss (Drift)
-                # No force calculation from field (too expensive), just inertia dampening
-                entity.physics.velocity *= 0.9
-                entity.physics.step(dt)
-                sediment_survivors.append(entity)
+        store = self.state_store
+        rows = store.rows_for(movers)
+        forces = forces_to_array(flows)
+        store.integrate(rows, forces, dt)
 
-            self.sediments = sediment_survivors
+        self.refresh_neighbor_index()
+        # Binding moves nothing, so every position can be read in one gather
+        entities = self.entities
+        positions = dict(zip(map(id, entities), store.positions(entities)))
+        for entity in movers:
+            self._timed_binding(entity, positions)
 
     def get_net_force(self, target_entity: Entity) -> Vector3:
         """
         Legacy wrapper. Now delegates to Geodesic Flow.
         Note: This assumes update_field() has been called recently.
         """
-        flow = self.get_geodesic_flow(target_entity)
+        flow = self._timed_flow(target_entity)
 
         # Check for Dimensional Evolution opportunities
-        self.check_dimensional_binding(target_entity)
+        self._timed_binding(target_entity)
 
         # Apply spacetime torsion (optional rotation of the flow field)
         if self.spacetime_torsion:
@@ -0,0 +1,183 @@
+"""
+Struct-of-Arrays Physics Store
+
+Optional NumPy backend for entity physics state. Positions, velocities and
+masses of every registered entity live in contiguous arrays, and each
+`Entity.physics` becomes a thin view onto one row. The per-object API
+(`apply_force`, `step`, `position = ...`) keeps working through the view,
+while `PhysicsWorld.step` integrates all rows in a single vectorized pass
+and reads positions for the field, the geodesic flows, the neighbour grid
+and binding with one gather each (`positions`) instead of per-row views.
+
+NumPy is only required when the store is actually created; the default
+pure-Python `PhysicsState` path has no dependencies.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Iterable, List, Sequence
+
+from .math_utils import Vector3
+from .physics import PhysicsState, note_position_write
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - exercised only without numpy
+    np = None
+
+if TYPE_CHECKING:
+    from .entities import Entity
+
+
+class ArrayPhysicsState(PhysicsState):
+    """
+    PhysicsState view onto a row of a PhysicsArrayStore.
+    Behaves like the dataclass it replaces (including `asdict` and `==`).
+    `position` / `velocity` read as detached Vector3 copies, so a saved
+    vector keeps its value when the row moves on; write whole vectors
+    through the setters (`state.position = Vector3(...)`), since editing a
+    copy's components does not reach the row.
+    """
+
+    def __init__(self, store: PhysicsArrayStore, row: int):
+        self.store = store
+        self.row = row
+
+    @property  # type: ignore[override]
+    def position(self) -> Vector3:
+        return Vector3(*self.store.position[self.row].tolist())
+
+    @position.setter
+    def position(self, value: Vector3) -> None:
+        self.store.position[self.row] = (value.x, value.y, value.z)
+
+    @property  # type: ignore[override]
+    def velocity(self) -> Vector3:
+        return Vector3(*self.store.velocity[self.row].tolist())
+
+    @velocity.setter
+    def velocity(self, value: Vector3) -> None:
+        self.store.velocity[self.row] = (value.x, value.y, value.z)
+
+    @property  # type: ignore[override]
+    def mass(self) -> float:
+        return float(self.store.mass[self.row])
+
+    @mass.setter
+    def mass(self, value: float) -> None:
+        self.store.mass[self.row] = value
+
+    def detach(self) -> PhysicsState:
+        """Copies the row back into a standalone PhysicsState."""
+        return PhysicsState(position=self.position, velocity=self.velocity, mass=self.mass)
+
+
+class PhysicsArrayStore:
+    """
+    Contiguous position/velocity/mass arrays with a free-list of rows.
+    Rows are stable for the lifetime of an attachment; growth reallocates
+    the arrays but views only hold (store, row), so they stay valid.
+    """
+
+    def __init__(self, capacity: int = 1024):
+        if np is None:
+            raise ImportError("PhysicsArrayStore requires numpy (pip install numpy)")
+        capacity = max(1, capacity)
+        self.position = np.zeros((capacity, 3), dtype=np.float64)
+        self.velocity = np.zeros((capacity, 3), dtype=np.float64)
+        self.mass = np.ones(capacity, dtype=np.float64)
+        self._size = 0
+        self._free: List[int] = []
+
+    def __len__(self) -> int:
+        return self._size - len(self._free)
+
+    @property
+    def capacity(self) -> int:
+        return len(self.mass)
+
+    def attach(self, state: PhysicsState) -> ArrayPhysicsState:
+        """Copies a per-object state into a fresh row and returns its view."""
+        if isinstance(state, ArrayPhysicsState) and state.store is self:
+            return state
+
+        row = self._allocate()
+        self.position[row] = (state.position.x, state.position.y, state.position.z)
+        self.velocity[row] = (state.velocity.x, state.velocity.y, state.velocity.z)
+        self.mass[row] = state.mass
+        return ArrayPhysicsState(self, row)
+
+    def attach_entity(self, entity: Entity) -> int:
+        """Makes `entity.physics` a view into this store; returns its row."""
+        state = entity.physics
+        if isinstance(state, ArrayPhysicsState) and state.store is self:
+            return state.row  # Already stored: no state swap
+        view = self.attach(state)
+        entity.physics = view
+        return view.row
+
+    def release(self, view: ArrayPhysicsState) -> None:
+        """Returns a row to the free-list. The view must not be used afterwards."""
+        if view.store is not self:
+            return
+        self.position[view.row] = 0.0
+        self.velocity[view.row] = 0.0
+        self.mass[view.row] = 1.0
+        self._free.append(view.row)
+
+    def rows_for(self, entities: Iterable[Entity]) -> np.ndarray:
+        """Row indices for a batch of entities, attaching any that are not yet stored."""
+        rows = []
+        for ent in entities:
+            state = ent.physics
+            if type(state) is ArrayPhysicsState and state.store is self:
+                rows.append(state.row)
+            else:
+                rows.append(self.attach_entity(ent))
+        return np.array(rows, dtype=np.intp)
+
+    def positions(self, entities: Iterable[Entity]) -> List[List[float]]:
+        """[x, y, z] of each entity, read from the position array in one gather."""
+        return self.position[self.rows_for(entities)].tolist()
+
+    def integrate(self, rows: np.ndarray, forces: np.ndarray, dt: float) -> None:
+        """
+        Vectorized `apply_force` + `step` for the given rows.
+        Same arithmetic order as the per-object path: v += (F * 1/m) * dt; p += v * dt.
+        Massless rows keep their velocity (apply_force is a no-op for them).
+        """
+        if len(rows) == 0:
+            return
+        mass = self.mass[rows]
+        inv_mass = np.zeros_like(mass)
+        np.divide(1.0, mass, out=inv_mass, where=mass > 0)
+
+        velocity = self.velocity[rows] + (forces * inv_mass[:, None]) * dt
+        self.velocity[rows] = velocity
+        self.position[rows] = self.position[rows] + velocity * dt
+        note_position_write()
+
+    def _allocate(self) -> int:
+        if self._free:
+            return self._free.pop()
+        if self._size == self.capacity:
+            self._grow(self.capacity * 2)
+        row = self._size
+        self._size += 1
+        return row
+
+    def _grow(self, capacity: int) -> None:
+        extra = capacity - self.capacity
+        self.position = np.concatenate([self.position, np.zeros((extra, 3))])
+        self.velocity = np.concatenate([self.velocity, np.zeros((extra, 3))])
+        self.mass = np.concatenate([self.mass, np.ones(extra)])
+
+
+def forces_to_array(forces: Sequence[Vector3]) -> np.ndarray:
+    """Packs a list of Vector3 forces into an (N, 3) array."""
+    out = np.empty((len(forces), 3), dtype=np.float64)
+    for i, f in enumerate(forces):
+        out[i, 0] = f.x
+        out[i, 1] = f.y
+        out[i, 2] = f.z
+    return out
@@ -0,0 +1,152 @@
+"""
+Tick Profiler
+
+Lightweight wall-clock instrumentation for the simulation loop.
+`World.step` and `PhysicsWorld.step` report into a `TickProfiler` only when
+one is attached, so the disabled cost is a single `None` check per section.
+
+Per-entity sections (geodesic flow, dimensional binding, ...) are summed
+over a tick; each tick then contributes one sample per section to a rolling
+window, from which p50/p95/p99 are reported. Call counts are kept as totals.
+
+Usage:
+    world.enable_profiling(window=500, sink="ticks.jsonl")
+    ...
+    print(world.profile_report()["physics.geodesic_flow"]["p95_ms"])
+"""
+
+from __future__ import annotations
+
+import json
+import time
+from collections import deque
+from typing import IO, Any, Deque, Dict, List, Optional, Union
+
+# Section labels used by the engine
+ENTITY_UPDATE = "world.entity_update"
+FIELD_BLOOM = "physics.field_bloom"
+GEODESIC_FLOW = "physics.geodesic_flow"
+DIMENSIONAL_BINDING = "physics.dimensional_binding"
+NEIGHBOR_INDEX = "physics.neighbor_index"
+SEDIMENT = "physics.sediment"
+TICK = "tick"
+SYSTEM_PREFIX = "system."
+
+clock = time.perf_counter
+
+
+def _percentile(ordered: List[float], q: float) -> float:
+    """Nearest-rank percentile over an already sorted list."""
+    if not ordered:
+        return 0.0
+    idx = min(len(ordered) - 1, max(0, int(round(q * (len(ordered) - 1)))))
+    return ordered[idx]
+
+
+class TickProfiler:
+    """
+    Rolling per-section timing for simulation ticks.
+
+    Args:
+        window: Number of ticks kept for percentile estimates.
+        sink: Optional JSON-lines destination (path or writable text stream);
+            one line per tick with the per-section milliseconds and calls.
+    """
+
+    def __init__(self, window: int = 1000, sink: Optional[Union[str, IO[str]]] = None):
+        self.window = window
+        self._samples: Dict[str, Deque[float]] = {}
+        self._calls: Dict[str, int] = {}
+
+        self._tick_time: Dict[str, float] = {}
+        self._tick_calls: Dict[str, int] = {}
+        self._depth = 0
+        self._tick_start = 0.0
+        self._tick_id: Optional[int] = None
+
+        self._sink_path: Optional[str] = sink if isinstance(sink, str) else None
+        self._sink: Optional[IO[str]] = None if isinstance(sink, str) else sink
+
+    def __deepcopy__(self, memo: Dict[int, Any]) -> None:
+        # Forked timelines (World.clone) are not profiled.
+        return None
+
+    # --- Recording ---
+
+    def begin_tick(self, tick: Optional[int] = None) -> None:
+        """Opens a tick. Nested calls (World -> PhysicsWorld) share the outer tick."""
+        if self._depth == 0:
+            self._tick_start = clock()
+            self._tick_id = tick
+        self._depth += 1
+
+    def end_tick(self) -> None:
+        self._depth -= 1
+        if self._depth > 0:
+            return
+        self._depth = 0
+        self.add(TICK, clock() - self._tick_start)
+        self._flush_tick()
+
+    def add(self, label: str, seconds: float, calls: int = 1) -> None:
+        """Adds time to a section for the current tick."""
+        self._tick_time[label] = self._tick_time.get(label, 0.0) + seconds
+        self._tick_calls[label] = self._tick_calls.get(label, 0) + calls
+
+    def _flush_tick(self) -> None:
+        for label, seconds in self._tick_time.items():
+            samples = self._samples.get(label)
+            if samples is None:
+                samples = self._samples[label] = deque(maxlen=self.window)
+            samples.append(seconds)
+            self._calls[label] = self._calls.get(label, 0) + self._tick_calls[label]
+
+        if self._sink is not None or self._sink_path is not None:
+            self._write_line()
+
+        self._tick_time = {}
+        self._tick_calls = {}
+
+    def _write_line(self) -> None:
+        if self._sink is None:
+            self._sink = open(self._sink_path, "a", encoding="utf-8")
+        record = {
+            "tick": self._tick_id,
+            "sections": {
+                label: {"ms": seconds * 1000.0, "calls": self._tick_calls[label]}
+                for label, seconds in self._tick_time.items()
+            },
+        }
+        self._sink.write(json.dumps(record) + "\n")
+        self._sink.flush()
+
+    # --- Reporting ---
+
+    def report(self) -> Dict[str, Dict[str, float]]:
+        """
+        Per-section summary over the rolling window:
+            calls (total), ticks (samples in window), mean_ms, p50_ms, p95_ms, p99_ms, max_ms.
+        """
+        out: Dict[str, Dict[str, float]] = {}
+        for label, samples in self._samples.items():
+            ordered = sorted(samples)
+            out[label] = {
+                "calls": self._calls.get(label, 0),
+                "ticks": len(ordered),
+                "mean_ms": sum(ordered) / len(ordered) * 1000.0,
+                "p50_ms": _percentile(ordered, 0.50) * 1000.0,
+                "p95_ms": _percentile(ordered, 0.95) * 1000.0,
+                "p99_ms": _percentile(ordered, 0.99) * 1000.0,
+                "max_ms": ordered[-1] * 1000.0,
+            }
+        return out
+
+    def reset(self) -> None:
+        self._samples.clear()
+        self._calls.clear()
+
+    def close(self) -> None:
+        """Closes a sink opened from a path."""
+        if self._sink is not None and self._sink_path is not None:
+            self._sink.close()
+            self._sink = None
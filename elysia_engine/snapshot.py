@@ -0,0 +1,321 @@
+"""
+Compact World Snapshots
+
+`WorldSnapshot.capture(world)` flattens a World into a few contiguous
+`array('d')` columns (positions, velocities, soul axes, ...) plus sparse
+side tables for the rare non-numeric parts (bonds, data, roles, quantum
+links and entanglement groups). Systems, attractors and other small objects are pickled with
+persistent references, so a system that points at an entity, soul or the
+PhysicsWorld is re-linked to the restored object instead of dragging the
+live graph along.
+
+The snapshot pickles to a compact byte string and `restore()` rebuilds an
+independent World from it. Used to ship a world to worker processes
+(DreamSystem.prophecy_many); it is not a save-game format.
+
+Not carried over: profilers, the neighbour grid (rebuilt), stale sparse
+field nodes (only nodes painted on the current field tick are kept; a
+dense field grid travels whole), and SoulTensorArray storage (souls come
+back as plain SoulTensors).
+"""
+
+from __future__ import annotations
+
+import io
+import pickle
+from array import array
+from dataclasses import dataclass, field, fields, replace
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Sequence, Tuple, Type
+
+from .entanglement import enroll
+from .entities import Entity
+from .field import FieldNode, FieldSystem
+from .math_utils import Quaternion, Vector3
+from .physics import PhysicsState, PhysicsWorld
+from .tensor import SoulTensor
+from .tracking import TrackedDict, TrackedList
+
+if TYPE_CHECKING:
+    from .systems import System
+    from .world import World
+
+_ATOMIC = (type(None), bool, int, float, complex, str, bytes)
+
+_ENTITY_FIELDS = frozenset(f.name for f in fields(Entity))
+# Per-entity numeric columns
+_BODY_STRIDE = 10  # px py pz vx vy vz mass f_body f_soul f_spirit
+_SOUL_STRIDE = 10  # amplitude frequency phase spin polarity coherence ow ox oy oz
+_NODE_STRIDE = 4   # w x y z field values
+
+
+class _RefPickler(pickle.Pickler):
+    """Pickles references to snapshotted entities/souls/physics/world by row."""
+
+    def __init__(self, file: io.BytesIO, refs: Dict[int, Tuple[str, int]]):
+        super().__init__(file, protocol=pickle.HIGHEST_PROTOCOL)
+        self.refs = refs
+
+    def persistent_id(self, obj: Any) -> Optional[Tuple[str, int]]:
+        return self.refs.get(id(obj))
+
+
+class _RefUnpickler(pickle.Unpickler):
+    def __init__(self, file: io.BytesIO, targets: Dict[Tuple[str, int], Any]):
+        super().__init__(file)
+        self.targets = targets
+
+    def persistent_load(self, pid: Tuple[str, int]) -> Any:
+        return self.targets[tuple(pid)]
+
+
+@dataclass
+class WorldSnapshot:
+    time: float = 0.0
+    tick: int = 0
+    stagger: Dict[int, int] = field(default_factory=dict)
+
+    # Entities (row order = world.entities order, then physics-only entities)
+    ids: List[str] = field(default_factory=list)
+    keys: List[str] = field(default_factory=list)       # world.entities keys, rows 0..len(keys)-1
+    body: array = field(default_factory=lambda: array("d"))
+    dimension: array = field(default_factory=lambda: array("q"))
+    soul_row: array = field(default_factory=lambda: array("q"))  # -1 = no soul
+    souls: array = field(default_factory=lambda: array("d"))
+    collapsed: bytearray = field(default_factory=bytearray)
+    roles: Dict[int, str] = field(default_factory=dict)
+    bonds: Dict[int, List[str]] = field(default_factory=dict)
+    classes: Dict[int, Type[Entity]] = field(default_factory=dict)
+
+    # Physics
+    has_physics: bool = False
+    physics_params: Dict[str, Any] = field(default_factory=dict)
+    array_backend: bool = False
+    active_rows: array = field(default_factory=lambda: array("q"))
+    sediment_rows: array = field(default_factory=lambda: array("q"))
+    observer_rows: array = field(default_factory=lambda: array("q"))  # LOD foci
+    field_tick: int = 0
+    field_params: Dict[str, Any] = field(default_factory=dict)
+    node_keys: List[Tuple[int, ...]] = field(default_factory=list)
+    node_values: array = field(default_factory=lambda: array("d"))
+
+    # Everything object-shaped, pickled with row references
+    objects: bytes = b""
+
+    # --- Capture ---
+
+    @classmethod
+    def capture(cls, world: World, systems: Optional[Sequence[System]] = None) -> WorldSnapshot:
+        """
+        Args:
+            world: World to flatten.
+            systems: Systems to carry (default: all of world.systems).
+        """
+        snap = cls(time=world.time, tick=world.tick, stagger=dict(world._stagger))
+        refs: Dict[int, Tuple[str, int]] = {id(world): ("world", 0)}
+
+        entities: List[Entity] = list(world.entities.values())
+        snap.keys = list(world.entities.keys())
+        physics = world.physics
+        if physics is not None:
+            refs[id(physics)] = ("physics", 0)
+            seen = {id(e) for e in entities}
+            for ent in physics.entities + physics.sediments + physics.observers:
+                if id(ent) not in seen:
+                    seen.add(id(ent))
+                    entities.append(ent)
+
+        data: Dict[int, Dict[str, Any]] = {}
+        extras: Dict[int, Dict[str, Any]] = {}
+        quantum: Dict[int, Tuple[list, list]] = {}
+        body, souls = snap.body, snap.souls
+        for row, ent in enumerate(entities):
+            refs[id(ent)] = ("entity", row)
+            snap.ids.append(ent.id)
+            p = ent.physics
+            body.extend((
+                p.position.x, p.position.y, p.position.z,
+                p.velocity.x, p.velocity.y, p.velocity.z, p.mass,
+                ent.f_body, ent.f_soul, ent.f_spirit,
+            ))
+            snap.dimension.append(ent.dimension)
+            if ent.role is not None:
+                snap.roles[row] = ent.role
+            if ent.bonds:
+                snap.bonds[row] = list(ent.bonds)
+            if ent.data:
+                data[row] = ent.data
+            if type(ent) is not Entity:
+                snap.classes[row] = type(ent)
+            extra = {k: v for k, v in ent.__dict__.items() if k not in _ENTITY_FIELDS}
+            if extra:
+                extras[row] = extra
+
+            soul = ent.soul
+            if soul is None:
+                snap.soul_row.append(-1)
+                continue
+            srow = len(snap.collapsed)
+            refs[id(soul)] = ("soul", srow)
+            snap.soul_row.append(srow)
+            o = soul.orientation
+            souls.extend((
+                soul.amplitude, soul.frequency, soul.phase, soul.spin,
+                soul.polarity, soul.coherence, o.w, o.x, o.y, o.z,
+            ))
+            snap.collapsed.append(1 if soul.is_collapsed else 0)
+            if soul.entangled_peers or soul.superposition_states or soul.entanglement is not None:
+                quantum[srow] = (soul.entangled_peers, soul.superposition_states, soul.entanglement)
+
+        extra_objects: Tuple[Any, ...] = ()
+        if physics is not None:
+            snap.has_physics = True
+            snap.array_backend = physics.state_store is not None
+            snap.physics_params = {
+                k: v for k, v in physics.__dict__.items() if isinstance(v, _ATOMIC) and v is not None
+            }
+            snap.active_rows = array("q", (refs[id(e)][1] for e in physics.entities))
+            snap.sediment_rows = array("q", (refs[id(e)][1] for e in physics.sediments))
+            snap.observer_rows = array("q", (refs[id(e)][1] for e in physics.observers))
+            snap._capture_field(physics.field_system)
+            dense_map = physics.field_system.spatial_map if physics.field_system.is_dense else None
+            extra_objects = (
+                physics.attractors, physics.holographic_boundary, physics.spacetime_torsion, dense_map,
+            )
+
+        buf = io.BytesIO()
+        _RefPickler(buf, refs).dump((
+            list(world.systems if systems is None else systems),
+            extra_objects,
+            data,
+            extras,
+            quantum,
+        ))
+        snap.objects = buf.getvalue()
+        return snap
+
+    def _capture_field(self, fs: FieldSystem) -> None:
+        self.field_tick = fs.time_tick
+        self.field_params = {"lod_levels": fs.lod_levels, "lod": fs.lod}
+        if fs.is_dense:
+            return  # The grid travels whole in `objects` (flat arrays pickle compactly)
+        smap = fs.spatial_map
+        self.field_params.update(
+            resolution_scale=smap.resolution_scale, max_age=smap.max_age, max_nodes=smap.max_nodes,
+        )
+        for key, node in smap.nodes.items():
+            if node.last_update == fs.time_tick and fs.time_tick > 0:
+                self.node_keys.append(key)
+                self.node_values.extend((node.w_field, node.x_field, node.y_field, node.z_field))
+
+    # --- Restore ---
+
+    def restore(self) -> World:
+        """Builds a fresh, independent World from the snapshot."""
+        from .world import World
+
+        world = World(time=self.time, tick=self.tick)
+        world._stagger = dict(self.stagger)
+        targets: Dict[Tuple[str, int], Any] = {("world", 0): world}
+
+        entities: List[Entity] = []
+        body, souls = self.body, self.souls
+        for row, eid in enumerate(self.ids):
+            b = row * _BODY_STRIDE
+            ent_cls = self.classes.get(row, Entity)
+            ent = ent_cls.__new__(ent_cls)
+            ent.__dict__.update(
+                id=eid,
+                physics=PhysicsState(
+                    position=Vector3(body[b], body[b + 1], body[b + 2]),
+                    velocity=Vector3(body[b + 3], body[b + 4], body[b + 5]),
+                    mass=body[b + 6],
+                ),
+                soul=None,
+                bonds=TrackedList(self.bonds.get(row, ())),
+                data=TrackedDict(),
+                role=self.roles.get(row),
+                f_body=body[b + 7],
+                f_soul=body[b + 8],
+                f_spirit=body[b + 9],
+                dimension=self.dimension[row],
+            )
+            srow = self.soul_row[row]
+            if srow >= 0:
+                s = srow * _SOUL_STRIDE
+                ent.soul = SoulTensor(
+                    amplitude=souls[s], frequency=souls[s + 1], phase=souls[s + 2],
+                    spin=souls[s + 3], polarity=souls[s + 4], coherence=souls[s + 5],
+                    orientation=Quaternion(souls[s + 6], souls[s + 7], souls[s + 8], souls[s + 9]),
+                    is_collapsed=bool(self.collapsed[srow]),
+                )
+                targets[("soul", srow)] = ent.soul
+            targets[("entity", row)] = ent
+            entities.append(ent)
+
+        world.entities = {key: entities[row] for row, key in enumerate(self.keys)}
+
+        physics: Optional[PhysicsWorld] = None
+        if self.has_physics:
+            physics = PhysicsWorld(array_backend=self.array_backend)
+            physics.__dict__.update(self.physics_params)
+            # Bulk load: array rows and the neighbour grid are built once below
+            physics.entities = [entities[r] for r in self.active_rows]
+            physics.sediments = [entities[r] for r in self.sediment_rows]
+            physics.observers = [entities[r] for r in self.observer_rows]
+            if physics.state_store is not None:
+                for ent in physics.entities + physics.sediments:
+                    physics.state_store.attach_entity(ent)
+            self._restore_field(physics.field_system)
+            physics.refresh_neighbor_index()
+            world.physics = physics
+            targets[("physics", 0)] = physics
+
+        systems, extra_objects, data, extras, quantum = _RefUnpickler(
+            io.BytesIO(self.objects), targets
+        ).load()
+
+        world.systems = systems
+        if physics is not None:
+            physics.attractors, physics.holographic_boundary, physics.spacetime_torsion, dense_map = extra_objects
+            if dense_map is not None:
+                physics.field_system.spatial_map = dense_map
+        for row, d in data.items():
+            entities[row].data = d
+        for row, extra in extras.items():
+            entities[row].__dict__.update(extra)
+        for srow, (peers, superposition, group) in quantum.items():
+            soul = targets[("soul", srow)]
+            soul.entangled_peers = peers
+            soul.superposition_states = superposition
+            if group is not None:
+                enroll(soul, group)
+        return world
+
+    def _restore_field(self, fs: FieldSystem) -> None:
+        fs.time_tick = self.field_tick
+        fs.lod_levels = self.field_params.get("lod_levels", 0)
+        lod = self.field_params.get("lod")
+        fs.lod = replace(lod, foci=list(lod.foci)) if lod is not None else None
+        smap = fs.spatial_map
+        for name in ("resolution_scale", "max_age", "max_nodes"):
+            if name in self.field_params:
+                setattr(smap, name, self.field_params[name])
+        values = self.node_values
+        for i, key in enumerate(self.node_keys):
+            v = i * _NODE_STRIDE
+            node = FieldNode(
+                coord=key[1:], depth=key[0],
+                w_field=values[v], x_field=values[v + 1], y_field=values[v + 2], z_field=values[v + 3],
+                is_leaf=key[0] >= 0,
+            )
+            smap.nodes[key] = node
+            smap.touch(node, self.field_tick)
+
+    # --- Bytes ---
+
+    def to_bytes(self) -> bytes:
+        return pickle.dumps(self, protocol=pickle.HIGHEST_PROTOCOL)
+
+    @staticmethod
+    def from_bytes(blob: bytes) -> WorldSnapshot:
+        return pickle.loads(blob)
@@ -0,0 +1,165 @@
+from __future__ import annotations
+
+import math
+from typing import Callable, Dict, Generic, Iterable, List, Optional, Sequence, Tuple, TypeVar
+
+from .math_utils import Vector3
+
+T = TypeVar("T")
+
+CellKey = Tuple[int, int, int]
+
+
+class SpatialHashGrid(Generic[T]):
+    """
+    Uniform-grid neighbour index (Cell List / Spatial Hash).
+
+    Space is cut into cubes of `cell_size`; every item lives in the bucket of
+    the cube containing its position. A radius query only visits the cubes
+    overlapping the query sphere, so proximity scans cost O(local density)
+    instead of O(N).
+
+    Items are tracked by identity (entities are unhashable dataclasses) and
+    remember their insertion sequence. Queries return candidates in that
+    order, so a scan over the grid visits neighbours in exactly the same
+    order as a linear scan over the source list would.
+    """
+
+    def __init__(self, cell_size: float, position_of: Callable[[T], Vector3]):
+        if cell_size <= 0:
+            raise ValueError("cell_size must be positive")
+        self.cell_size = cell_size
+        self.position_of = position_of
+
+        self._cells: Dict[Optional[CellKey], List[Tuple[int, T]]] = {}
+        self._slots: Dict[int, Tuple[int, Optional[CellKey]]] = {}  # id(item) -> (seq, cell)
+        self._next_seq: int = 0
+
+    def __len__(self) -> int:
+        return len(self._slots)
+
+    def __contains__(self, item: T) -> bool:
+        return id(item) in self._slots
+
+    def cell_of(self, position: Vector3) -> Optional[CellKey]:
+        """
+        Grid key of a position. Non-finite positions share the `None` bucket;
+        they can never be within a finite radius of anything.
+        """
+        return self._key(position.x, position.y, position.z)
+
+    def _key(self, x: float, y: float, z: float) -> Optional[CellKey]:
+        inv = 1.0 / self.cell_size
+        try:
+            return (math.floor(x * inv), math.floor(y * inv), math.floor(z * inv))
+        except (OverflowError, ValueError):
+            return None
+
+    def clear(self) -> None:
+        self._cells.clear()
+        self._slots.clear()
+        self._next_seq = 0
+
+    def rebuild(self, items: Iterable[T], positions: Optional[Iterable[Sequence[float]]] = None) -> None:
+        """
+        Re-buckets every item from scratch, keeping the iteration order.
+        `positions` may supply each item's (x, y, z) in the same order
+        instead of calling position_of (e.g. read in bulk from an array).
+        """
+        self.clear()
+        if positions is None:
+            for item in items:
+                self.insert(item)
+            return
+        cells, slots, key_of = self._cells, self._slots, self._key
+        seq = 0
+        for item, (x, y, z) in zip(items, positions):
+            if id(item) in slots:
+                continue  # Listed twice: keep the first slot, as insert does
+            key = key_of(x, y, z)
+            cells.setdefault(key, []).append((seq, item))
+            slots[id(item)] = (seq, key)
+            seq += 1
+        self._next_seq = seq
+
+    def insert(self, item: T) -> None:
+        if id(item) in self._slots:
+            self.relocate(item)
+            return
+        seq = self._next_seq
+        self._next_seq += 1
+        key = self.cell_of(self.position_of(item))
+        self._cells.setdefault(key, []).append((seq, item))
+        self._slots[id(item)] = (seq, key)
+
+    def remove(self, item: T) -> None:
+        slot = self._slots.pop(id(item), None)
+        if slot is None:
+            return
+        seq, key = slot
+        self._discard(key, seq)
+
+    def relocate(self, item: T) -> None:
+        """Moves an item to the cell matching its current position (O(1) amortized)."""
+        slot = self._slots.get(id(item))
+        if slot is None:
+            return
+        seq, old_key = slot
+        new_key = self.cell_of(self.position_of(item))
+        if new_key == old_key:
+            return
+        self._discard(old_key, seq)
+        self._cells.setdefault(new_key, []).append((seq, item))
+        self._slots[id(item)] = (seq, new_key)
+
+    def remapped(self, translate: Callable[[T], T]) -> SpatialHashGrid[T]:
+        """
+        Copy of the index holding `translate(item)` in place of every item,
+        with the same cells and order (used when forking a world). The
+        translated items must sit at the same positions as the originals.
+        """
+        new: SpatialHashGrid[T] = SpatialHashGrid(self.cell_size, self.position_of)
+        slots = new._slots
+        for key, bucket in self._cells.items():
+            moved = [(seq, translate(item)) for seq, item in bucket]
+            new._cells[key] = moved
+            for seq, item in moved:
+                slots[id(item)] = (seq, key)
+        new._next_seq = self._next_seq
+        return new
+
+    def neighbors(self, position: Vector3, radius: float) -> List[T]:
+        """
+        Candidates that may lie within `radius` of `position`, in insertion order.
+        Callers still apply their exact distance test; the grid only prunes.
+        """
+        center = self.cell_of(position)
+        if center is None:
+            # Distances from a non-finite point are inf/nan and never pass a radius test.
+            return []
+
+        candidates: List[Tuple[int, T]] = []
+        reach = max(1, math.ceil(radius / self.cell_size))
+        cx, cy, cz = center
+        cells = self._cells
+        for dx in range(-reach, reach + 1):
+            for dy in range(-reach, reach + 1):
+                for dz in range(-reach, reach + 1):
+                    bucket = cells.get((cx + dx, cy + dy, cz + dz))
+                    if bucket:
+                        candidates.extend(bucket)
+
+        candidates.sort(key=lambda entry: entry[0])
+        return [item for _, item in candidates]
+
+    def _discard(self, key: Optional[CellKey], seq: int) -> None:
+        bucket = self._cells.get(key)
+        if not bucket:
+            return
+        for i, (s, _) in enumerate(bucket):
+            if s == seq:
+                bucket[i] = bucket[-1]
+                bucket.pop()
+                break
+        if not bucket:
+            del self._cells[key]
@@ -1,16 +1,31 @@
 from __future__ import annotations
 from abc import ABC, abstractmethod
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Optional
 
 if TYPE_CHECKING:
+    from ..entities import Entity
     from ..world import World
 
 class System(ABC):
     """
     Abstract base class for Systems in the Elysia Engine.
     Systems contain logic that operates on the World or specific sets of Entities.
+
+    Scheduling defaults (overridable per World.add_system call):
+        tick_period: Run every N ticks; skipped dt is accumulated.
+        tick_offset: Phase within the period (None = auto-staggered).
+        tick_order: Lower runs first within a tick.
+
+    The built-in systems keep tick_period = 1: Void, Genesis and
+    FractalEvolution count steps, draw random numbers per step or act on
+    exact ticks, so a slower rate changes their results. Callers that can
+    accept that pass `period=` to World.add_system.
     """
 
+    tick_period: int = 1
+    tick_offset: Optional[int] = None
+    tick_order: int = 0
+
     @abstractmethod
     def step(self, world: World, dt: float) -> None:
         """
@@ -18,6 +33,12 @@ class System(ABC):
         """
         pass
 
+    def on_entity_removed(self, world: World, entity: Entity) -> None:
+        """
+        Called by World.remove_entity after the entity left the world.
+        Systems keeping per-entity state drop it here, in O(1).
+        """
+
 # Optional helper systems
 try:
     from .spacetime import SpacetimeOrchestrator  # noqa: F401
@@ -13,13 +13,16 @@ Reference: Original Elysia fractal consciousness model
 from __future__ import annotations
 
 import math
-from typing import TYPE_CHECKING, Dict, List, Optional, Set
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Set, Tuple
 
 from ..systems import System
+from ..tensor import axis_writes
+from ..tracking import version_of
 
 if TYPE_CHECKING:
     from ..world import World
     from ..entities import Entity
+    from ..tensor import SoulTensor
 
 
 class DimensionalState:
@@ -102,40 +105,130 @@ class FractalEvolutionSystem(System):
         self.experience_per_dim = experience_per_dimension
         
         # Tracking
-        self._experience: Dict[str, int] = {}  # entity_id -> experience ticks
         self._evolution_events: List[dict] = []
+        
+        # Evolution check queue. Experience is the number of steps since the
+        # entity was first seen, so it needs no per-tick counter; an entity is
+        # re-checked only when its blocking requirement can have changed.
+        self._clock: int = 0  # Steps run so far
+        self._born: Dict[str, int] = {}  # entity_id -> clock before first sight
+        self._due: Dict[int, List[str]] = {}  # clock -> entity_ids to check at that step
+        # Blocked on state, entity_id -> (entity, watched value); woken when it changes
+        self._low_energy: Dict[str, Tuple[Entity, SoulTensor]] = {}  # Woken once amplitude reaches the minimum
+        self._waiting: Dict[str, Tuple[Optional[Entity], Any]] = {}  # Bonds, collapse, dimension (see _watch_key)
+        self._out_of_tune: Set[str] = set()  # Resonance-blocked; in _waiting, also woken by axis writes
+        self._entities_version: Optional[int] = None  # world.entities version last scanned
+        self._axes_stamp: Optional[Tuple[int, Optional[int]]] = None  # (axis_writes, entities version) last scanned
 
     def step(self, world: World, dt: float) -> None:
-        """Execute evolution checks for all entities."""
-        for entity in world.entities.values():
-            if entity.soul is None:
-                continue
-            
-            # Accumulate experience
-            entity_id = entity.id
-            self._experience[entity_id] = self._experience.get(entity_id, 0) + 1
-            
-            # Check for evolution opportunity
-            self._check_evolution(entity, world)
-
-    def _check_evolution(self, entity: Entity, world: World) -> None:
-        """Check if an entity should evolve to a higher dimension."""
-        if entity.soul is None:
-            return
-        
-        current_dim = entity.dimension
-        next_dim = current_dim + 1
-        
-        # Maximum dimension
-        if next_dim > DimensionalState.HYPERVOLUME:
-            return
-        
-        # Check requirements
-        if not self._meets_requirements(entity, next_dim, world):
-            return
+        """
+        Execute evolution checks for entities whose requirements may have changed.
         
-        # Evolve!
-        self._evolve(entity, next_dim, world)
+        Energy and resonance blocks are re-checked only on steps after a soul
+        axis was written (tensor.axis_writes) or membership changed; in a
+        world whose uncollapsed souls advance every tick that is every step.
+        Bonds, collapse and dimension blocks are polled: a few attribute
+        reads per blocked entity per step, but no requirement check.
+        """
+        self._clock += 1
+        clock = self._clock
+        entities = world.entities
+        
+        # New entities: experience starts now, first check this step
+        version = version_of(entities)
+        members_changed = version is None or version != self._entities_version
+        if members_changed:
+            self._entities_version = version
+            born = self._born
+            fresh = [entity_id for entity_id in entities if entity_id not in born]
+            for entity_id in fresh:
+                born[entity_id] = clock - 1
+            if fresh:
+                self._due.setdefault(clock, []).extend(fresh)
+        
+        # Amplitude, phase and polarity writes and soul swaps all count as axis
+        # writes: without any, no energy or resonance block can have lifted
+        stamp = (axis_writes(), version)
+        axes_moved = members_changed or stamp != self._axes_stamp
+        self._axes_stamp = stamp
+        woken: List[str] = []
+        if axes_moved:
+            min_amplitude = self.min_amplitude
+            woken = [
+                entity_id for entity_id, (entity, soul) in self._low_energy.items()
+                if entity.soul is not soul or soul.amplitude >= min_amplitude
+                or (members_changed and entities.get(entity_id) is not entity)
+            ]
+        out_of_tune = self._out_of_tune if axes_moved else ()
+        woken += [
+            entity_id for entity_id, (entity, key) in self._waiting.items()
+            if entity_id in out_of_tune
+            or (members_changed and entities.get(entity_id) is not entity) or self._watch_key(entity) != key
+        ]
+        for entity_id in woken:
+            if self._low_energy.pop(entity_id, None) is None:
+                del self._waiting[entity_id]
+                self._out_of_tune.discard(entity_id)
+            self._check_evolution(entity_id, world)
+        
+        # Scheduled: experience thresholds and follow-up checks
+        for entity_id in self._due.pop(clock, ()):
+            self._check_evolution(entity_id, world)
+
+    def on_entity_removed(self, world: World, entity: Entity) -> None:
+        # Pending _due entries are skipped when they come up (see _check_evolution)
+        self._born.pop(entity.id, None)
+        self._low_energy.pop(entity.id, None)
+        self._waiting.pop(entity.id, None)
+        self._out_of_tune.discard(entity.id)
+
+    def experience(self, entity_id: str) -> int:
+        """Steps the entity has been seen by this system."""
+        born = self._born.get(entity_id)
+        return 0 if born is None else self._clock - born
+
+    @staticmethod
+    def _watch_key(entity: Optional[Entity]) -> Optional[Tuple[Any, ...]]:
+        """
+        The state a bonds/collapse/dimension-blocked entity waits on.
+        Amplitude is left out: a drop can only add a block.
+        """
+        if entity is None:
+            return None
+        soul = entity.soul
+        collapsed = soul is not None and soul.is_collapsed
+        return (soul, collapsed, entity.bonds.version, entity.dimension)
+
+    def _check_evolution(self, entity_id: str, world: World) -> None:
+        """Check if an entity should evolve to a higher dimension, and schedule its next check."""
+        entity = world.entities.get(entity_id)
+        if entity is None:
+            if entity_id in self._born:
+                self._waiting[entity_id] = (None, None)  # Left the world; re-checked if it comes back
+            return  # Else removed through World.remove_entity: a stale queue entry
+        
+        next_dim = entity.dimension + 1
+        if entity.soul is None or next_dim > DimensionalState.HYPERVOLUME:
+            blocker = "dimension"
+        else:
+            blocker = self._blocking_requirement(entity, next_dim, world)
+        
+        if blocker is None:
+            # Evolve! The next dimension is considered from the next step on
+            self._evolve(entity, next_dim, world)
+            self._schedule(entity_id, self._clock + 1)
+        elif blocker == "experience":
+            self._schedule(entity_id, self._born[entity_id] + self.experience_per_dim * next_dim)
+        elif blocker == "energy":
+            self._low_energy[entity_id] = (entity, entity.soul)
+        else:
+            # Resonance also depends on the bonded souls' phases: any axis write wakes it
+            self._waiting[entity_id] = (entity, self._watch_key(entity))
+            if blocker == "resonance":
+                self._out_of_tune.add(entity_id)
+
+    def _schedule(self, entity_id: str, clock: int) -> None:
+        self._due.setdefault(clock, []).append(entity_id)
 
     def _meets_requirements(
         self, 
@@ -144,25 +237,32 @@ class FractalEvolutionSystem(System):
         world: World
     ) -> bool:
         """Check if entity meets requirements for target dimension."""
+        return entity.soul is not None and self._blocking_requirement(entity, target_dim, world) is None
+
+    def _blocking_requirement(
+        self,
+        entity: Entity,
+        target_dim: int,
+        world: World
+    ) -> Optional[str]:
+        """The first requirement the entity fails for target dimension, or None."""
         soul = entity.soul
-        if soul is None:
-            return False
         
         # 1. Energy requirement
         if soul.amplitude < self.min_amplitude:
-            return False
+            return "energy"
         
         # 2. Experience requirement
-        exp = self._experience.get(entity.id, 0)
+        exp = self.experience(entity.id)
         required_exp = self.experience_per_dim * target_dim
         if exp < required_exp:
-            return False
+            return "experience"
         
         # 3. Bond requirement
         bond_count = len(entity.bonds)
         required_bonds = self.bond_thresholds.get(target_dim, target_dim)
         if bond_count < required_bonds:
-            return False
+            return "bonds"
         
         # 4. Resonance quality check (average resonance with bonded entities)
         if entity.bonds:
@@ -177,20 +277,19 @@ class FractalEvolutionSystem(System):
                 if other.soul is None:
                     continue
                 
-                res_data = soul.resonate(other.soul)
-                total_resonance += res_data["resonance"]
+                total_resonance += soul.resonance_value(other.soul)
                 valid_bonds += 1
             
             if valid_bonds > 0:
                 avg_resonance = total_resonance / valid_bonds
                 if avg_resonance < self.resonance_threshold:
-                    return False
+                    return "resonance"
         
         # 5. Collapsed souls cannot evolve to higher dimensions
         if soul.is_collapsed and target_dim > DimensionalState.LINE:
-            return False
+            return "collapsed"
         
-        return True
+        return None
 
     def _evolve(self, entity: Entity, target_dim: int, world: World) -> None:
         """Execute the dimensional evolution."""
@@ -334,32 +433,8 @@ class CosmicResonanceField:
         Returns:
             Dictionary with field properties
         """
-        if not world.entities:
-            return {
-                "harmony": 0.0,
-                "discord": 0.0,
-                "collective_frequency": self.base_frequency,
-                "collective_phase": 0.0,
-                "coherence": 0.0,
-            }
-        
-        total_freq = 0.0
-        total_amp = 0.0
-        phase_x = 0.0
-        phase_y = 0.0
-        count = 0
-        
-        for entity in world.entities.values():
-            if entity.soul is None:
-                continue
-            
-            count += 1
-            total_freq += entity.soul.frequency
-            total_amp += entity.soul.amplitude
-            
-            # Convert phase to unit vector for averaging
-            phase_x += math.cos(entity.soul.phase)
-            phase_y += math.sin(entity.soul.phase)
+        totals = world.soul_totals()
+        count = totals.count
         
         if count == 0:
             return {
@@ -371,11 +446,11 @@ class CosmicResonanceField:
             }
         
         # Average frequency
-        avg_freq = total_freq / count
+        avg_freq = totals.frequency_sum / count
         
         # Collective phase (average of unit vectors)
-        phase_x /= count
-        phase_y /= count
+        phase_x = totals.cos_sum / count
+        phase_y = totals.sin_sum / count
         collective_phase = math.atan2(phase_y, phase_x)
         
         # Coherence (magnitude of average phase vector)
@@ -400,7 +475,7 @@ class CosmicResonanceField:
             "collective_phase": collective_phase,
             "coherence": coherence,
             "entity_count": count,
-            "total_amplitude": total_amp,
+            "total_amplitude": totals.amplitude_sum,
         }
 
     def broadcast_pulse(self, world: World, intensity: float = 1.0) -> int:
@@ -11,13 +11,15 @@ Reference: AGENTS.md - GenesisSystem: Replication via Tensor Coils
 
 from __future__ import annotations
 
+import heapq
 import math
 import random
-from typing import TYPE_CHECKING, List, Optional
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
 
 from ..systems import System
 from ..tensor import SoulTensor
 from ..math_utils import Vector3
+from ..spatial import SpatialHashGrid
 
 if TYPE_CHECKING:
     from ..world import World
@@ -62,28 +64,43 @@ class GenesisSystem(System):
         
         # Tracking
         self._last_replication: dict = {}  # entity_id -> last replication tick
+        # Cooldown timing queue: (ready tick, entity_id) heap + entity_id -> ready tick
+        self._cooldowns: List[Tuple[int, str]] = []
+        self._cooling: Dict[str, int] = {}
         self.total_births: int = 0
         self.total_mutations: int = 0
 
     def step(self, world: World, dt: float) -> None:
-        """Execute genesis operations."""
+        """
+        Execute genesis operations.
+
+        Parent pairs are tried in eligible-list order (i < j), as a full
+        pair scan would; partners for each parent come from a spatial hash
+        of the eligible set with `replication_distance` cells.
+        """
         new_entities: List[Entity] = []
         
         # Get eligible parents
         eligible = self._get_eligible_parents(world)
+        if len(eligible) < 2:
+            return
+        order = {id(entity): i for i, entity in enumerate(eligible)}
+        grid: SpatialHashGrid[Entity] = SpatialHashGrid(
+            max(self.replication_distance, 1e-6), lambda e: e.physics.position
+        )
+        grid.rebuild(eligible)
         
         # Check for replication opportunities
-        for i in range(len(eligible)):
+        for i, parent1 in enumerate(eligible):
             if len(new_entities) >= self.max_offspring_per_tick:
                 break
-                
-            parent1 = eligible[i]
             
-            for j in range(i + 1, len(eligible)):
+            # Candidates come back in eligible order
+            for parent2 in grid.neighbors(parent1.physics.position, self.replication_distance):
                 if len(new_entities) >= self.max_offspring_per_tick:
                     break
-                    
-                parent2 = eligible[j]
+                if order[id(parent2)] <= i:
+                    continue
                 
                 # Check distance
                 dist = (
@@ -94,43 +111,64 @@ class GenesisSystem(System):
                     continue
                 
                 # Check resonance
-                if parent1.soul and parent2.soul:
-                    resonance_data = parent1.soul.resonate(parent2.soul)
-                    
-                    if resonance_data["resonance"] >= self.replication_resonance_threshold:
-                        child = self._create_offspring(
-                            world, parent1, parent2, resonance_data
-                        )
-                        if child:
-                            new_entities.append(child)
-                            self._last_replication[parent1.id] = world.tick
-                            self._last_replication[parent2.id] = world.tick
+                resonance = parent1.soul.resonance_value(parent2.soul)
+                
+                if resonance >= self.replication_resonance_threshold:
+                    child = self._create_offspring(
+                        world, parent1, parent2, resonance
+                    )
+                    if child:
+                        new_entities.append(child)
+                        self._record_replication(parent1, world.tick)
+                        self._record_replication(parent2, world.tick)
         
         # Add new entities to world
-        for entity in new_entities:
-            world.add_entity(entity)
-            if world.physics:
-                world.physics.register_entity(entity)
+        world.add_entities(new_entities)
+
+    def on_entity_removed(self, world: World, entity: Entity) -> None:
+        # Its cooldown heap entry no longer matches _cooling and is skipped
+        self._last_replication.pop(entity.id, None)
+        self._cooling.pop(entity.id, None)
+
+    def _record_replication(self, entity: Entity, tick: int) -> None:
+        """Starts the entity's cooldown; it re-enters the eligible set when the queue releases it."""
+        self._last_replication[entity.id] = tick
+        ready = tick + self.replication_cooldown
+        self._cooling[entity.id] = ready
+        heapq.heappush(self._cooldowns, (ready, entity.id))
+
+    def _release_cooldowns(self, tick: int) -> None:
+        """Pops every cooldown that has expired by `tick`."""
+        cooldowns, cooling = self._cooldowns, self._cooling
+        while cooldowns and cooldowns[0][0] <= tick:
+            ready, entity_id = heapq.heappop(cooldowns)
+            if cooling.get(entity_id) == ready:  # Else superseded by a later replication
+                del cooling[entity_id]
 
     def _get_eligible_parents(self, world: World) -> List[Entity]:
         """Get entities eligible for replication."""
+        # Entities that never replicated count from tick 0
+        if world.tick < self.replication_cooldown:
+            return []
+        self._release_cooldowns(world.tick)
+        cooling = self._cooling
         eligible = []
         
         for entity in world.entities.values():
-            if entity.soul is None:
+            soul = entity.soul
+            if soul is None:
                 continue
             
             # Must not be collapsed (frozen souls can't reproduce)
-            if entity.soul.is_collapsed:
+            if soul.is_collapsed:
                 continue
             
             # Must have sufficient energy
-            if entity.soul.amplitude < 10.0:
+            if soul.amplitude < 10.0:
                 continue
             
             # Check cooldown
-            last_rep = self._last_replication.get(entity.id, 0)
-            if world.tick - last_rep < self.replication_cooldown:
+            if entity.id in cooling:
                 continue
             
             eligible.append(entity)
@@ -142,7 +180,7 @@ class GenesisSystem(System):
         world: World,
         parent1: Entity,
         parent2: Entity,
-        resonance_data: dict,
+        resonance: float,
     ) -> Optional[Entity]:
         """
         Create a new entity from two parent entities.
@@ -161,8 +199,6 @@ class GenesisSystem(System):
         child_id = f"genesis_{world.tick}_{self.total_births}"
         
         # Calculate inherited traits
-        resonance = resonance_data["resonance"]
-        
         # Amplitude: Combination of parents, scaled by resonance
         child_amplitude = (
             (p1_soul.amplitude + p2_soul.amplitude) * 0.4 * resonance
@@ -13,14 +13,29 @@ Reference: AGENTS.md - ThermodynamicsSystem: State changes (Plasma -> Crystal)
 from __future__ import annotations
 
 import math
-from typing import TYPE_CHECKING, List, Optional
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
 
 from ..systems import System
 from ..tensor import SoulTensor
 
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - exercised only without numpy
+    np = None
+
 if TYPE_CHECKING:
     from ..world import World
     from ..entities import Entity
+    from ..math_utils import Vector3
+
+CellKey = Tuple[int, int, int]
+
+# Half of the 26 neighbouring cells, so each adjacent cell pair is visited once
+_FORWARD_CELLS = [
+    (dx, dy, dz)
+    for dx in (-1, 0, 1) for dy in (-1, 0, 1) for dz in (-1, 0, 1)
+    if (dx, dy, dz) > (0, 0, 0)
+]
 
 
 class ThermalState:
@@ -58,6 +73,17 @@ class ThermalState:
             return ThermalState.FROZEN
 
 
+def _dense_axis(cells: np.ndarray) -> np.ndarray:
+    """
+    Integer cell coordinates (given as floats) ranked from 1, keeping
+    neighbours adjacent and putting one empty cell in every wider gap.
+    """
+    occupied, inverse = np.unique(cells, return_inverse=True)
+    steps = np.minimum(np.diff(occupied), 2).astype(np.int64)
+    ranks = np.concatenate((np.ones(1, dtype=np.int64), 1 + np.cumsum(steps)))
+    return ranks[inverse.reshape(-1)]
+
+
 class ThermodynamicsSystem(System):
     """
     Manages thermal state transitions and energy flow between entities.
@@ -137,56 +163,97 @@ class ThermodynamicsSystem(System):
         
         Heat flows from high-frequency to low-frequency souls,
         following the second law of thermodynamics.
+
+        Every transfer is computed from the frequencies at the start of the
+        call (no order dependency), then applied pair by pair in (i, j)
+        order. Candidate pairs come from a cell list of `interaction_radius`
+        cubes, so only souls in neighbouring cells are compared.
         """
-        n = len(entities)
-        if n < 2:
+        active = [e for e in entities if not e.soul.is_collapsed]
+        if len(active) < 2:
             return
-        
+
+        positions = [e.physics.position for e in active]
+        souls = [e.soul for e in active]
+        if np is None:
+            self._transfer_pairs(souls, positions, self._candidate_pairs(positions), dt)
+            return
+
+        first, second = self._candidate_arrays(positions)
+        if not len(first):
+            return
+        pos = np.array([(p.x, p.y, p.z) for p in positions], dtype=np.float64)
+        freq = np.array([s.frequency for s in souls], dtype=np.float64)
+        phase = np.array([s.phase for s in souls], dtype=np.float64)
+
+        # Same per-pair math (and operation order) as _transfer_pairs
+        delta = pos[first] - pos[second]
+        dist = np.sqrt(delta[:, 0] ** 2 + delta[:, 1] ** 2 + delta[:, 2] ** 2)
+        freq_diff = freq[first] - freq[second]
+        phase_diff = np.abs(phase[first] - phase[second])
+        phase_diff = np.where(phase_diff > math.pi, 2 * math.pi - phase_diff, phase_diff)
+        resonance = np.cos(phase_diff)
+        keep = np.flatnonzero((dist <= self.interaction_radius) & (np.abs(freq_diff) >= 0.1) & (resonance > 0))
+        if not len(keep):
+            return
+        keep = keep[np.lexsort((second[keep], first[keep]))]  # (i, j) order
+
+        transfer_amount = (
+            freq_diff[keep] * self.heat_transfer_rate * (1.0 / (1.0 + dist[keep])) * resonance[keep] * dt
+        )
+        half = transfer_amount * 0.5
+        # Donor, receiver, donor, receiver, ... : np.add.at accumulates in
+        # this order, exactly like the sequential per-pair updates
+        rows = np.empty(2 * len(half), dtype=np.intp)
+        rows[0::2], rows[1::2] = first[keep], second[keep]
+        amounts = np.empty(2 * len(half), dtype=np.float64)
+        amounts[0::2], amounts[1::2] = -half, half
+        np.add.at(freq, rows, amounts)
+        for row in np.unique(rows):
+            souls[row].frequency = float(freq[row])
+
+    def _transfer_pairs(
+        self, souls: List[SoulTensor], positions: List[Vector3], pairs: List[Tuple[int, int]], dt: float
+    ) -> None:
+        """Pure-Python heat transfer over candidate pairs (used without numpy)."""
         # Calculate heat transfers (don't apply immediately to avoid order dependency)
         transfers: List[tuple] = []
         
-        for i in range(n):
-            e1 = entities[i]
-            if e1.soul.is_collapsed:
+        for i, j in pairs:
+            s1, s2 = souls[i], souls[j]
+            
+            # Check distance
+            dist = (positions[i] - positions[j]).magnitude
+            if dist > self.interaction_radius:
+                continue
+            
+            # Heat flows from hot to cold
+            freq_diff = s1.frequency - s2.frequency
+            if abs(freq_diff) < 0.1:
+                continue
+            
+            # Transfer rate decreases with distance
+            distance_factor = 1.0 / (1.0 + dist)
+            
+            # Phase alignment affects heat transfer (resonance)
+            phase_diff = abs(s1.phase - s2.phase)
+            if phase_diff > math.pi:
+                phase_diff = 2 * math.pi - phase_diff
+            resonance = math.cos(phase_diff)  # -1 to 1
+            
+            # Only transfer if resonance is positive (aligned phases)
+            if resonance <= 0:
                 continue
-                
-            for j in range(i + 1, n):
-                e2 = entities[j]
-                if e2.soul.is_collapsed:
-                    continue
-                
-                # Check distance
-                dist = (e1.physics.position - e2.physics.position).magnitude
-                if dist > self.interaction_radius:
-                    continue
-                
-                # Heat flows from hot to cold
-                freq_diff = e1.soul.frequency - e2.soul.frequency
-                if abs(freq_diff) < 0.1:
-                    continue
-                
-                # Transfer rate decreases with distance
-                distance_factor = 1.0 / (1.0 + dist)
-                
-                # Phase alignment affects heat transfer (resonance)
-                phase_diff = abs(e1.soul.phase - e2.soul.phase)
-                if phase_diff > math.pi:
-                    phase_diff = 2 * math.pi - phase_diff
-                resonance = math.cos(phase_diff)  # -1 to 1
-                
-                # Only transfer if resonance is positive (aligned phases)
-                if resonance <= 0:
-                    continue
-                
-                transfer_amount = (
-                    freq_diff * 
-                    self.heat_transfer_rate * 
-                    distance_factor * 
-                    resonance * 
-                    dt
-                )
-                
-                transfers.append((e1.soul, e2.soul, transfer_amount))
+            
+            transfer_amount = (
+                freq_diff * 
+                self.heat_transfer_rate * 
+                distance_factor * 
+                resonance * 
+                dt
+            )
+            
+            transfers.append((s1, s2, transfer_amount))
         
         # Apply transfers
         for soul1, soul2, amount in transfers:
@@ -194,6 +261,90 @@ class ThermodynamicsSystem(System):
             soul2.frequency += amount * 0.5  # Receiver gains half
             # Energy is partially lost to the universe (entropy)
 
+    def _cells(self, positions: List[Vector3]) -> Dict[CellKey, List[int]]:
+        """Buckets position indices (ascending) into `interaction_radius` cubes."""
+        size = self.interaction_radius if self.interaction_radius > 0 else 1.0
+        cells: Dict[CellKey, List[int]] = {}
+        for index, p in enumerate(positions):
+            try:
+                key = (math.floor(p.x / size), math.floor(p.y / size), math.floor(p.z / size))
+            except (OverflowError, ValueError):
+                continue  # Non-finite: never within a finite radius
+            cells.setdefault(key, []).append(index)
+        return cells
+
+    def _candidate_pairs(self, positions: List[Vector3]) -> List[Tuple[int, int]]:
+        """Index pairs i < j in the same or adjacent cells, sorted."""
+        cells = self._cells(positions)
+        pairs: List[Tuple[int, int]] = []
+        for (cx, cy, cz), members in cells.items():
+            for a, i in enumerate(members):
+                for j in members[a + 1:]:
+                    pairs.append((i, j))
+            for dx, dy, dz in _FORWARD_CELLS:
+                other = cells.get((cx + dx, cy + dy, cz + dz))
+                if other:
+                    for i in members:
+                        for j in other:
+                            pairs.append((i, j) if i < j else (j, i))
+        pairs.sort()
+        return pairs
+
+    def _candidate_arrays(self, positions: List[Vector3]) -> Tuple[np.ndarray, np.ndarray]:
+        """`_candidate_pairs` as two index arrays (first < second, unsorted), built without per-cell loops."""
+        size = self.interaction_radius if self.interaction_radius > 0 else 1.0
+        pos = np.array([(p.x, p.y, p.z) for p in positions], dtype=np.float64)
+        with np.errstate(invalid="ignore", over="ignore"):
+            scaled = np.floor(pos / size)
+        finite = np.flatnonzero(np.isfinite(scaled).all(axis=1))  # Non-finite: never within a finite radius
+        empty = np.empty(0, dtype=np.intp)
+        if len(finite) < 2:
+            return empty, empty
+
+        # Cells as dense codes on the occupied box (one-cell margin for neighbour lookups).
+        # Each axis is ranked over its occupied cells first, gaps wider than one
+        # cell shrinking to one, so far-apart clusters neither overflow int64
+        # nor become adjacent.
+        keys = np.column_stack([_dense_axis(scaled[finite, axis]) for axis in range(3)])
+        dims = keys.max(axis=0) + 2
+        if int(dims[0]) * int(dims[1]) * int(dims[2]) > np.iinfo(np.int64).max:
+            pairs = np.array(self._candidate_pairs(positions), dtype=np.intp).reshape(-1, 2)
+            return pairs[:, 0], pairs[:, 1]
+        codes = (keys[:, 0] * dims[1] + keys[:, 1]) * dims[2] + keys[:, 2]
+        order = np.argsort(codes, kind="stable")
+        members = finite[order]  # Point indices grouped by cell, ascending within a cell
+        cell_codes, starts, counts = np.unique(codes[order], return_index=True, return_counts=True)
+
+        firsts: List[np.ndarray] = []
+        seconds: List[np.ndarray] = []
+        for dx, dy, dz in [(0, 0, 0)] + _FORWARD_CELLS:
+            target = cell_codes + (dx * dims[1] + dy) * dims[2] + dz
+            at = np.minimum(np.searchsorted(cell_codes, target), len(cell_codes) - 1)
+            a = np.flatnonzero(cell_codes[at] == target)
+            b = at[a]
+            width = counts[b]
+            block = counts[a] * width
+            total = int(block.sum())
+            if not total:
+                continue
+            local = np.arange(total) - np.repeat(np.cumsum(block) - block, block)
+            width = np.repeat(width, block)
+            row, col = local // width, local % width
+            if (dx, dy, dz) == (0, 0, 0):
+                keep = row < col
+                row, col = row[keep], col[keep]
+                a_rep = np.repeat(starts[a], block)[keep]
+                b_rep = np.repeat(starts[b], block)[keep]
+            else:
+                a_rep = np.repeat(starts[a], block)
+                b_rep = np.repeat(starts[b], block)
+            firsts.append(members[a_rep + row])
+            seconds.append(members[b_rep + col])
+        if not firsts:
+            return empty, empty
+        i, j = np.concatenate(firsts), np.concatenate(seconds)
+        return np.minimum(i, j), np.maximum(i, j)
+
     def _check_state_transition(self, entity: Entity) -> None:
         """
         Check and apply state transitions based on thermal state.
@@ -12,7 +12,7 @@ Reference: AGENTS.md - VoidSystem: Entropy and cleanup
 from __future__ import annotations
 
 import random
-from typing import TYPE_CHECKING, List, Optional, Set
+from typing import TYPE_CHECKING, Dict, Optional, Set
 
 from ..systems import System
 from ..tensor import SoulTensor
@@ -61,61 +61,54 @@ class VoidSystem(System):
         self.void_births: int = 0
         
         # Activity tracking
-        self._last_activity: dict = {}  # entity_id -> last active tick
+        self._last_activity: Dict[str, int] = {}  # entity_id -> last active tick
         
         # Minimum velocity to be considered "active" (not dormant)
         self._activity_velocity_threshold: float = 0.01
 
     def step(self, world: World, dt: float) -> None:
         """Execute void operations."""
-        # 1. Track activity
-        self._track_activity(world)
-        
-        # 2. Identify entities for cleanup
+        # 1. Track activity and identify entities for cleanup (one pass)
         to_remove = self._identify_for_cleanup(world)
         
-        # 3. Absorb into void (recycle energy)
+        # 2. Absorb into void (recycle energy)
         for entity_id in to_remove:
             self._absorb(world, entity_id)
         
-        # 4. Spontaneous emergence (vacuum fluctuation)
+        # 3. Spontaneous emergence (vacuum fluctuation)
         if random.random() < self.spontaneous_emergence_rate:
             self._vacuum_fluctuation(world)
 
-    def _track_activity(self, world: World) -> None:
-        """Track when entities were last active."""
-        for entity_id, entity in world.entities.items():
-            if entity.soul is None:
-                continue
-            
-            # Activity defined as: non-zero velocity OR non-collapsed
-            # Entities with velocity above threshold are considered moving
-            is_active = (
-                entity.physics.velocity.magnitude > self._activity_velocity_threshold or
-                not entity.soul.is_collapsed
-            )
-            
-            if is_active:
-                self._last_activity[entity_id] = world.tick
-
     def _identify_for_cleanup(self, world: World) -> Set[str]:
-        """Identify entities that should be absorbed into the void."""
+        """
+        Records activity and identifies entities that should be absorbed
+        into the void. Depletion and dormancy are both read from the state
+        every soul is in now, so this stays a single pass over the world.
+        """
         to_remove = set()
+        tick = world.tick
+        last_activity = self._last_activity
+        threshold = self.cleanup_threshold
+        min_speed = self._activity_velocity_threshold
         
         for entity_id, entity in world.entities.items():
-            if entity.soul is None:
+            soul = entity.soul
+            if soul is None:
                 continue
             
+            # Activity defined as: non-collapsed OR velocity above threshold
+            if not soul.is_collapsed or entity.physics.velocity.magnitude > min_speed:
+                last_activity[entity_id] = tick
+            
             should_remove = False
             
             # 1. Amplitude below threshold (energy depleted)
-            if entity.soul.amplitude < self.cleanup_threshold:
+            if soul.amplitude < threshold:
                 should_remove = True
                 entity.data["void_reason"] = "energy_depleted"
             
             # 2. Dormant for too long
-            last_active = self._last_activity.get(entity_id, world.tick)
-            if world.tick - last_active > self.dormancy_ticks:
+            if tick - last_activity.get(entity_id, tick) > self.dormancy_ticks:
                 should_remove = True
                 entity.data["void_reason"] = "dormancy"
             
@@ -147,12 +140,11 @@ class VoidSystem(System):
             # Log the absorption
             self.entities_absorbed += 1
         
-        # Remove from world
-        del world.entities[entity_id]
-        
-        # Clean up tracking
-        if entity_id in self._last_activity:
-            del self._last_activity[entity_id]
+        # Remove from world (on_entity_removed clears the tracking)
+        world.remove_entity(entity_id)
+
+    def on_entity_removed(self, world: World, entity: Entity) -> None:
+        self._last_activity.pop(entity.id, None)
 
     def _vacuum_fluctuation(self, world: World) -> Optional[Entity]:
         """
@@ -211,7 +203,12 @@ class VoidSystem(System):
         return entity
 
     def get_void_statistics(self) -> dict:
-        """Get statistics about void operations."""
+        """
+        Get statistics about void operations.
+        
+        `tracked_entities` counts entities still in the world that the void
+        has seen active at least once.
+        """
         return {
             "recycled_energy": self.recycled_energy,
             "entities_absorbed": self.entities_absorbed,
@@ -267,12 +264,10 @@ class VoidSystem(System):
         base_entropy = total_disorder / count
         
         # Bonus entropy from activity tracking
-        if self._last_activity:
-            dormant_count = sum(
-                1 for eid in self._last_activity
-                if world.tick - self._last_activity[eid] > 10
-            )
-            dormancy_factor = dormant_count / len(self._last_activity)
+        tracked = self._last_activity
+        if tracked:
+            dormant_count = sum(1 for last in tracked.values() if world.tick - last > 10)
+            dormancy_factor = dormant_count / len(tracked)
             base_entropy = base_entropy * 0.7 + dormancy_factor * 0.3
         
         return min(1.0, max(0.0, base_entropy))
@@ -2,10 +2,30 @@ from __future__ import annotations
 
 import math
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional, Tuple
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Sequence, Tuple
 
 from elysia_engine.math_utils import Quaternion
 
+if TYPE_CHECKING:
+    from elysia_engine.entanglement import EntanglementGroup
+
+TWO_PI = 2 * math.pi
+
+# Axes summed by World.soul_totals or read by resonance_value; writes to them are counted process-wide
+_AGGREGATED_AXES = frozenset(("amplitude", "frequency", "phase", "polarity"))
+_axis_writes = 0
+
+
+def axis_writes() -> int:
+    """Number of amplitude/frequency/phase/polarity writes so far, across all souls."""
+    return _axis_writes
+
+
+def note_axis_write() -> None:
+    """Counts an axis change made outside SoulTensor attributes (array rows, group slots)."""
+    global _axis_writes
+    _axis_writes += 1
+
 
 @dataclass
 class SoulTensor:
@@ -47,8 +67,23 @@ class SoulTensor:
     coherence: float = 1.0 # Quantum coherence (1.0 = pure quantum, 0.0 = classical)
 
     # Quantum Properties
-    entangled_peers: List[SoulTensor] = field(default_factory=list, repr=False)
+    # Direct entanglement links (the group, transitively, is `entanglement`)
+    entangled_peers: List[SoulTensor] = field(default_factory=list, repr=False, compare=False)
     superposition_states: List[Tuple[SoulTensor, float]] = field(default_factory=list, repr=False)
+    entanglement: Optional[EntanglementGroup] = field(default=None, repr=False, compare=False)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        if name in _AGGREGATED_AXES:
+            global _axis_writes
+            _axis_writes += 1
+        elif name == "is_collapsed" and value:
+            # An entangled soul keeps the group phase it had when it collapsed
+            # (array handles keep is_collapsed in their store and lock it there)
+            d = self.__dict__
+            group = d.get("entanglement")
+            if group is not None and not d.get("is_collapsed", True):
+                d["phase"] = group.find().phase
+        object.__setattr__(self, name, value)
 
     def step(self, dt: float) -> None:
         """
@@ -62,36 +97,33 @@ class SoulTensor:
             return
 
         delta = self.frequency * dt
-        self.phase += delta
-        self.phase %= (2 * math.pi)
+        self.phase = (self.phase + delta) % TWO_PI
         
         # Decoherence: quantum states slowly become classical
         # Rate depends on amplitude (more mass = faster decoherence)
         decoherence_rate = 0.001 * (1 + self.amplitude * 0.01)
         self.coherence = max(0.0, self.coherence - decoherence_rate * dt)
 
-        # Propagate phase change to entangled peers (instant action at a distance)
-        # We only push the delta to avoid infinite recursion loops if bidirectional
-        # Simplification: Only the driver updates peers? Or shared state?
-        # Better approach: Shared reference? No, Python dataclass.
-        # We just iterate and apply.
-        for peer in self.entangled_peers:
-            if not peer.is_collapsed:
-                peer.phase = self.phase
+        # Entangled peers need no push (instant action at a distance):
+        # the phase above was written to the group's shared slot.
 
     def entangle(self, other: 'SoulTensor') -> None:
         """
         Quantum Entanglement: Links the phase of two souls.
+        Both take the mean of their phases; their groups merge and share
+        one phase slot from then on (see entanglement.py).
         """
-        if other not in self.entangled_peers:
+        from elysia_engine.entanglement import link
+
+        if link(self, other):
             self.entangled_peers.append(other)
-        if self not in other.entangled_peers:
             other.entangled_peers.append(self)
 
-        # Synchronize immediately
-        avg_phase = (self.phase + other.phase) / 2
-        self.phase = avg_phase
-        other.phase = avg_phase
+    def entangled_group(self) -> List['SoulTensor']:
+        """Every soul sharing this soul's phase (itself included)."""
+        from elysia_engine.entanglement import group_members
+
+        return group_members(self)
 
     def observe(self, observer: 'SoulTensor') -> bool:
         """
@@ -178,6 +210,28 @@ class SoulTensor:
             self.is_collapsed = False
 
 
+    def resonance_value(self, other: SoulTensor) -> float:
+        """
+        `resonate(other)["resonance"]` without building the dict.
+        Use in pairwise loops; keep `resonate` for narrative/UI callers.
+        """
+        delta_phase = abs(self.phase - other.phase)
+        if delta_phase > math.pi:
+            delta_phase = TWO_PI - delta_phase
+        return math.cos(delta_phase) * (self.polarity * other.polarity)
+
+    def resonance_values(self, others: Sequence[SoulTensor]) -> List[float]:
+        """`resonance_value` against each of `others` (see also SoulTensorArray.resonance_values)."""
+        phase, polarity = self.phase, self.polarity
+        pi, cos = math.pi, math.cos
+        out = []
+        for other in others:
+            delta_phase = abs(phase - other.phase)
+            if delta_phase > pi:
+                delta_phase = TWO_PI - delta_phase
+            out.append(cos(delta_phase) * (polarity * other.polarity))
+        return out
+
     def resonate(self, other: SoulTensor) -> Dict[str, Any]:
         """
         Calculates the 'Chemistry' between two souls.
@@ -195,7 +249,7 @@ class SoulTensor:
         # Phase Difference (Spirit Alignment)
         delta_phase = abs(self.phase - other.phase)
         if delta_phase > math.pi:
-            delta_phase = (2 * math.pi) - delta_phase
+            delta_phase = TWO_PI - delta_phase
 
         # Resonance Factor: 1.0 (Perfect Harmony) to -1.0 (Perfect Cancellation)
         resonance = math.cos(delta_phase)
@@ -205,7 +259,7 @@ class SoulTensor:
         # (+1, +1) -> Standard Resonance
         # (+1, -1) -> Inverted Resonance (Attraction becomes Repulsion or vice versa)
         polarity_factor = self.polarity * other.polarity
-        resonance *= polarity_factor
+        resonance *= polarity_factor  # Same value as resonance_value(other)
 
         # Frequency Ratio (Harmony vs Discord)
         # Simple ratio check: Are they octaves? 5ths?
@@ -519,3 +573,25 @@ class SoulTensor:
         # Check if ratio is close to a power of 2
         log_ratio = math.log2(ratio)
         return abs(log_ratio - round(log_ratio)) < 0.1
+
+
+def _get_phase(self: SoulTensor) -> float:
+    d = self.__dict__
+    group = d.get("entanglement")
+    if group is None or d["is_collapsed"]:
+        return d["phase"]
+    return group.find().phase
+
+
+def _set_phase(self: SoulTensor, value: float) -> None:
+    d = self.__dict__
+    d["phase"] = value
+    group = d.get("entanglement")
+    if group is not None and not d["is_collapsed"]:
+        group.find().phase = value
+
+
+# Entangled souls read and write their phase through their group's shared
+# slot (see entanglement.py). Installed after @dataclass so `phase` stays a
+# required field; the soul's own value lives in __dict__["phase"].
+SoulTensor.phase = property(_get_phase, _set_phase)  # type: ignore[assignment]
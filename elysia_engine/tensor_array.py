@@ -0,0 +1,281 @@
+"""
+Struct-of-Arrays Soul Storage
+
+`SoulTensorArray` keeps the scalar axes of many souls (amplitude, frequency,
+phase, spin, polarity, coherence, is_collapsed) in parallel NumPy arrays.
+Phase rotation and decoherence for every soul advance in one call, and
+pairwise resonance comes back as a dense N x M matrix.
+
+Each stored soul is exposed as an `ArraySoulTensor` handle: a real
+`SoulTensor` whose scalar axes read and write through to the arrays, so
+entities and systems that hold a handle keep working unchanged.
+
+Entangled handles share their group's phase slot (see entanglement.py);
+their rows are refreshed from it on `step` and before resonance reads.
+
+Requires numpy (imported lazily by callers; the rest of the engine does not).
+"""
+
+from __future__ import annotations
+
+import math
+from typing import List, Optional, Tuple
+
+from .math_utils import Quaternion
+from .tensor import SoulTensor, note_axis_write
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - exercised only without numpy
+    np = None
+
+TWO_PI = 2 * math.pi
+
+_FLOAT_AXES = ("amplitude", "frequency", "phase", "spin", "polarity", "coherence")
+
+
+def _axis(name: str) -> property:
+    def fget(self: ArraySoulTensor) -> float:
+        return float(getattr(self.store, name)[self.row])
+
+    def fset(self: ArraySoulTensor, value: float) -> None:
+        getattr(self.store, name)[self.row] = value
+
+    return property(fget, fset)
+
+
+class ArraySoulTensor(SoulTensor):
+    """
+    SoulTensor handle onto one row of a SoulTensorArray.
+    Orientation and quantum bookkeeping (peers, superposition) stay per object.
+    """
+
+    def __init__(
+        self,
+        store: SoulTensorArray,
+        row: int,
+        orientation: Optional[Quaternion] = None,
+        entangled_peers: Optional[List[SoulTensor]] = None,
+        superposition_states: Optional[List[Tuple[SoulTensor, float]]] = None,
+    ):
+        self.store = store
+        self.row = row
+        self.orientation = orientation if orientation is not None else Quaternion.identity()
+        self.entangled_peers = entangled_peers if entangled_peers is not None else []
+        self.superposition_states = superposition_states if superposition_states is not None else []
+        self.entanglement = None
+
+    amplitude = _axis("amplitude")  # type: ignore[assignment]
+    frequency = _axis("frequency")  # type: ignore[assignment]
+    spin = _axis("spin")  # type: ignore[assignment]
+    polarity = _axis("polarity")  # type: ignore[assignment]
+    coherence = _axis("coherence")  # type: ignore[assignment]
+
+    @property  # type: ignore[override]
+    def is_collapsed(self) -> bool:
+        return bool(self.store.is_collapsed[self.row])
+
+    @is_collapsed.setter
+    def is_collapsed(self, value: bool) -> None:
+        store, row = self.store, self.row
+        if value and not store.is_collapsed[row] and self.entanglement is not None:
+            store.phase[row] = self.entanglement.find().phase  # Locked at collapse
+        store.is_collapsed[row] = value
+
+    @property  # type: ignore[override]
+    def phase(self) -> float:
+        store, row = self.store, self.row
+        if self.entanglement is not None and not store.is_collapsed[row]:
+            return self.entanglement.find().phase
+        return float(store.phase[row])
+
+    @phase.setter
+    def phase(self, value: float) -> None:
+        store, row = self.store, self.row
+        store.phase[row] = value
+        if self.entanglement is not None and not store.is_collapsed[row]:
+            self.entanglement.find().phase = value
+
+    def detach(self) -> SoulTensor:
+        """Copies the handle back into a standalone SoulTensor."""
+        return SoulTensor(
+            amplitude=self.amplitude,
+            frequency=self.frequency,
+            phase=self.phase,
+            spin=self.spin,
+            polarity=self.polarity,
+            orientation=self.orientation,
+            is_collapsed=self.is_collapsed,
+            coherence=self.coherence,
+            entangled_peers=self.entangled_peers,
+            superposition_states=self.superposition_states,
+        )
+
+
+class SoulTensorArray:
+    """
+    Parallel-array storage for SoulTensors with batched step and resonance.
+    """
+
+    def __init__(self, capacity: int = 1024):
+        if np is None:
+            raise ImportError("SoulTensorArray requires numpy (pip install numpy)")
+        capacity = max(1, capacity)
+        self.amplitude = np.zeros(capacity, dtype=np.float64)
+        self.frequency = np.zeros(capacity, dtype=np.float64)
+        self.phase = np.zeros(capacity, dtype=np.float64)
+        self.spin = np.ones(capacity, dtype=np.float64)
+        self.polarity = np.ones(capacity, dtype=np.float64)
+        self.coherence = np.ones(capacity, dtype=np.float64)
+        self.is_collapsed = np.zeros(capacity, dtype=bool)
+        self.entangled = np.zeros(capacity, dtype=bool)
+        self.alive = np.zeros(capacity, dtype=bool)
+
+        self.handles: List[Optional[ArraySoulTensor]] = [None] * capacity
+        self._size = 0
+        self._free: List[int] = []
+
+    def __len__(self) -> int:
+        return self._size - len(self._free)
+
+    @property
+    def capacity(self) -> int:
+        return len(self.alive)
+
+    def attach(self, soul: SoulTensor) -> ArraySoulTensor:
+        """Copies a soul into a fresh row and returns its handle."""
+        if isinstance(soul, ArraySoulTensor) and soul.store is self:
+            return soul
+
+        row = self._allocate()
+        for name in _FLOAT_AXES:
+            getattr(self, name)[row] = getattr(soul, name)
+        self.is_collapsed[row] = soul.is_collapsed
+
+        handle = ArraySoulTensor(
+            self,
+            row,
+            orientation=soul.orientation,
+            entangled_peers=soul.entangled_peers,
+            superposition_states=soul.superposition_states,
+        )
+        self.handles[row] = handle
+        if soul.entanglement is not None:
+            from .entanglement import replace_member
+
+            replace_member(soul, handle)
+        return handle
+
+    def add(self, amplitude: float, frequency: float, phase: float, **axes: float) -> ArraySoulTensor:
+        """Creates a new soul directly in the array."""
+        return self.attach(SoulTensor(amplitude=amplitude, frequency=frequency, phase=phase, **axes))
+
+    def release(self, handle: ArraySoulTensor) -> None:
+        """Frees a row. The handle must not be used afterwards."""
+        if handle.store is not self or not self.alive[handle.row]:
+            return
+        self.alive[handle.row] = False
+        self.entangled[handle.row] = False
+        self.handles[handle.row] = None
+        self._free.append(handle.row)
+
+    def rows(self) -> np.ndarray:
+        """Indices of live rows, ascending."""
+        return np.flatnonzero(self.alive[: self._size])
+
+    def step(self, dt: float) -> None:
+        """
+        Batched `SoulTensor.step` for every live, non-collapsed soul:
+        phase advances by frequency * dt (mod 2pi) and coherence decays with
+        an amplitude-dependent rate. Entangled souls advance their group's
+        shared slot instead, in row order, as the per-object step would.
+        """
+        n = self._size
+        note_axis_write()
+        moving = self.alive[:n] & ~self.is_collapsed[:n]
+        linked = moving & self.entangled[:n]
+        free = moving & ~linked
+
+        phase = self.phase[:n]
+        phase[free] = (phase[free] + self.frequency[:n][free] * dt) % TWO_PI
+
+        decoherence_rate = 0.001 * (1 + self.amplitude[:n][moving] * 0.01)
+        coherence = self.coherence[:n]
+        coherence[moving] = np.maximum(0.0, coherence[moving] - decoherence_rate * dt)
+
+        if linked.any():
+            handles, frequency = self.handles, self.frequency
+            for row in np.flatnonzero(linked):
+                group = handles[row].entanglement.find()
+                group.phase = (group.phase + frequency[row] * dt) % TWO_PI
+            self.sync_entangled()
+
+    def sync_entangled(self) -> None:
+        """Copies group phases into the rows of entangled, non-collapsed souls."""
+        n = self._size
+        handles, phase = self.handles, self.phase
+        for row in np.flatnonzero(self.entangled[:n] & ~self.is_collapsed[:n]):
+            phase[row] = handles[row].entanglement.find().phase
+
+    def resonance_matrix(
+        self,
+        other: Optional[SoulTensorArray] = None,
+        rows: Optional[np.ndarray] = None,
+        other_rows: Optional[np.ndarray] = None,
+    ) -> np.ndarray:
+        """
+        Pairwise `resonate(...)["resonance"]`: cos(delta_phase) * polarity_i * polarity_j.
+
+        Args:
+            other: Second population (defaults to this array).
+            rows / other_rows: Row subsets (default: all live rows), giving an
+                len(rows) x len(other_rows) matrix.
+        """
+        if other is None:
+            other = self
+        # Plain members may have moved their groups since the last step
+        self.sync_entangled()
+        if other is not self:
+            other.sync_entangled()
+        if rows is None:
+            rows = self.rows()
+        if other_rows is None:
+            other_rows = other.rows()
+
+        delta = np.abs(self.phase[rows][:, None] - other.phase[other_rows][None, :])
+        delta = np.where(delta > math.pi, TWO_PI - delta, delta)
+        polarity = self.polarity[rows][:, None] * other.polarity[other_rows][None, :]
+        return np.cos(delta) * polarity
+
+    def resonance_values(self, soul: SoulTensor, rows: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        `soul.resonance_value(...)` against each row (default: all live rows),
+        as one vector; the batch form for hot loops over stored souls.
+        """
+        self.sync_entangled()
+        if rows is None:
+            rows = self.rows()
+        delta = np.abs(soul.phase - self.phase[rows])
+        delta = np.where(delta > math.pi, TWO_PI - delta, delta)
+        return np.cos(delta) * (soul.polarity * self.polarity[rows])
+
+    def _allocate(self) -> int:
+        if self._free:
+            row = self._free.pop()
+        else:
+            if self._size == self.capacity:
+                self._grow(self.capacity * 2)
+            row = self._size
+            self._size += 1
+        self.alive[row] = True
+        return row
+
+    def _grow(self, capacity: int) -> None:
+        extra = capacity - self.capacity
+        for name in _FLOAT_AXES:
+            fill = 1.0 if name in ("spin", "polarity", "coherence") else 0.0
+            setattr(self, name, np.concatenate([getattr(self, name), np.full(extra, fill)]))
+        self.is_collapsed = np.concatenate([self.is_collapsed, np.zeros(extra, dtype=bool)])
+        self.entangled = np.concatenate([self.entangled, np.zeros(extra, dtype=bool)])
+        self.alive = np.concatenate([self.alive, np.zeros(extra, dtype=bool)])
+        self.handles.extend([None] * extra)
@@ -137,17 +137,17 @@ class CoilStructure:
                     # COLLISION! Trigger Crossover based on Soul Resonance
 
                     # 1. Check Resonance
-                    res_data = p1.soul.resonate(p2.soul)
+                    resonance = p1.soul.resonance_value(p2.soul)
 
                     # Only breed if constructive interference (Empathy/Love)
-                    if res_data['resonance'] > 0.5:
+                    if resonance > 0.5:
 
                         child_id = f"child_{world_time:.2f}_{len(new_entities)}"
 
                         # Create Child Soul (Average + Mutation)
                         avg_freq = (p1.soul.frequency + p2.soul.frequency) / 2
                         child_soul = SoulTensor(
-                            amplitude = (p1.soul.amplitude + p2.soul.amplitude) * 0.5 * res_data['resonance'],
+                            amplitude = (p1.soul.amplitude + p2.soul.amplitude) * 0.5 * resonance,
                             frequency = avg_freq,
                             phase = (p1.soul.phase + p2.soul.phase) / 2,
                             spin = (p1.soul.spin + p2.soul.spin) / 2
@@ -160,7 +160,7 @@ class CoilStructure:
                         mid_pos = (p1.physics.position + p2.physics.position) * 0.5
                         child.physics.position = mid_pos
 
-                        child.data = {"desc": f"Born from {p1.id} & {p2.id}", "harmony": res_data['resonance']}
+                        child.data = {"desc": f"Born from {p1.id} & {p2.id}", "harmony": resonance}
 
                         new_entities.append(child)
 
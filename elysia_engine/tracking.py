@@ -0,0 +1,137 @@
+"""
+Change-Tracked Containers
+
+`TrackedDict` and `TrackedList` behave like the builtins but stamp a
+`version` on every mutation. Versions come from one process-wide counter,
+so a version is never reused: a container replaced wholesale (or mutated
+and changed back) still reads as changed. Caches that depend on a
+container store its version and compare it later in O(1) instead of
+re-walking the contents.
+
+Only top-level mutations are seen; editing a nested value in place does not
+bump the version of the container holding it.
+
+`Entity.data` and `Entity.bonds` are kept as these types (see entities.py).
+Pickling and deep copies drop the version; the copy starts with a fresh one.
+"""
+
+from __future__ import annotations
+
+from itertools import count
+from typing import Any, Hashable, Optional, Tuple
+
+_versions = count(1)
+
+
+class TrackedDict(dict):
+    """dict whose `version` changes on every mutation."""
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.version = next(_versions)
+
+    def __reduce__(self):
+        return (type(self), (dict(self),))
+
+    def __setitem__(self, key: Hashable, value: Any) -> None:
+        super().__setitem__(key, value)
+        self.version = next(_versions)
+
+    def __delitem__(self, key: Hashable) -> None:
+        super().__delitem__(key)
+        self.version = next(_versions)
+
+    def __ior__(self, other: Any) -> TrackedDict:
+        super().__ior__(other)
+        self.version = next(_versions)
+        return self
+
+    def clear(self) -> None:
+        super().clear()
+        self.version = next(_versions)
+
+    def pop(self, *args: Any) -> Any:
+        value = super().pop(*args)
+        self.version = next(_versions)
+        return value
+
+    def popitem(self) -> Tuple[Hashable, Any]:
+        item = super().popitem()
+        self.version = next(_versions)
+        return item
+
+    def setdefault(self, key: Hashable, default: Any = None) -> Any:
+        value = super().setdefault(key, default)
+        self.version = next(_versions)
+        return value
+
+    def update(self, *args: Any, **kwargs: Any) -> None:
+        super().update(*args, **kwargs)
+        self.version = next(_versions)
+
+
+class TrackedList(list):
+    """list whose `version` changes on every mutation."""
+
+    def __init__(self, *args: Any) -> None:
+        super().__init__(*args)
+        self.version = next(_versions)
+
+    def __reduce__(self):
+        return (type(self), (list(self),))
+
+    def __setitem__(self, index: Any, value: Any) -> None:
+        super().__setitem__(index, value)
+        self.version = next(_versions)
+
+    def __delitem__(self, index: Any) -> None:
+        super().__delitem__(index)
+        self.version = next(_versions)
+
+    def __iadd__(self, other: Any) -> TrackedList:
+        super().__iadd__(other)
+        self.version = next(_versions)
+        return self
+
+    def __imul__(self, n: int) -> TrackedList:
+        super().__imul__(n)
+        self.version = next(_versions)
+        return self
+
+    def append(self, value: Any) -> None:
+        super().append(value)
+        self.version = next(_versions)
+
+    def extend(self, values: Any) -> None:
+        super().extend(values)
+        self.version = next(_versions)
+
+    def insert(self, index: int, value: Any) -> None:
+        super().insert(index, value)
+        self.version = next(_versions)
+
+    def pop(self, *args: Any) -> Any:
+        value = super().pop(*args)
+        self.version = next(_versions)
+        return value
+
+    def remove(self, value: Any) -> None:
+        super().remove(value)
+        self.version = next(_versions)
+
+    def clear(self) -> None:
+        super().clear()
+        self.version = next(_versions)
+
+    def sort(self, *args: Any, **kwargs: Any) -> None:
+        super().sort(*args, **kwargs)
+        self.version = next(_versions)
+
+    def reverse(self) -> None:
+        super().reverse()
+        self.version = next(_versions)
+
+
+def version_of(container: Any) -> Optional[int]:
+    """Version of a tracked container; None for anything untracked."""
+    return getattr(container, "version", None)
@@ -1,16 +1,53 @@
 ﻿from __future__ import annotations
 
 import copy
+import math
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional, TYPE_CHECKING
+from typing import IO, Dict, Iterable, List, Optional, Tuple, Union, TYPE_CHECKING
 
+from .entanglement import detach
 from .entities import Entity
+from .tracking import TrackedDict
+from .tensor import axis_writes
+from .profiling import ENTITY_UPDATE, SYSTEM_PREFIX, TickProfiler, clock
 
 if TYPE_CHECKING:
     from .physics import PhysicsWorld
     from .systems import System
 
 
+@dataclass
+class TickSchedule:
+    """
+    When a System runs inside World.step.
+    A system runs on ticks where `tick % period == offset`; the dt of the
+    skipped ticks is accumulated and handed over in one piece.
+    """
+
+    period: int = 1          # Run every N ticks
+    offset: int = 0          # Phase within the period
+    order: int = 0           # Lower runs first; ties keep registration order
+    pending_dt: float = 0.0  # dt accumulated since the last run
+
+    def is_due(self, tick: int) -> bool:
+        return tick % self.period == self.offset % self.period
+
+
+@dataclass(frozen=True)
+class SoulTotals:
+    """
+    Population sums over every entity with a soul (see World.soul_totals).
+    Phases enter as unit vectors, so the mean phase vector is
+    (cos_sum, sin_sum) / count.
+    """
+
+    count: int = 0
+    cos_sum: float = 0.0
+    sin_sum: float = 0.0
+    frequency_sum: float = 0.0
+    amplitude_sum: float = 0.0
+
+
 @dataclass
 class World:
     """프랙탈 의식 엔진의 최소 세계."""
@@ -21,12 +58,115 @@ class World:
     physics: Optional[PhysicsWorld] = None
     systems: List[System] = field(default_factory=list)
 
+    # period -> number of auto-staggered systems on that period
+    _stagger: Dict[int, int] = field(default_factory=dict, repr=False)
+
+    # Optional tick instrumentation (see enable_profiling)
+    profiler: Optional[TickProfiler] = field(default=None, repr=False)
+
+    # ((entities version, soul axis writes), totals) of the last soul_totals() pass
+    _soul_totals: Optional[Tuple[Tuple[int, int], SoulTotals]] = field(default=None, repr=False, compare=False)
+
+    def __setattr__(self, name: str, value: object) -> None:
+        # entities is kept change-tracked so systems can skip membership rescans
+        if name == "entities" and type(value) is not TrackedDict:
+            value = TrackedDict(value)
+        object.__setattr__(self, name, value)
+
     def add_entity(self, entity: Entity) -> None:
         self.entities[entity.id] = entity
 
-    def add_system(self, system: System) -> None:
+    def add_entities(self, entities: Iterable[Entity]) -> None:
+        """
+        Adds a batch of entities in one dict update and registers them with
+        the physics world, if one is attached.
+        """
+        entities = list(entities)
+        self.entities.update((entity.id, entity) for entity in entities)
+        if self.physics:
+            for entity in entities:
+                self.physics.register_entity(entity)
+
+    def remove_entity(self, entity_id: str) -> Optional[Entity]:
+        """
+        Removes an entity and everything that still refers to it: partner
+        bonds, entanglement links, physics indexes, and the per-entity state
+        of systems implementing `on_entity_removed`. Returns the entity
+        (None if unknown). Cost is O(1) apart from its own bonds and links.
+        """
+        entity = self.entities.pop(entity_id, None)
+        if entity is None:
+            return None
+        for partner_id in entity.bonds:
+            partner = self.entities.get(partner_id)
+            if partner is not None and entity_id in partner.bonds:
+                partner.bonds.remove(entity_id)
+        if entity.soul is not None:
+            detach(entity.soul)
+        if self.physics:
+            self.physics.unregister_entity(entity)
+        for system in self.systems:
+            on_removed = getattr(system, "on_entity_removed", None)
+            if on_removed is not None:
+                on_removed(self, entity)
+        return entity
+
+    def add_system(
+        self,
+        system: System,
+        period: Optional[int] = None,
+        offset: Optional[int] = None,
+        order: Optional[int] = None,
+    ) -> None:
+        """
+        Registers a system with an optional tick-rate schedule.
+        Unset values fall back to the system's `tick_period` / `tick_offset` /
+        `tick_order`. Systems without an explicit offset are staggered across
+        their period so that expensive systems sharing a period do not all
+        land on the same tick.
+        """
+        system.schedule = self._make_schedule(system, period, offset, order)
         self.systems.append(system)
 
+    def _make_schedule(
+        self,
+        system: System,
+        period: Optional[int] = None,
+        offset: Optional[int] = None,
+        order: Optional[int] = None,
+    ) -> TickSchedule:
+        period = max(1, period if period is not None else getattr(system, "tick_period", 1))
+        if offset is None:
+            offset = getattr(system, "tick_offset", None)
+        if offset is None:
+            if period > 1:
+                offset = self._stagger.get(period, 0) % period
+                self._stagger[period] = self._stagger.get(period, 0) + 1
+            else:
+                offset = 0
+        if order is None:
+            order = getattr(system, "tick_order", 0)
+        return TickSchedule(period=period, offset=offset, order=order)
+
+    def _due_systems(self, dt: float) -> List[Tuple[System, float]]:
+        """Systems that run this tick (in order) with their accumulated dt."""
+        scheduled = []
+        for index, system in enumerate(self.systems):
+            schedule = getattr(system, "schedule", None)
+            if schedule is None:
+                # Appended directly to world.systems
+                schedule = system.schedule = self._make_schedule(system)
+            scheduled.append((schedule.order, index, system, schedule))
+        scheduled.sort(key=lambda entry: (entry[0], entry[1]))
+
+        due = []
+        for _, _, system, schedule in scheduled:
+            schedule.pending_dt += dt
+            if schedule.is_due(self.tick):
+                due.append((system, schedule.pending_dt))
+                schedule.pending_dt = 0.0
+        return due
+
     def step(self, dt: float = 1.0) -> None:
         # Physics can warp perceived time (Chronos / Spacetime orchestration)
         physics_dt = dt
@@ -36,16 +176,98 @@ class World:
         self.time += physics_dt
         self.tick += 1
 
-        # Update Entities
-        for ent in self.entities.values():
-            ent.step(self, dt=physics_dt)
-            # Automatically apply physics if the world has physics enabled
+        prof = self.profiler
+        if prof:
+            prof.begin_tick(self.tick)
+        try:
             if self.physics:
-                ent.apply_physics(coil=None, world_physics=self.physics, dt=physics_dt)
+                self.physics.refresh_neighbor_index()
+
+            # Update Entities
+            if prof:
+                t0 = clock()
+            for ent in self.entities.values():
+                ent.step(self, dt=physics_dt)
+                # Automatically apply physics if the world has physics enabled
+                if self.physics:
+                    ent.apply_physics(coil=None, world_physics=self.physics, dt=physics_dt)
+
+            if prof:
+                prof.add(ENTITY_UPDATE, clock() - t0, calls=len(self.entities))
+
+            # Update Systems (Global Logic), each at its own tick rate
+            for sys, sys_dt in self._due_systems(physics_dt):
+                if prof:
+                    t0 = clock()
+                    sys.step(self, sys_dt)
+                    prof.add(SYSTEM_PREFIX + type(sys).__name__, clock() - t0)
+                else:
+                    sys.step(self, sys_dt)
+        finally:
+            # Close the tick even if a system raised, or later ticks would nest
+            if prof:
+                prof.end_tick()
+
+    # --- Aggregates ---
+
+    def soul_totals(self) -> SoulTotals:
+        """
+        Phase, frequency and amplitude sums over all souls, shared by the
+        global metrics (GlobalConsciousness, CosmicResonanceField). Recomputed
+        only after entities are added or removed or a soul's amplitude,
+        frequency or phase is written (see tensor.axis_writes); writes made
+        straight into a SoulTensorArray's arrays must call
+        tensor.note_axis_write().
+        """
+        key = (self.entities.version, axis_writes())
+        cached = self._soul_totals
+        if cached is not None and cached[0] == key:
+            return cached[1]
+
+        count = 0
+        cos_sum = sin_sum = frequency_sum = amplitude_sum = 0.0
+        cos, sin = math.cos, math.sin
+        for entity in self.entities.values():
+            soul = entity.soul
+            if soul is None:
+                continue
+            count += 1
+            phase = soul.phase
+            cos_sum += cos(phase)
+            sin_sum += sin(phase)
+            frequency_sum += soul.frequency
+            amplitude_sum += soul.amplitude
+
+        totals = SoulTotals(count, cos_sum, sin_sum, frequency_sum, amplitude_sum)
+        self._soul_totals = (key, totals)
+        return totals
 
-        # Update Systems (Global Logic)
-        for sys in self.systems:
-            sys.step(self, physics_dt)
+    # --- Profiling ---
+
+    def enable_profiling(self, window: int = 1000, sink: Optional[Union[str, IO[str]]] = None) -> TickProfiler:
+        """
+        Starts recording per-phase and per-system tick timings.
+        Also instruments the attached PhysicsWorld (field bloom, geodesic flow,
+        dimensional binding, sediment). `sink` may be a path or text stream
+        that receives one JSON line per tick.
+        """
+        self.profiler = TickProfiler(window=window, sink=sink)
+        if self.physics:
+            self.physics.profiler = self.profiler
+        return self.profiler
+
+    def disable_profiling(self) -> None:
+        if self.profiler:
+            self.profiler.close()
+        self.profiler = None
+        if self.physics:
+            self.physics.profiler = None
+
+    def profile_report(self) -> Dict[str, Dict[str, float]]:
+        """Rolling p50/p95/p99 (ms) and call counts per section; empty when disabled."""
+        if not self.profiler:
+            return {}
+        return self.profiler.report()
 
     def export_persona_snapshot(self) -> Dict:
         return {
@@ -58,6 +280,16 @@ class World:
     def clone(self) -> World:
         """
         Creates a divergent timeline (Deep Copy).
-        Used for 'Quantum Dreaming' and Prophecy.
+        See `fork` for the fast path used by Prophecy.
         """
         return copy.deepcopy(self)
+
+    def fork(self) -> World:
+        """
+        Creates a divergent timeline cheaply (see elysia_engine.fork).
+        Fully isolated like `clone`, but copies the per-entity numeric state
+        directly instead of deep-copying the whole object graph.
+        """
+        from .fork import fork_world
+
+        return fork_world(self)
@@ -0,0 +1,59 @@
+"""
+Tests for the benchmark runner (timing harness and baseline comparison).
+"""
+
+import json
+
+from benchmarks.runner import compare, main, measure, regressions, run_case
+from benchmarks.suite import CASES, Case
+
+
+def _report(**medians):
+    return {"results": {name: {"100": {"median_s": s}} for name, s in medians.items()}}
+
+
+def test_compare_flags_only_slowdowns_beyond_tolerance():
+    baseline = _report(a=1.0, b=1.0, c=1.0)
+    current = _report(a=1.1, b=1.5, c=0.5, new_case=9.0)
+
+    comparisons = compare(baseline, current)
+    assert {c.case for c in comparisons} == {"a", "b", "c"}  # new_case has no baseline
+
+    flagged = regressions(comparisons, tolerance=0.2)
+    assert [c.case for c in flagged] == ["b"]
+
+
+def test_measure_stops_after_warmup_when_over_budget():
+    calls = []
+    stats = measure(lambda: calls.append(1), repeat=3, budget=0.0)
+    assert stats["over_budget"] is True
+    assert stats["samples"] == 1
+    assert len(calls) == 1
+
+
+def test_run_case_skips_larger_sizes_once_over_budget():
+    seen = []
+
+    def setup(n, seed):
+        seen.append(n)
+        return lambda: None
+
+    results = run_case(Case("noop", [1, 2, 3], setup), budget=0.0)
+    assert list(results) == ["1"]
+    assert seen == [1]
+
+
+def test_suite_cases_build_and_run_at_small_size():
+    for name in ("world.step", "physics.step", "system.genesis", "field.get_local_forces", "ether.emit"):
+        results = run_case(CASES[name], [10], repeat=1)
+        assert results["10"]["median_s"] >= 0.0
+
+
+def test_main_compare_exit_status(tmp_path):
+    base = tmp_path / "base.json"
+    cur = tmp_path / "cur.json"
+    base.write_text(json.dumps(_report(a=1.0)))
+    cur.write_text(json.dumps(_report(a=2.0)))
+
+    assert main(["--current", str(cur), "--compare", str(base), "--tolerance", "0.5"]) == 1
+    assert main(["--current", str(cur), "--compare", str(base), "--tolerance", "1.5"]) == 0
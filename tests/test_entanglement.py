@@ -0,0 +1,165 @@
+"""
+Tests for union-find entanglement groups (elysia_engine/entanglement.py).
+"""
+
+import math
+import pickle
+
+import pytest
+
+from elysia_engine.entities import Entity
+from elysia_engine.fork import fork_world
+from elysia_engine.snapshot import WorldSnapshot
+from elysia_engine.tensor import SoulTensor
+from elysia_engine.tensor_array import SoulTensorArray
+from elysia_engine.world import World
+
+
+def _chain(n, frequency=0.0):
+    souls = [SoulTensor(amplitude=1, frequency=frequency, phase=0.1 * i) for i in range(n)]
+    for a, b in zip(souls, souls[1:]):
+        a.entangle(b)
+    return souls
+
+
+def test_entangle_merges_groups_at_mean_phase():
+    a = SoulTensor(amplitude=1, frequency=0.0, phase=0.0)
+    b = SoulTensor(amplitude=1, frequency=0.0, phase=1.0)
+    c = SoulTensor(amplitude=1, frequency=0.0, phase=3.0)
+    a.entangle(b)
+    assert a.phase == b.phase == pytest.approx(0.5)
+
+    c.entangle(b)
+    assert a.phase == b.phase == c.phase == pytest.approx(1.75)
+    assert {id(s) for s in a.entangled_group()} == {id(a), id(b), id(c)}
+
+    # Re-entangling within a group adds no duplicate links
+    a.entangle(c)
+    assert a.entangled_peers == [b]
+    assert SoulTensor(amplitude=1, frequency=0, phase=0).entangled_group()[0].phase == 0
+
+
+def test_large_cluster_steps_one_slot():
+    souls = _chain(5000, frequency=0.5)
+    souls[0].step(1.0)
+    assert souls[-1].phase == pytest.approx(souls[0].phase)
+    assert len(souls[2500].entangled_group()) == 5000
+
+    # Comparing or printing a member never walks the group
+    assert souls[1] == souls[-1]
+    assert "entangled" not in repr(souls[-1])
+
+
+def test_stepping_every_member_accumulates_each_advance():
+    a, b = _chain(2)
+    a.frequency, b.frequency = 0.25, 0.5
+    start = a.phase
+    a.step(1.0)
+    b.step(1.0)
+    assert a.phase == b.phase == pytest.approx(start + 0.75)
+
+
+def test_collapsed_member_keeps_phase_and_rejoins_on_melt():
+    a, b, c = _chain(3, frequency=1.0)
+    b.is_collapsed = True
+    locked = b.phase
+    a.step(1.0)
+    assert b.phase == locked
+    assert c.phase == pytest.approx((locked + 1.0) % (2 * math.pi))
+
+    b.is_collapsed = False
+    assert b.phase == c.phase
+
+
+def test_entangling_collapsed_soul_averages_its_phase():
+    frozen = SoulTensor(amplitude=1, frequency=0.0, phase=0.0, is_collapsed=True)
+    live = SoulTensor(amplitude=1, frequency=1.0, phase=1.0)
+    frozen.entangle(live)
+    assert frozen.phase == live.phase == pytest.approx(0.5)
+
+    live.step(1.0)
+    assert frozen.phase == pytest.approx(0.5)  # Still locked
+    frozen.is_collapsed = False
+    assert frozen.phase == live.phase == pytest.approx(1.5)
+
+
+class _TaggedSoul(SoulTensor):
+    pass
+
+
+def test_subclassed_souls_keep_their_class():
+    a = _TaggedSoul(amplitude=1, frequency=0.0, phase=0.0)
+    b = SoulTensor(amplitude=1, frequency=0.0, phase=1.0)
+    a.entangle(b)
+    assert type(a) is _TaggedSoul and type(b) is SoulTensor
+    a.phase = 2.0
+    assert b.phase == 2.0
+
+    a2, b2 = pickle.loads(pickle.dumps((a, b)))
+    assert type(a2) is _TaggedSoul
+    b2.phase = 0.25
+    assert a2.phase == 0.25 and a.phase == 2.0
+
+
+def test_array_handles_share_group_with_plain_souls():
+    store = SoulTensorArray()
+    h = store.add(amplitude=1, frequency=1.0, phase=0.0)
+    plain = SoulTensor(amplitude=1, frequency=0.0, phase=1.0)
+    h.entangle(plain)
+    assert h.phase == plain.phase == pytest.approx(0.5)
+
+    plain.phase = 2.0
+    assert h.phase == 2.0
+    assert store.resonance_matrix(rows=[h.row], other_rows=[h.row])[0, 0] == pytest.approx(1.0)
+    assert store.phase[h.row] == 2.0
+
+    store.step(1.0)
+    assert plain.phase == pytest.approx(3.0)
+
+    # Attaching a plain member moves its group slot onto the handle
+    moved = store.attach(plain)
+    assert moved in h.entangled_group()
+    assert plain not in h.entangled_group()
+    store.step(1.0)
+    assert moved.phase == h.phase == pytest.approx(4.0)
+
+
+def _world():
+    world = World()
+    souls = _chain(4, frequency=0.5)
+    for i, soul in enumerate(souls):
+        ent = Entity(id=f"e{i}")
+        ent.soul = soul
+        world.add_entity(ent)
+    souls[3].is_collapsed = True
+    return world
+
+
+def _check_groups(copy, source):
+    souls = [copy.entities[f"e{i}"].soul for i in range(4)]
+    assert {id(s) for s in souls[0].entangled_group()} == {id(s) for s in souls}
+    assert all(id(s) not in {id(o) for o in source.entities["e0"].soul.entangled_group()} for s in souls)
+    assert souls[3].phase == source.entities["e3"].soul.phase
+
+    phase = source.entities["e0"].soul.phase
+    souls[0].step(1.0)
+    assert souls[1].phase == pytest.approx(phase + 0.5)
+    assert source.entities["e1"].soul.phase == phase
+
+
+def test_fork_preserves_groups():
+    world = _world()
+    _check_groups(fork_world(world), world)
+
+
+def test_snapshot_preserves_groups():
+    world = _world()
+    snap = WorldSnapshot.from_bytes(WorldSnapshot.capture(world).to_bytes())
+    _check_groups(snap.restore(), world)
+
+
+def test_groups_pickle():
+    a, b = pickle.loads(pickle.dumps(_chain(2)))
+    assert {id(s) for s in a.entangled_group()} == {id(a), id(b)}
+    a.phase = 1.5
+    assert b.phase == 1.5
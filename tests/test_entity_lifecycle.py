@@ -0,0 +1,113 @@
+"""
+Tests for the entity lifecycle API (World.add_entities / World.remove_entity)
+and the removal broadcast that keeps subsystem indexes from leaking.
+"""
+
+from collections import deque
+
+from elysia_engine.entities import Entity
+from elysia_engine.physics import PhysicsWorld
+from elysia_engine.systems import FractalEvolutionSystem, GenesisSystem, VoidSystem
+from elysia_engine.tensor import SoulTensor
+from elysia_engine.world import World
+
+
+def _soul(phase=0.0):
+    return SoulTensor(amplitude=20.0, frequency=1.0, phase=phase)
+
+
+def test_remove_entity_clears_references():
+    physics = PhysicsWorld(array_backend=True)
+    world = World(physics=physics)
+    a, b, c = (Entity(id=name, soul=_soul(i)) for i, name in enumerate("abc"))
+    world.add_entities([a, b, c])
+    assert list(world.entities) == ["a", "b", "c"]
+    assert physics.entities == [a, b, c] and len(physics.state_store) == 3
+
+    a.bonds.append("b")
+    b.bonds.append("a")
+    a.soul.entangle(b.soul)
+    b.soul.entangle(c.soul)
+    physics.observers.append(a)
+
+    assert world.remove_entity("a") is a
+    assert world.remove_entity("a") is None
+    assert "a" not in world.entities and list(b.bonds) == []
+    assert {id(soul) for soul in b.soul.entangled_group()} == {id(b.soul), id(c.soul)}
+    assert b.soul.entangled_peers == [c.soul]
+    assert physics.entities == [c, b]  # Last entity moved into the freed slot
+    assert a not in physics.neighbor_index and physics.observers == []
+    assert len(physics.state_store) == 2
+    assert type(a.physics).__name__ == "PhysicsState"  # Copied out of the store
+
+    # The slot index follows the swap: registration stays identity-based
+    physics.register_entity(b)
+    assert physics.entities == [c, b]
+
+
+def test_unregister_from_abyss():
+    physics = PhysicsWorld()
+    ent = Entity(id="sunk")
+    physics.sediment_layer.add(ent, physics.tick)
+    physics.unregister_entity(ent)
+    assert ent not in physics.sediment_layer
+    physics.register_entity(ent)
+    assert physics.entities == [ent]
+
+
+def test_systems_receive_removal():
+    world = World()
+    evolution, genesis, void = FractalEvolutionSystem(), GenesisSystem(), VoidSystem()
+    for system in (evolution, genesis, void):
+        world.add_system(system)
+    world.add_entities(Entity(id=f"e{i}", soul=_soul()) for i in range(4))
+    world.step(1.0)
+    genesis._record_replication(world.entities["e0"], world.tick)
+
+    world.remove_entity("e0")
+    assert "e0" not in evolution._born and "e0" not in genesis._cooling
+    assert "e0" not in genesis._last_replication and "e0" not in void._last_activity
+
+    # A stale queue entry for the removed id does not bring it back
+    evolution._schedule("e0", evolution._clock + 1)
+    world.step(1.0)
+    assert "e0" not in evolution._waiting
+
+
+def test_churn_does_not_leak():
+    physics = PhysicsWorld(array_backend=True)
+    world = World(physics=physics)
+    evolution, genesis, void = FractalEvolutionSystem(), GenesisSystem(), VoidSystem()
+    for system in (evolution, genesis, void):
+        world.add_system(system)
+    live = deque()
+
+    for tick in range(100_000):
+        ent = Entity(id=f"e{tick}", soul=_soul(tick * 0.1))
+        if live:
+            prev = live[-1]
+            ent.bonds.append(prev.id)
+            prev.bonds.append(ent.id)
+            ent.soul.entangle(prev.soul)
+        world.add_entities([ent])
+        live.append(ent)
+        if tick % 7 == 0:
+            physics.observers.append(ent)
+        if tick % 3 == 0:
+            genesis._record_replication(ent, world.tick)
+        if len(live) > 16:
+            world.remove_entity(live.popleft().id)
+        evolution.step(world, 1.0)
+        void._identify_for_cleanup(world)
+        world.tick += 1
+
+    bound = 16
+    assert len(world.entities) == len(physics.entities) == len(physics.neighbor_index) == bound
+    assert len(physics._slots()) == len(physics.state_store) == bound
+    assert len(physics.observers) <= bound and len(physics.sediment_layer) == 0
+    assert len(evolution._born) == bound
+    assert len(evolution._low_energy) + len(evolution._waiting) <= bound
+    assert len(genesis._cooling) <= bound and len(genesis._last_replication) <= bound
+    assert len(void._last_activity) <= bound
+    assert len(live[-1].soul.entangled_group()) == bound
+    assert all(len(ent.bonds) <= 2 and len(ent.soul.entangled_peers) <= 2 for ent in live)
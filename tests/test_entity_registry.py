@@ -0,0 +1,64 @@
+"""
+Tests for id-indexed entity registration:
+- elysia_core.registry.EntityRegistry (World / PhysicsWorld storage)
+- elysia_engine PhysicsWorld.register_entity membership index
+"""
+
+from elysia_core.entities import Entity as CoreEntity
+from elysia_core.registry import EntityRegistry
+from elysia_engine.entities import Entity
+from elysia_engine.physics import PhysicsWorld
+
+
+def test_registry_add_lookup_remove():
+    ents = [CoreEntity(id=f"c{i}") for i in range(5)]
+    registry = EntityRegistry(ents)
+    view = registry.view
+
+    assert registry.add(ents[0]) is False
+    assert len(registry) == 5 and list(view) == [f"c{i}" for i in range(5)]
+    assert view["c3"] is ents[3] and "c3" in view and ents[3] in registry
+    assert CoreEntity(id="c3") not in registry  # Equal id, different entity
+
+    assert registry.remove("c1") is ents[1]
+    assert registry.remove("c1") is None
+    assert [e.id for e in registry] == ["c0", "c4", "c2", "c3"]  # Last moved into the slot
+    assert view["c4"] is ents[4] and "c1" not in view
+
+    # Same id replaces in place; the view is live and survives replace()
+    twin = CoreEntity(id="c2")
+    assert registry.add(twin) is True
+    assert view["c2"] is twin and len(view) == 4
+    registry.replace(ents[:2])
+    assert dict(view.items()) == {"c0": ents[0], "c1": ents[1]}
+    assert list(view.values()) == ents[:2]
+
+
+def test_register_entity_is_identity_based():
+    physics = PhysicsWorld()
+    a, b = Entity(id="same"), Entity(id="same")  # Equal dataclasses
+    physics.register_entity(a)
+    physics.register_entity(b)
+    physics.register_entity(a)
+    assert len(physics.entities) == 2 and physics.entities[0] is a
+
+    # Changes made directly to the list are picked up
+    del physics.entities[1]
+    physics.register_entity(b)
+    assert len(physics.entities) == 2
+
+    physics.entities = [a]
+    physics.sediment_layer.add(b, physics.tick)
+    physics.register_entity(b)
+    assert physics.entities == [a]
+
+
+def test_register_entity_bulk():
+    physics = PhysicsWorld()
+    ents = [Entity(id=f"e{i}") for i in range(20_000)]
+    for ent in ents:
+        physics.register_entity(ent)
+    for ent in ents[::100]:
+        physics.register_entity(ent)
+    assert len(physics.entities) == len(ents)
+    assert len(physics.neighbor_index) == len(ents)
@@ -0,0 +1,90 @@
+"""
+Tests for the state-keyed entropy cache behind atmospheric governance.
+"""
+
+from elysia_engine.entities import Entity
+from elysia_engine.math_utils import Vector3
+from elysia_engine.physics import PhysicsWorld
+from elysia_engine.tensor import SoulTensor
+from elysia_engine.world import World
+
+
+def _world(n):
+    physics = PhysicsWorld()
+    ents = []
+    for i in range(n):
+        ent = Entity(id=f"e{i}", soul=SoulTensor(1.0, 1.0 + 0.01 * i, 0.0), data={"chat": "hi " * i, "n": i})
+        ent.physics.position = Vector3(5.0 * i, 0.0, 0.0)
+        physics.register_entity(ent)
+        ents.append(ent)
+    return physics, ents
+
+
+def _count_entropy(monkeypatch, physics):
+    calls = []
+    original = physics.calculate_entropy
+    monkeypatch.setattr(physics, "calculate_entropy", lambda ent: calls.append(ent.id) or original(ent))
+    return calls
+
+
+def test_unchanged_entities_skip_the_data_walk(monkeypatch):
+    physics, ents = _world(30)
+    calls = _count_entropy(monkeypatch, physics)
+    physics.step(1.0)
+    assert len(calls) == 30
+
+    calls.clear()
+    for _ in range(5):
+        physics.step(1.0)
+    assert calls == []
+
+    ents[1].data["chat"] += "more"
+    ents[2].bonds.append("e3")
+    ents[3].soul.frequency = 4.0
+    ents[4].data = {"fresh": True}
+    physics.step(1.0)
+    assert sorted(calls) == ["e1", "e2", "e3", "e4"]
+
+
+def test_cached_entropy_matches_direct_computation():
+    physics, ents = _world(10)
+    physics.step(1.0)
+    ents[5].data["blob"] = "z" * 500
+    for ent in ents:
+        assert physics.cached_entropy(ent) == physics.calculate_entropy(ent)
+
+
+def test_untracked_containers_are_never_served_from_cache(monkeypatch):
+    physics, ents = _world(1)
+    ent = ents[0]
+    ent.__dict__["data"] = {"raw": "x" * 10}  # bypasses Entity.__setattr__
+    assert physics.cached_entropy(ent) == physics.calculate_entropy(ent)
+    ent.data["raw"] = "x" * 1000
+    assert physics.cached_entropy(ent) == physics.calculate_entropy(ent)
+
+
+def test_fork_starts_with_an_empty_cache():
+    physics, ents = _world(5)
+    world = World(physics=physics)
+    for ent in ents:
+        world.add_entity(ent)
+    physics.step(1.0)
+    assert physics._entropy_cache
+
+    fork = world.fork()
+    assert fork.physics._entropy_cache == {}
+    fork.physics.step(1.0)
+    assert len(fork.physics._entropy_cache) == 5
+
+
+def test_in_place_growth_of_nested_values_is_seen():
+    physics, ents = _world(2)
+    ent = ents[1]
+    ent.data["chat"] = ["hello"]
+    physics.step(1.0)
+    mass = ent.physics.mass
+
+    ent.data["chat"].extend(["msg"] * 500)  # No top-level write
+    physics.step(1.0)
+    assert ent.physics.mass > mass
+    assert physics.cached_entropy(ent) == physics.calculate_entropy(ent)
@@ -0,0 +1,85 @@
+"""
+Tests for FieldSystem.get_local_forces_batch and PhysicsWorld.geodesic_flows.
+"""
+
+import math
+import random
+
+import pytest
+
+from elysia_engine.entities import Entity
+from elysia_engine.field import FieldSystem
+from elysia_engine.math_utils import Quaternion, Rotor, Vector3, Vector4
+from elysia_engine.physics import PhysicsWorld
+from elysia_engine.tensor import SoulTensor
+
+BOUNDS = (Vector4(-1, -12, -12, -12), Vector4(1, 12, 12, 12))
+
+
+def _sources(n, seed):
+    rng = random.Random(seed)
+    return [
+        (
+            Vector4(0.0, rng.uniform(-6, 6), rng.uniform(-6, 6), rng.uniform(-6, 6)),
+            SoulTensor(amplitude=rng.uniform(1, 30), frequency=rng.uniform(-3, 3), phase=0.0,
+                       spin=rng.choice([-1.0, 1.0])),
+        )
+        for _ in range(n)
+    ]
+
+
+def _field(dense):
+    if dense:
+        pytest.importorskip("numpy")
+        return FieldSystem(bounds=BOUNDS)
+    return FieldSystem()
+
+
+@pytest.mark.parametrize("dense", [False, True])
+def test_batch_matches_scalar_forces(dense):
+    fs = _field(dense)
+    fs.update_field(_sources(400, seed=1))
+    fs.update_field(_sources(400, seed=2))  # seed-1 cells are now stale
+    probes = _sources(200, seed=2) + _sources(100, seed=1) + _sources(50, seed=3)
+
+    forces, angles = fs.get_local_forces_batch(
+        [(p.w, p.x, p.y, p.z) for p, _ in probes], [s for _, s in probes]
+    )
+    assert len(forces) == len(angles) == len(probes)
+    for (pos, soul), force, angle in zip(probes, forces, angles):
+        f, rotor = fs.get_local_forces(pos, soul)
+        assert force == pytest.approx((f.w, f.x, f.y, f.z))
+        assert rotor.a == pytest.approx(math.cos(angle / 2))
+
+
+def test_batch_on_empty_input():
+    assert FieldSystem().get_local_forces_batch([], []) == ([], [])
+
+
+def test_geodesic_flows_match_per_entity_flow():
+    physics = PhysicsWorld()
+    rng = random.Random(4)
+    for i in range(150):
+        soul = SoulTensor(amplitude=rng.uniform(1, 20), frequency=rng.uniform(-2, 2), phase=0.0,
+                          orientation=Quaternion(1.0, rng.random(), rng.random(), 0.0))
+        soul.is_collapsed = i % 7 == 0
+        ent = Entity(id=f"e{i}", soul=soul if i % 11 else None)
+        ent.physics.position = Vector3(rng.uniform(-5, 5), rng.uniform(-5, 5), rng.uniform(-5, 5))
+        physics.register_entity(ent)
+    physics.update_field()
+
+    flows = physics.geodesic_flows(physics.entities)
+    for ent, flow in zip(physics.entities, flows):
+        expected = physics.get_geodesic_flow(ent)
+        assert (flow.x, flow.y, flow.z) == pytest.approx((expected.x, expected.y, expected.z))
+
+
+def test_spiral_flow_matches_rotor_sandwich():
+    physics = PhysicsWorld()
+    soul = SoulTensor(amplitude=0.0, frequency=0.0, phase=0.0)  # no intent term
+    for angle in (-2.0, -0.3, 0.0, 0.05, 1.7):
+        rotor = Rotor.from_plane_angle("xy", angle)
+        dampened = Rotor(a=rotor.a, b_wx=0, b_wy=0, b_wz=0, b_xy=rotor.b_xy * 0.1, b_xz=0, b_yz=0, p=0)
+        expected = dampened.rotate(Vector4(0, 1.5, -2.0, 0.7))
+        flow = physics._spiral_flow(soul, 1.5, -2.0, 0.7, rotor.a, rotor.b_xy)
+        assert (flow.x, flow.y, flow.z) == pytest.approx((expected.x, expected.y, expected.z))
@@ -0,0 +1,82 @@
+"""
+Tests for generational node eviction in FractalSpatialMap.
+"""
+
+import pytest
+
+from elysia_engine.field import EVICTION_SWEEP_INTERVAL, FieldSystem
+from elysia_engine.math_utils import Vector4
+from elysia_engine.tensor import SoulTensor
+
+
+def _wanderers(tick, n=20):
+    # Each source drifts one cell per tick, so old cells are abandoned
+    return [(Vector4(0, 10.0 + tick, 3.0 * i, 0.5), SoulTensor(5 + i, 1.0 + 0.1 * i, 0)) for i in range(n)]
+
+
+def test_untouched_nodes_are_evicted_and_counted():
+    fs = FieldSystem(max_age=8)
+    for tick in range(200):
+        fs.update_field(_wanderers(tick))
+
+    smap = fs.spatial_map
+    assert smap.live_count <= 20 * (8 + EVICTION_SWEEP_INTERVAL)
+    assert smap.evicted_count + smap.live_count == 20 * 200
+    assert smap.max_age == 8
+
+
+def test_eviction_is_invisible_to_tick_aware_reads():
+    kept, evicting = FieldSystem(max_age=None), FieldSystem(max_age=1)
+    for tick in range(64):
+        sources = _wanderers(tick) + [(Vector4(0, 3, 3, 3), SoulTensor(9, 2.0, 0))]
+        kept.update_field(sources)
+        evicting.update_field(sources)
+
+    assert evicting.spatial_map.live_count < kept.spatial_map.live_count
+    probes = [(p.w, p.x + dx, p.y, p.z) for p, _ in _wanderers(62) + _wanderers(63) for dx in (0.0, 0.3)]
+    souls = [SoulTensor(1, 0.5, 0)] * len(probes)
+    assert evicting.get_local_forces_batch(probes, souls) == kept.get_local_forces_batch(probes, souls)
+
+
+def test_node_touched_every_tick_survives():
+    fs = FieldSystem(max_age=4)
+    home = (Vector4(0, 5, 5, 5), SoulTensor(10, 3.0, 0))
+    for tick in range(100):
+        fs.update_field([home] + _wanderers(tick, n=2))
+    assert fs.spatial_map.sample_field(home[0], current_tick=fs.time_tick)[0] == pytest.approx(1.1)
+
+
+def test_node_cap_evicts_oldest_generations_but_not_current():
+    fs = FieldSystem(max_age=None, max_nodes=50)
+    for tick in range(30):
+        fs.update_field(_wanderers(tick))
+        assert fs.spatial_map.live_count <= 50
+    assert fs.spatial_map.evicted_count == 20 * 30 - fs.spatial_map.live_count
+
+    # The cap yields to the current tick's nodes
+    fs.update_field(_wanderers(100, n=80))
+    assert fs.spatial_map.live_count == 80
+
+
+def test_fork_keeps_evicting_its_own_nodes():
+    from elysia_engine.fork import Forker
+
+    fs = FieldSystem(max_age=4)
+    for tick in range(10):
+        fs.update_field(_wanderers(tick))
+    forked = Forker().field_system(fs)
+    for tick in range(10, 40):
+        forked.update_field(_wanderers(tick))
+    assert forked.spatial_map.live_count <= 20 * (4 + EVICTION_SWEEP_INTERVAL)
+    assert fs.spatial_map.live_count == 20 * 10
+
+
+def test_generations_stay_bounded():
+    sources = _wanderers(0)  # Static: the same nodes are touched every tick
+    for kwargs in ({"max_age": None}, {"max_age": None, "max_nodes": 10_000}, {"max_age": 1000}):
+        fs = FieldSystem(**kwargs)
+        for _ in range(500):
+            fs.update_field(sources)
+        smap = fs.spatial_map
+        filed = sum(len(bucket) for bucket in smap._generations.values())
+        assert filed <= smap.live_count * (EVICTION_SWEEP_INTERVAL + 1)
@@ -0,0 +1,188 @@
+"""
+Tests for the dense NumPy field backend (DenseFieldGrid).
+"""
+
+import random
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from elysia_engine.field import FieldSystem  # noqa: E402
+from elysia_engine.field_grid import DenseFieldGrid, gaussian_kernel, inverse_square_kernel  # noqa: E402
+from elysia_engine.math_utils import Vector4  # noqa: E402
+from elysia_engine.tensor import SoulTensor  # noqa: E402
+
+BOUNDS = (Vector4(-1, -20, -20, -20), Vector4(1, 20, 20, 20))
+
+
+def _sources(n, seed, extent=6.0):
+    rng = random.Random(seed)
+    out = []
+    for _ in range(n):
+        pos = Vector4(0.0, rng.uniform(-extent, extent), rng.uniform(-extent, extent), rng.uniform(-extent, extent))
+        soul = SoulTensor(
+            amplitude=rng.uniform(1, 30),
+            frequency=rng.uniform(-3, 3),
+            phase=0.0,
+            spin=rng.choice([-1.0, 1.0]),
+            polarity=rng.choice([-1.0, 1.0]),
+        )
+        out.append((pos, soul))
+    # Several sources in one cell, including inside the sanctuary
+    out += [(Vector4(0, 0.2, 0.3, 0.1), SoulTensor(5, f, 0)) for f in (1.0, -2.0, 4.0)]
+    return out
+
+
+def _assert_same_field(sparse, dense, probes):
+    for pos in probes:
+        s = sparse.spatial_map.sample_field(pos, current_tick=sparse.time_tick)
+        d = dense.spatial_map.sample_field(pos, current_tick=dense.time_tick)
+        assert d == pytest.approx(s, rel=1e-12, abs=1e-12)
+
+
+def test_dense_paint_matches_sparse_rules():
+    sparse, dense = FieldSystem(), FieldSystem(bounds=BOUNDS)
+    assert dense.is_dense and not sparse.is_dense
+
+    for tick in range(3):
+        sources = _sources(300, seed=tick)
+        sparse.update_field(sources)
+        dense.update_field(sources)
+        probes = [p for p, _ in sources] + [p + Vector4(0, 0.1, 0, 0) for p, _ in sources]
+        _assert_same_field(sparse, dense, probes)
+
+        # Nodes painted on earlier ticks are stale for both backends
+        old = _sources(300, seed=tick - 1)
+        _assert_same_field(sparse, dense, [p for p, _ in old])
+
+    for pos, soul in _sources(50, seed=2):
+        f_s, r_s = sparse.get_local_forces(pos, soul)
+        f_d, r_d = dense.get_local_forces(pos, soul)
+        assert (f_d.w, f_d.x, f_d.y, f_d.z) == pytest.approx((f_s.w, f_s.x, f_s.y, f_s.z))
+        assert r_d.a == pytest.approx(r_s.a) and r_d.b_xy == pytest.approx(r_s.b_xy)
+
+
+def test_out_of_bounds_sources_are_dropped_and_read_ambient():
+    grid = DenseFieldGrid(Vector4(0, 0, 0, 0), Vector4(1, 4, 4, 4))
+    far = Vector4(0, 10, 10, 10)
+    grid.paint([(far, SoulTensor(50, 2, 0)), (Vector4(0, 3.5, 3.5, 3.5), SoulTensor(10, 1, 0))], tick=1)
+
+    assert grid.sample_field(far, current_tick=1) == (1.0, 0.0, 0.0, 0.0)
+    assert grid.sample_field(Vector4(0, 0.5, 0.5, 0.5), current_tick=1) == (1.0, 1.0, 7.0, 0.0)  # sanctuary
+    w, x, y, z = grid.sample_field(Vector4(0, 3.5, 3.5, 3.5), current_tick=1)
+    assert w == pytest.approx(1.1) and y == pytest.approx(0.1)
+    assert grid.sample_field(Vector4(0, 3.5, 3.5, 3.5), current_tick=2) == (1.0, 0.0, 0.0, 0.0)
+
+
+def test_dense_grid_rejects_other_depths():
+    grid = DenseFieldGrid(Vector4(0, 0, 0, 0), Vector4(1, 2, 2, 2))
+    with pytest.raises(ValueError):
+        grid.sample_field(Vector4(0, 1, 1, 1), depth=1)
+
+
+def test_dense_field_survives_fork_and_snapshot():
+    from elysia_engine.entities import Entity
+    from elysia_engine.math_utils import Vector3
+    from elysia_engine.physics import PhysicsWorld
+    from elysia_engine.snapshot import WorldSnapshot
+    from elysia_engine.world import World
+
+    physics = PhysicsWorld()
+    physics.field_system = FieldSystem(bounds=BOUNDS)
+    world = World(physics=physics)
+    for i in range(8):
+        ent = Entity(id=f"e{i}", soul=SoulTensor(amplitude=10 + i, frequency=1.0 + i, phase=0.0))
+        ent.physics.position = Vector3(i * 1.5, 0.0, 0.0)
+        world.add_entity(ent)
+        physics.register_entity(ent)
+    physics.update_field()
+    probe = Vector4(0, 4 * 1.5, 0, 0)
+    tick = physics.field_system.time_tick
+    expected = physics.field_system.spatial_map.sample_field(probe, current_tick=tick)
+
+    fork = world.fork()
+    fork_grid = fork.physics.field_system.spatial_map
+    assert fork_grid is not physics.field_system.spatial_map
+    fork_grid.w[:] = 0.0
+    assert physics.field_system.spatial_map.sample_field(probe, current_tick=tick) == expected
+
+    restored = WorldSnapshot.capture(world).restore()
+    assert restored.physics.field_system.is_dense
+    assert restored.physics.field_system.spatial_map.sample_field(probe, current_tick=tick) == expected
+
+
+# --- Propagation mode ---
+
+SMALL = (Vector4(0, -4, -4, -4), Vector4(1, 4, 4, 4))
+
+
+def _brute_force_spread(grid, excess, kernel):
+    """Direct O(G^2) X/Y/Z convolution of a flat excess array (zero outside the box)."""
+    idx = np.array(np.unravel_index(np.arange(grid.size), grid.shape)).T * grid.resolution_scale
+    dist = np.sqrt(((idx[:, None, 1:] - idx[None, :, 1:]) ** 2).sum(axis=2))
+    weights = np.where((dist <= kernel.radius) & (idx[:, None, 0] == idx[None, :, 0]), kernel.profile(dist), 0.0)
+    if kernel.normalize:
+        offsets = np.arange(-int(kernel.radius), int(kernel.radius) + 1) * grid.resolution_scale
+        d = np.sqrt(sum(o * o for o in np.meshgrid(offsets, offsets, offsets, indexing="ij")))
+        weights = weights / np.where(d <= kernel.radius, kernel.profile(d), 0.0).sum()
+    return weights @ excess
+
+
+@pytest.mark.parametrize("kernel", [gaussian_kernel(1.0, radius=2.0), inverse_square_kernel(1.5, radius=3.0)])
+def test_propagation_matches_direct_convolution(kernel):
+    sources = [(Vector4(0, x, y, 0.5), SoulTensor(20, f, 0)) for x, y, f in ((-2.5, 1.5, 3.0), (2.5, -1.5, -2.0), (3.5, 3.5, 1.0))]
+    painted = FieldSystem(bounds=SMALL)
+    painted.update_field(sources)
+    spread = FieldSystem(bounds=SMALL, propagation=kernel)
+    spread.update_field(sources)
+
+    pgrid, sgrid = painted.spatial_map, spread.spatial_map
+    fresh = pgrid.last_update == 1
+    excess_w = np.where(fresh, pgrid.w - 1.0, 0.0)
+    excess_y = np.where(fresh, pgrid.y, 0.0)  # no source sits in the sanctuary
+    # Documented bound (DenseFieldGrid.propagate): 1e-12 of the summed |excess|
+    bound_w, bound_y = 1e-12 * np.abs(excess_w).sum(), 1e-12 * np.abs(excess_y).sum()
+    assert np.abs(sgrid.w - 1.0 - _brute_force_spread(sgrid, excess_w, kernel)).max() <= bound_w
+    centres = sgrid.origin + 0.5 + np.array(np.unravel_index(np.arange(sgrid.size), sgrid.shape)).T
+    in_sanctuary = np.sqrt((centres ** 2).sum(axis=1)) < 2.0
+    assert np.abs(sgrid.y - 7.0 * in_sanctuary - _brute_force_spread(sgrid, excess_y, kernel)).max() <= bound_y
+    # X/Z stay local to painted cells; everything is fresh
+    assert np.array_equal(sgrid.x, np.where(fresh, pgrid.x, 1.0 * in_sanctuary))
+    assert (sgrid.last_update == 1).all()
+
+
+def test_point_kernel_reproduces_painting_and_toggles_off():
+    sources = _sources(40, seed=5)
+    painted = FieldSystem(bounds=BOUNDS)
+    spread = FieldSystem(bounds=BOUNDS, propagation=gaussian_kernel(1.0, radius=0.0))
+    painted.update_field(sources)
+    spread.update_field(sources)
+    probes = [p for p, _ in sources]
+    _assert_same_field(painted, spread, probes)
+
+    # Far from every source the spread field still reads the void
+    far = spread.spatial_map.sample_field(Vector4(0, 19.5, 19.5, 19.5), current_tick=1)
+    assert far == pytest.approx((1.0, 0.0, 0.0, 0.0), abs=1e-12)
+
+    spread.spatial_map.propagation = None
+    painted.update_field(sources[:10])
+    spread.update_field(sources[:10])
+    _assert_same_field(painted, spread, probes)
+
+
+def test_diffusion_conserves_painted_total():
+    fs = FieldSystem(bounds=BOUNDS, propagation=gaussian_kernel(1.5))
+    fs.update_field(_sources(30, seed=2, extent=3.0))
+    grid = fs.spatial_map
+
+    reference = FieldSystem(bounds=BOUNDS)
+    reference.update_field(_sources(30, seed=2, extent=3.0))
+    ref = reference.spatial_map
+    assert (grid.w - 1.0).sum() == pytest.approx((ref.w[ref.last_update == 1] - 1.0).sum())
+    assert (grid.w > 1.0).sum() > (ref.last_update == 1).sum()  # influence reached unpainted cells
+
+
+def test_propagation_requires_dense_field():
+    with pytest.raises(ValueError):
+        FieldSystem(propagation=gaussian_kernel(1.0))
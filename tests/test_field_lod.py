@@ -0,0 +1,99 @@
+"""
+Tests for hierarchical LOD levels in FractalSpatialMap / FieldSystem.
+"""
+
+import pytest
+
+from elysia_engine.entities import Entity
+from elysia_engine.field import FieldSystem, LodPolicy
+from elysia_engine.math_utils import Vector3, Vector4
+from elysia_engine.physics import PhysicsWorld
+from elysia_engine.tensor import SoulTensor
+
+
+def _cluster(x0):
+    # Four sources in one depth -1 cell (two depth-0 cells)
+    return [
+        (Vector4(0, x0 + 0.2, 40.2, 0.2), SoulTensor(10, 2.0, 0)),
+        (Vector4(0, x0 + 0.4, 40.4, 0.4), SoulTensor(10, 2.0, 0)),
+        (Vector4(0, x0 + 1.2, 40.2, 0.2), SoulTensor(20, 4.0, 0)),
+        (Vector4(0, x0 + 1.5, 40.5, 0.5), SoulTensor(20, 4.0, 0)),
+    ]
+
+
+def test_coarse_levels_hold_mean_of_touched_children():
+    fs = FieldSystem(lod_levels=2)
+    fs.update_field(_cluster(40.0))
+    smap = fs.spatial_map
+    tick = fs.time_tick
+
+    fine_a = smap.sample_field(Vector4(0, 40.2, 40.2, 0.2), 0, tick)
+    fine_b = smap.sample_field(Vector4(0, 41.2, 40.2, 0.2), 0, tick)
+    for depth in (-1, -2):
+        coarse = smap.sample_field(Vector4(0, 40.2, 40.2, 0.2), depth, tick)
+        assert coarse == pytest.approx(tuple((a + b) / 2 for a, b in zip(fine_a, fine_b)))
+        node = smap.get_node(Vector4(0, 40.2, 40.2, 0.2), depth, create_if_missing=False)
+        assert node is not None and not node.is_leaf
+
+    # Aggregates go stale with their children
+    fs.update_field([])
+    assert smap.sample_field(Vector4(0, 40.2, 40.2, 0.2), -1, fs.time_tick) == (1.0, 0.0, 0.0, 0.0)
+
+
+def test_policy_picks_coarser_levels_with_distance():
+    policy = LodPolicy(near=10.0, foci=[Vector4(0, 0, 0, 0)])
+    assert policy.depth_for(Vector4(0, 5, 0, 0), 3) == 0
+    assert policy.depth_for(Vector4(0, 15, 0, 0), 3) == -1
+    assert policy.depth_for(Vector4(0, 25, 0, 0), 3) == -2
+    assert policy.depth_for(Vector4(0, 1000, 0, 0), 3) == -3
+    assert LodPolicy().depth_for(Vector4(0, 1000, 0, 0), 3) == 0
+
+
+def test_far_reads_use_coarse_level_and_batch_matches_scalar():
+    fs = FieldSystem(lod_levels=3)
+    fs.lod = LodPolicy(near=8.0, foci=[Vector4(0, 0, 0, 0)])
+    fs.update_field(_cluster(40.0) + _cluster(2.0))
+
+    probes = [(0.0, 40.3, 40.3, 0.3), (0.0, 41.0, 40.9, 0.9), (0.0, 2.3, 0.3, 0.3), (0.0, 3.1, 0.1, 0.1)]
+    souls = [SoulTensor(1, 0.5, 0)] * len(probes)
+    forces, angles = fs.get_local_forces_batch(probes, souls)
+    for (w, x, y, z), soul, f, a in zip(probes, souls, forces, angles):
+        force, rotor = fs.get_local_forces(Vector4(w, x, y, z), soul)
+        assert f == pytest.approx((force.w, force.x, force.y, force.z))
+
+    assert fs.depth_for(Vector4(*probes[0])) < 0
+    assert fs.depth_for(Vector4(*probes[2])) == 0
+
+
+def test_lod_levels_build_a_default_policy():
+    assert FieldSystem().lod is None
+    world = PhysicsWorld()
+    world.field_system = FieldSystem(lod_levels=2)
+    assert isinstance(world.field_system.lod, LodPolicy)
+    observer = Entity(id="eye", soul=SoulTensor(5, 1.0, 0))
+    world.register_entity(observer)
+    world.observers.append(observer)
+
+    world.update_field()
+    fs = world.field_system
+    assert fs.depth_for(Vector4(0, 1.0, 0, 0)) == 0
+    assert fs.depth_for(Vector4(0, 200.0, 0, 0)) == -2
+
+
+def test_lod_requires_sparse_field():
+    with pytest.raises(ValueError):
+        FieldSystem(bounds=(Vector4(-1, -1, -1, -1), Vector4(1, 1, 1, 1)), lod_levels=2)
+
+
+def test_physics_world_feeds_observers_as_foci():
+    world = PhysicsWorld()
+    world.field_system = FieldSystem(lod_levels=2)
+    world.field_system.lod = LodPolicy(near=4.0)
+    observer = Entity(id="eye")
+    observer.physics.position = Vector3(30.0, 0.0, 0.0)
+    observer.soul = SoulTensor(5, 1.0, 0)
+    world.register_entity(observer)
+    world.observers.append(observer)
+
+    world.update_field()
+    assert world.field_system.lod.foci == [Vector4(0, 30.0, 0.0, 0.0)]
@@ -0,0 +1,53 @@
+"""
+Tests for the cell-indexed HolographicBoundary sampler.
+"""
+
+import math
+import random
+
+import pytest
+
+from elysia_engine.math_utils import Vector3
+from elysia_engine.physics import HolographicBoundary
+
+
+def _textured_shell(resolution=30, accuracy=0.0):
+    shell = HolographicBoundary.spherical_shell(radius=10.0, resolution=resolution)
+    samples = [(p, math.sin(p.x) + 0.1 * p.y) for p, _ in shell.samples]
+    return HolographicBoundary(samples=samples, thickness=0.25, accuracy=accuracy)
+
+
+def _probes(n, seed=0, extent=14.0):
+    rng = random.Random(seed)
+    return [Vector3(rng.uniform(-extent, extent), rng.uniform(-extent, extent), rng.uniform(-extent, extent)) for _ in range(n)]
+
+
+@pytest.mark.parametrize("accuracy", [0.1, 0.4])
+def test_approximate_sampling_tracks_exact_idw(accuracy):
+    exact, approx = _textured_shell(), _textured_shell(accuracy=accuracy)
+    probes = _probes(100) + [Vector3(0, 0, 0)]
+    spread = max(p for _, p in exact.samples) - min(p for _, p in exact.samples)
+    for want, got in zip(exact.sample_many(probes), approx.sample_many(probes)):
+        assert got == pytest.approx(want, abs=accuracy * spread)
+
+
+def test_contact_returns_first_sample_in_list_order():
+    samples = [(Vector3(1, 0, 0), 3.0), (Vector3(1.05, 0, 0), 4.0), (Vector3(-9, 0, 0), -1.0)]
+    exact = HolographicBoundary(samples=samples, thickness=0.1)
+    approx = HolographicBoundary(samples=samples, thickness=0.1, accuracy=0.5, cell_size=0.02)
+    probe = Vector3(1.03, 0, 0)
+    assert approx.sample(probe) == exact.sample(probe) == 3.0
+
+
+def test_sample_many_matches_sample_and_index_follows_edits():
+    boundary = _textured_shell(resolution=12, accuracy=0.3)
+    probes = _probes(20, seed=3)
+    assert boundary.sample_many(probes) == [boundary.sample(p) for p in probes]
+
+    boundary.samples.append((Vector3(0.5, 0.5, 0.5), 99.0))  # length change is picked up
+    assert boundary.sample(Vector3(0.5, 0.5, 0.5)) == 99.0
+    boundary.samples[-1] = (Vector3(0.5, 0.5, 0.5), -99.0)
+    boundary.rebuild_index()
+    assert boundary.sample(Vector3(0.5, 0.5, 0.5)) == -99.0
+
+    assert HolographicBoundary(accuracy=0.3).sample_many(probes) == [None] * len(probes)
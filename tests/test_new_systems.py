@@ -7,6 +7,9 @@ Tests for new Elysia Engine systems:
 - CosmicResonanceField
 """
 
+import math
+import random
+
 import pytest
 from elysia_engine.tensor import SoulTensor
 from elysia_engine.physics import PhysicsState
@@ -103,6 +106,88 @@ class TestThermodynamicsSystem:
         assert hot.soul.frequency < initial_hot_freq
         assert cold.soul.frequency > initial_cold_freq
 
+    @staticmethod
+    def _reference_transfer(system, entities, dt):
+        """The full i < j scan the cell list replaces."""
+        transfers = []
+        for i, e1 in enumerate(entities):
+            for e2 in entities[i + 1:]:
+                if e1.soul.is_collapsed or e2.soul.is_collapsed:
+                    continue
+                dist = (e1.physics.position - e2.physics.position).magnitude
+                freq_diff = e1.soul.frequency - e2.soul.frequency
+                if dist > system.interaction_radius or abs(freq_diff) < 0.1:
+                    continue
+                phase_diff = abs(e1.soul.phase - e2.soul.phase)
+                if phase_diff > math.pi:
+                    phase_diff = 2 * math.pi - phase_diff
+                resonance = math.cos(phase_diff)
+                if resonance > 0:
+                    amount = freq_diff * system.heat_transfer_rate * (1.0 / (1.0 + dist)) * resonance * dt
+                    transfers.append((e1.soul, e2.soul, amount))
+        for s1, s2, amount in transfers:
+            s1.frequency -= amount * 0.5
+            s2.frequency += amount * 0.5
+
+    @pytest.mark.parametrize("vectorized", [True, False])
+    def test_cell_list_transfer_matches_full_scan(self, monkeypatch, vectorized):
+        """Cell-list heat transfer gives the same frequencies as the full pair scan."""
+        import elysia_engine.systems.thermodynamics as thermo
+
+        if not vectorized:
+            monkeypatch.setattr(thermo, "np", None)
+        rng = random.Random(7)
+
+        def population():
+            rng.seed(7)
+            ents = []
+            for i in range(150):
+                e = Entity(id=f"t{i}")
+                e.soul = SoulTensor(
+                    amplitude=10, frequency=rng.uniform(20, 400), phase=rng.uniform(0, 2 * math.pi),
+                    is_collapsed=rng.random() < 0.1,
+                )
+                e.physics.position = Vector3(*(rng.uniform(-12, 12) for _ in range(3)))
+                ents.append(e)
+            return ents
+
+        system = ThermodynamicsSystem(heat_transfer_rate=0.3, interaction_radius=4.0)
+        expected, actual = population(), population()
+        self._reference_transfer(system, expected, 1.0)
+        system._apply_heat_transfer(actual, 1.0)
+
+        for e, a in zip(expected, actual):
+            assert a.soul.frequency == pytest.approx(e.soul.frequency, rel=1e-12, abs=1e-12)
+        # Some pairs actually exchanged heat
+        assert any(e.soul.frequency != f.soul.frequency for e, f in zip(expected, population()))
+
+    def test_cell_list_far_apart_clusters(self):
+        """A cell box too large for int64 codes gives the same candidates and transfers."""
+        far = 2.0 ** 32 - 3  # y/z spans of 2**32 cells: x would wrap out of the codes
+        centers = [(0.0, 0.0, 0.0), (1000.0, 0.0, 0.0), (0.0, far, far), (1000.0, far, far)]
+
+        def population():
+            rng = random.Random(11)
+            ents = []
+            for i in range(40):
+                e = Entity(id=f"c{i}")
+                e.soul = SoulTensor(amplitude=10, frequency=rng.uniform(20, 400), phase=rng.uniform(0, 1))
+                e.physics.position = Vector3(*(c + rng.uniform(0.1, 0.9) for c in centers[i % 4]))
+                ents.append(e)
+            return ents
+
+        system = ThermodynamicsSystem(heat_transfer_rate=0.3, interaction_radius=1.0)
+        positions = [e.physics.position for e in population()]
+        first, second = system._candidate_arrays(positions)
+        assert sorted(zip(first.tolist(), second.tolist())) == system._candidate_pairs(positions)
+
+        expected, actual = population(), population()
+        self._reference_transfer(system, expected, 1.0)
+        system._apply_heat_transfer(actual, 1.0)
+        for e, a in zip(expected, actual):
+            assert a.soul.frequency == pytest.approx(e.soul.frequency, rel=1e-12, abs=1e-12)
+        assert any(e.soul.frequency != f.soul.frequency for e, f in zip(expected, population()))
+
     def test_ignite(self):
         """Ignite should melt frozen souls."""
         world = World()
@@ -174,6 +259,74 @@ class TestVoidSystem:
         assert system.recycled_energy > 0
         assert system.entities_absorbed == 1
 
+    @staticmethod
+    def _dormancy_world(system):
+        world = World()
+        for name, velocity in (("sleeper", 0.0), ("drifter", 1.0)):
+            e = Entity(id=name)
+            e.soul = SoulTensor(amplitude=50, frequency=0, phase=0)
+            e.physics.velocity = Vector3(velocity, 0, 0)
+            world.add_entity(e)
+        world.add_system(system)
+        return world
+
+    def test_dormancy_from_activity(self):
+        """Entities idle past dormancy_ticks are absorbed; moving ones stay."""
+        system = VoidSystem(dormancy_ticks=5, spontaneous_emergence_rate=0.0)
+        world = self._dormancy_world(system)
+        world.step(dt=0.0)  # Both souls uncollapsed: active at tick 1
+        world.entities["sleeper"].soul.is_collapsed = True
+        world.entities["drifter"].soul.is_collapsed = True
+
+        for _ in range(5):
+            world.step(dt=0.0)
+        assert "sleeper" in world.entities  # Idle for exactly dormancy_ticks
+
+        world.step(dt=0.0)
+        assert "sleeper" not in world.entities
+        assert system._last_activity["drifter"] == world.tick
+        assert system.entities_absorbed == 1
+        assert system.get_void_statistics()["tracked_entities"] == 1
+
+        for _ in range(20):
+            world.step(dt=0.0)
+        assert "drifter" in world.entities
+
+    def test_dormancy_without_world_step(self):
+        """Activity is judged from current state, however the entities were driven."""
+        system = VoidSystem(dormancy_ticks=2, spontaneous_emergence_rate=0.0)
+        world = self._dormancy_world(system)
+        world.tick += 1
+        system.step(world, dt=0.0)  # Both souls uncollapsed: active
+        for e in world.entities.values():
+            e.soul.is_collapsed = True
+        world.entities["drifter"].physics.velocity = Vector3(0, 0, 0)
+        world.entities["sleeper"].physics.velocity = Vector3(1.0, 0, 0)
+
+        for _ in range(4):
+            world.tick += 1
+            system.step(world, dt=0.0)
+        assert "sleeper" in world.entities and "drifter" not in world.entities
+        assert system._last_activity["sleeper"] == world.tick
+
+    def test_dormant_crystal_rechecked(self):
+        """A crystallized dormant entity survives and is re-checked once the flag drops."""
+        system = VoidSystem(dormancy_ticks=2, spontaneous_emergence_rate=0.0)
+        world = self._dormancy_world(system)
+        sleeper = world.entities["sleeper"]
+        sleeper.data["crystallized"] = True
+        world.step(dt=0.0)
+        sleeper.soul.is_collapsed = True
+
+        for _ in range(5):
+            world.step(dt=0.0)
+        assert sleeper.data["void_reason"] == "dormancy"
+        assert "sleeper" in world.entities
+
+        del sleeper.data["crystallized"]
+        world.step(dt=0.0)
+        assert "sleeper" not in world.entities
+
     def test_entropy_score(self):
         """Should calculate entropy score."""
         world = World()
@@ -235,6 +388,75 @@ class TestGenesisSystem:
         
         assert len(world.entities) > initial_count
 
+    class _FullScanGenesis(GenesisSystem):
+        """The O(E^2) pair scan the spatial mate search replaces."""
+
+        def step(self, world, dt):
+            eligible = [
+                e for e in world.entities.values()
+                if e.soul is not None and not e.soul.is_collapsed and e.soul.amplitude >= 10.0
+                and world.tick - self._last_replication.get(e.id, 0) >= self.replication_cooldown
+            ]
+            born = []
+            for i, p1 in enumerate(eligible):
+                for p2 in eligible[i + 1:]:
+                    if len(born) >= self.max_offspring_per_tick:
+                        break
+                    if (p1.physics.position - p2.physics.position).magnitude > self.replication_distance:
+                        continue
+                    resonance = p1.soul.resonance_value(p2.soul)
+                    if resonance >= self.replication_resonance_threshold:
+                        born.append(self._create_offspring(world, p1, p2, resonance))
+                        self._last_replication[p1.id] = self._last_replication[p2.id] = world.tick
+            for child in born:
+                world.add_entity(child)
+
+    def test_spatial_mate_search_matches_full_scan(self):
+        """Same births, in the same order, as scanning every eligible pair."""
+
+        def run(system_cls):
+            rng = random.Random(11)
+            world = World()
+            for i in range(300):
+                e = Entity(id=f"g{i}")
+                e.soul = SoulTensor(amplitude=rng.uniform(5, 60), frequency=100, phase=rng.uniform(0, 1.0))
+                e.physics.position = Vector3(*(rng.uniform(-8, 8) for _ in range(3)))
+                world.add_entity(e)
+            system = system_cls(replication_cooldown=3, max_offspring_per_tick=4)
+            random.seed(5)
+            history = []
+            for tick in range(12):
+                world.tick = tick
+                system.step(world, 1.0)
+                history.append(sorted(world.entities))
+            return history, system
+
+        expected, reference = run(self._FullScanGenesis)
+        actual, system = run(GenesisSystem)
+        assert actual == expected
+        assert system.total_births == reference.total_births > 4
+        assert system._last_replication == reference._last_replication
+
+    def test_cooldown_queue_releases_parents(self):
+        """Parents re-enter the eligible set exactly when their cooldown expires."""
+        world = World()
+        for i in range(2):
+            e = Entity(id=f"p{i}")
+            e.soul = SoulTensor(amplitude=1000, frequency=100, phase=0)
+            world.add_entity(e)
+        system = GenesisSystem(replication_cooldown=5, max_offspring_per_tick=1)
+        world.tick = 4
+        assert system._get_eligible_parents(world) == []
+
+        world.tick = 5
+        system.step(world, 1.0)
+        assert system.total_births == 1
+        for tick in range(6, 10):
+            world.tick = tick
+            assert not {"p0", "p1"} & {e.id for e in system._get_eligible_parents(world)}
+        world.tick = 10
+        assert {"p0", "p1"} <= {e.id for e in system._get_eligible_parents(world)}
+
     def test_genesis_statistics(self):
         """Should track birth statistics."""
         world = World()
@@ -295,6 +517,107 @@ class TestFractalEvolutionSystem:
         # Should evolve with enough experience
         assert entity.dimension >= 1
 
+    class _EveryStepEvolution(FractalEvolutionSystem):
+        """Checks every entity every step, as before the check queue."""
+
+        def step(self, world, dt):
+            self._clock += 1
+            for entity in world.entities.values():
+                self._born.setdefault(entity.id, self._clock - 1)
+                next_dim = entity.dimension + 1
+                if next_dim <= DimensionalState.HYPERVOLUME and self._meets_requirements(entity, next_dim, world):
+                    self._evolve(entity, next_dim, world)
+
+    def test_check_queue_matches_every_step_scan(self):
+        """Same evolutions, at the same ticks, as re-checking everyone each step."""
+
+        def run(system_cls):
+            rng = random.Random(5)
+            world = World()
+            for i in range(60):
+                e = Entity(id=f"f{i}")
+                e.soul = SoulTensor(
+                    amplitude=rng.uniform(10, 40),
+                    frequency=rng.choice([0.0, 0.01, 0.2]),
+                    phase=rng.uniform(0, 0.5),
+                    is_collapsed=rng.random() < 0.3,
+                )
+                world.add_entity(e)
+            system = system_cls(experience_per_dimension=7, resonance_threshold=0.5)
+            ids = list(world.entities)
+            for tick in range(300):
+                world.tick = tick
+                ent = world.entities[rng.choice(ids)]
+                action = rng.random()
+                if action < 0.3:
+                    ent.bonds.append(rng.choice(ids))
+                elif action < 0.4:
+                    ent.soul.is_collapsed = not ent.soul.is_collapsed
+                elif action < 0.5:
+                    ent.soul.amplitude = rng.uniform(10, 40)
+                elif action < 0.52:
+                    ent.dimension = 0
+                for e in world.entities.values():
+                    e.soul.step(1.0)
+                system.step(world, dt=1.0)
+            return sorted((ev["tick"], ev["entity_id"], ev["to_dimension"]) for ev in system._evolution_events)
+
+        events = run(FractalEvolutionSystem)
+        assert len({dim for _, _, dim in events}) >= 3
+        assert events == run(self._EveryStepEvolution)
+
+    def test_stable_population_is_not_rechecked(self, monkeypatch):
+        """Without state changes, checks happen only at experience thresholds."""
+        world = World()
+        for i in range(20):
+            e = Entity(id=f"s{i}")
+            e.soul = SoulTensor(amplitude=50, frequency=0, phase=0, is_collapsed=True)
+            e.bonds = [f"s{(i + 1) % 20}"]
+            world.add_entity(e)
+        system = FractalEvolutionSystem(experience_per_dimension=5)
+        checks = []
+        original = system._blocking_requirement
+        monkeypatch.setattr(
+            system, "_blocking_requirement",
+            lambda entity, *args: checks.append(entity.id) or original(entity, *args),
+        )
+
+        for _ in range(50):
+            system.step(world, dt=1.0)
+        # First sight, the 1D threshold (step 5), the follow-up at step 6
+        # and the 2D threshold (step 10), after which only a bond can help
+        assert len(checks) == 4 * 20
+        assert all(e.dimension == 1 for e in world.entities.values())
+        assert system.experience("s0") == 50
+
+    def test_resonance_block_waits_for_axis_writes(self, monkeypatch):
+        """Out-of-tune entities are re-checked only after some soul axis moves."""
+        world = World()
+        for i in range(10):
+            e = Entity(id=f"r{i}")
+            e.soul = SoulTensor(amplitude=50, frequency=0, phase=math.pi * (i % 2), is_collapsed=True)
+            e.bonds = [f"r{(i + 1) % 10}"]
+            world.add_entity(e)
+        system = FractalEvolutionSystem(experience_per_dimension=1)
+        checks = []
+        original = system._blocking_requirement
+        monkeypatch.setattr(
+            system, "_blocking_requirement",
+            lambda entity, *args: checks.append(entity.id) or original(entity, *args),
+        )
+
+        for _ in range(20):
+            system.step(world, dt=1.0)
+        # Experience is met on first sight; the opposed phases block everyone
+        assert len(checks) == 10
+        assert all(e.dimension == 0 for e in world.entities.values())
+
+        for e in world.entities.values():
+            e.soul.phase = 0.0
+        system.step(world, dt=1.0)
+        assert len(checks) == 2 * 10
+        assert all(e.dimension == 1 for e in world.entities.values())
+
     def test_evolution_summary(self):
         """Should produce evolution summary."""
         world = World()
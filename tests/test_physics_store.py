@@ -0,0 +1,112 @@
+"""
+Tests for the optional Struct-of-Arrays physics backend.
+"""
+
+import copy
+from dataclasses import asdict
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from elysia_engine.entities import Entity
+from elysia_engine.math_utils import Vector3
+from elysia_engine.physics import PhysicsState, PhysicsWorld
+from elysia_engine.physics_store import ArrayPhysicsState, PhysicsArrayStore
+from elysia_engine.tensor import SoulTensor
+
+
+def _populate(physics: PhysicsWorld, n: int = 20) -> None:
+    for i in range(n):
+        ent = Entity(
+            id=f"e{i}",
+            soul=SoulTensor(amplitude=5 + i, frequency=1.0 + 0.1 * i, phase=0.3 * i),
+        )
+        # 5 units apart: no bonds, so trajectories depend on integration only
+        ent.physics.position = Vector3(5.0 * i, 0.5 * i, -1.0 * i)
+        ent.physics.velocity = Vector3(0.1, 0.0, -0.2)
+        physics.register_entity(ent)
+
+
+class TestArrayPhysicsState:
+    def test_view_reads_and_writes_through(self):
+        store = PhysicsArrayStore(capacity=2)
+        view = store.attach(PhysicsState(position=Vector3(1, 2, 3), mass=2.0))
+
+        view.apply_force(Vector3(2, 0, 0), dt=1.0)
+        view.step(1.0)
+        view.position = Vector3(view.position.x, 10.0, view.position.z)
+
+        assert isinstance(view, PhysicsState)
+        assert view.position == Vector3(2, 10, 3)
+        assert np.allclose(store.position[view.row], [2, 10, 3])
+        assert asdict(view)["mass"] == 2.0
+
+    def test_reads_are_detached_copies(self):
+        store = PhysicsArrayStore(capacity=2)
+        plain = PhysicsState(velocity=Vector3(1, 0, 0))
+        view = store.attach(PhysicsState(velocity=Vector3(1, 0, 0)))
+        for state in (plain, view):
+            old = state.position
+            state.step(1.0)
+            assert (state.position - old).x == 1.0
+            assert old == Vector3(0, 0, 0)
+
+    def test_store_grows_and_reuses_rows(self):
+        store = PhysicsArrayStore(capacity=1)
+        views = [store.attach(PhysicsState(position=Vector3(i, 0, 0))) for i in range(5)]
+        assert store.capacity >= 5
+        assert [v.position.x for v in views] == [0, 1, 2, 3, 4]
+
+        store.release(views[2])
+        fresh = store.attach(PhysicsState(position=Vector3(9, 9, 9)))
+        assert fresh.row == views[2].row
+        assert len(store) == 5
+
+
+class TestArrayBackedPhysicsWorld:
+    def test_register_attaches_entities(self):
+        physics = PhysicsWorld(array_backend=True)
+        _populate(physics, 3)
+        assert all(isinstance(e.physics, ArrayPhysicsState) for e in physics.entities)
+
+    def test_vectorized_step_matches_per_object_step(self):
+        scalar = PhysicsWorld()
+        _populate(scalar)
+        arrayed = PhysicsWorld(array_backend=True)
+        _populate(arrayed)
+
+        for _ in range(10):
+            scalar.step(0.5)
+            arrayed.step(0.5)
+
+        for a, b in zip(scalar.entities, arrayed.entities):
+            assert a.physics.position.x == pytest.approx(b.physics.position.x)
+            assert a.physics.position.y == pytest.approx(b.physics.position.y)
+            assert a.physics.position.z == pytest.approx(b.physics.position.z)
+            assert a.physics.mass == pytest.approx(b.physics.mass)
+
+    def test_array_binding_matches_per_object_binding(self):
+        worlds = []
+        for array_backend in (False, True):
+            physics = PhysicsWorld(array_backend=array_backend)
+            for i in range(30):
+                ent = Entity(id=f"e{i}", soul=SoulTensor(amplitude=2, frequency=1.0, phase=0.01 * i))
+                ent.physics.position = Vector3(0.3 * (i % 5), 0.3 * (i // 5), 0.0)
+                physics.register_entity(ent)
+            for _ in range(3):
+                physics.step(0.1)
+            worlds.append(physics)
+
+        scalar, arrayed = worlds
+        assert [(e.id, list(e.bonds), e.dimension) for e in scalar.entities] == \
+            [(e.id, list(e.bonds), e.dimension) for e in arrayed.entities]
+        assert any(e.bonds for e in arrayed.entities)
+
+    def test_clone_keeps_views_isolated(self):
+        physics = PhysicsWorld(array_backend=True)
+        _populate(physics, 2)
+        forked = copy.deepcopy(physics)
+
+        forked.entities[0].physics.position = Vector3(-1, -1, -1)
+        assert physics.entities[0].physics.position == Vector3(0, 0, 0)
@@ -0,0 +1,118 @@
+"""
+Tests for the tick profiler exposed on World.
+"""
+
+import io
+import json
+
+from elysia_engine.entities import Entity
+from elysia_engine.physics import PhysicsWorld
+from elysia_engine.profiling import (
+    DIMENSIONAL_BINDING,
+    ENTITY_UPDATE,
+    FIELD_BLOOM,
+    GEODESIC_FLOW,
+    NEIGHBOR_INDEX,
+    TICK,
+    TickProfiler,
+)
+from elysia_engine.systems.thermodynamics import ThermodynamicsSystem
+from elysia_engine.tensor import SoulTensor
+from elysia_engine.world import World
+
+
+def _world() -> World:
+    world = World(physics=PhysicsWorld())
+    for i in range(5):
+        ent = Entity(id=f"e{i}", soul=SoulTensor(amplitude=10, frequency=1.0, phase=0.1 * i))
+        world.add_entity(ent)
+        world.physics.register_entity(ent)
+    world.add_system(ThermodynamicsSystem())
+    return world
+
+
+def test_profiling_is_off_by_default():
+    world = _world()
+    world.step()
+    assert world.profiler is None
+    assert world.profile_report() == {}
+
+
+def test_report_covers_phases_and_systems():
+    world = _world()
+    world.enable_profiling(window=10)
+    for _ in range(3):
+        world.step()
+
+    report = world.profile_report()
+    for label in (TICK, ENTITY_UPDATE, GEODESIC_FLOW, DIMENSIONAL_BINDING, "system.ThermodynamicsSystem"):
+        assert label in report
+    assert report[ENTITY_UPDATE]["calls"] == 15
+    assert report[GEODESIC_FLOW]["calls"] == 15
+    assert report[TICK]["ticks"] == 3
+    assert report[TICK]["p50_ms"] <= report[TICK]["p99_ms"]
+
+    world.disable_profiling()
+    assert world.physics.profiler is None
+
+
+def test_physics_step_reports_field_bloom():
+    physics = PhysicsWorld()
+    physics.profiler = TickProfiler()
+    physics.register_entity(Entity(id="a", soul=SoulTensor(amplitude=1, frequency=1.0, phase=0.0)))
+    physics.step(1.0)
+
+    report = physics.profiler.report()
+    assert report["physics.field_bloom"]["calls"] == 1
+    assert report[TICK]["ticks"] == 1
+
+
+def test_json_lines_sink_and_window():
+    sink = io.StringIO()
+    profiler = TickProfiler(window=2, sink=sink)
+    for tick in range(3):
+        profiler.begin_tick(tick)
+        profiler.add("work", 0.001 * (tick + 1))
+        profiler.end_tick()
+
+    lines = [json.loads(line) for line in sink.getvalue().splitlines()]
+    assert [line["tick"] for line in lines] == [0, 1, 2]
+    assert lines[2]["sections"]["work"]["calls"] == 1
+    assert profiler.report()["work"]["ticks"] == 2
+    assert profiler.report()["work"]["calls"] == 3
+
+
+def test_clone_drops_profiler():
+    world = _world()
+    world.enable_profiling()
+    assert world.clone().profiler is None
+
+
+class _Failing(ThermodynamicsSystem):
+    def step(self, world, dt):
+        if world.tick == 2:
+            raise RuntimeError("boom")
+        super().step(world, dt)
+
+
+def test_tick_is_closed_when_a_system_raises():
+    world = _world()
+    world.add_system(_Failing())
+    world.enable_profiling(window=10)
+    world.step()
+    try:
+        world.step()
+    except RuntimeError:
+        pass
+    world.step()
+    assert world.profiler._depth == 0
+    assert world.profile_report()[TICK]["ticks"] == 3
+
+
+def test_neighbor_index_has_its_own_section():
+    world = _world()
+    world.enable_profiling(window=10)
+    world.step()
+    report = world.profile_report()
+    assert report[NEIGHBOR_INDEX]["calls"] >= 1
+    assert FIELD_BLOOM not in report  # World.step does not bloom the field
@@ -0,0 +1,137 @@
+"""
+Tests for WorldSnapshot and DreamSystem.prophecy_many.
+"""
+
+import random
+
+from elysia_engine.chronos import DreamSystem
+from elysia_engine.consciousness import GlobalConsciousness
+from elysia_engine.entities import Entity
+from elysia_engine.field import FieldSystem
+from elysia_engine.math_utils import Vector3
+from elysia_engine.physics import PhysicsWorld
+from elysia_engine.snapshot import WorldSnapshot
+from elysia_engine.systems.genesis import GenesisSystem
+from elysia_engine.systems.thermodynamics import ThermodynamicsSystem
+from elysia_engine.tensor import SoulTensor
+from elysia_engine.world import World
+
+
+def _world(array_backend: bool = False) -> World:
+    world = World(physics=PhysicsWorld(array_backend=array_backend))
+    for i in range(16):
+        ent = Entity(
+            id=f"e{i}",
+            soul=SoulTensor(amplitude=10 + i, frequency=1.0 + 0.05 * i, phase=0.3 * i),
+            data={"tag": i},
+            bonds=[f"e{(i + 1) % 16}"] if i % 2 else [],
+            role="seer" if i == 3 else None,
+        )
+        ent.physics.position = Vector3(i * 0.4, (i % 4) * 0.3, 0.0)
+        ent.physics.velocity = Vector3(0.05, 0.0, 0.0)
+        world.add_entity(ent)
+        world.physics.register_entity(ent)
+    world.entities["e0"].soul.entangled_peers.append(world.entities["e5"].soul)
+    world.tick = 100  # past the Genesis cooldown
+    world.physics.update_field()
+    world.add_system(ThermodynamicsSystem())
+    world.add_system(GenesisSystem())
+    world.add_system(DreamSystem())
+    world.add_system(GlobalConsciousness())
+    return world
+
+
+def _state(world: World):
+    return [
+        (
+            key, ent.id, ent.physics.position, ent.physics.velocity, ent.physics.mass,
+            ent.soul.amplitude, ent.soul.frequency, ent.soul.phase, ent.soul.is_collapsed,
+            ent.bonds, ent.data, ent.role, ent.dimension,
+        )
+        for key, ent in world.entities.items()
+    ]
+
+
+def test_snapshot_round_trip_rebuilds_world():
+    world = _world()
+    restored = WorldSnapshot.from_bytes(WorldSnapshot.capture(world).to_bytes()).restore()
+
+    assert _state(restored) == _state(world)
+    assert [type(s) for s in restored.systems] == [type(s) for s in world.systems]
+    assert restored.systems[-1].physics is None
+    assert restored.entities["e0"].soul.entangled_peers[0] is restored.entities["e5"].soul
+    assert [e.id for e in restored.physics.entities] == [e.id for e in world.physics.entities]
+    assert restored.physics.field_system.time_tick == world.physics.field_system.time_tick
+
+
+def test_snapshot_relinks_system_references():
+    world = _world()
+    gc = GlobalConsciousness(physics=world.physics)
+    world.add_system(gc)
+    restored = WorldSnapshot.capture(world).restore()
+    assert restored.systems[-1].physics is restored.physics
+
+
+def test_restored_world_evolves_like_a_fork():
+    world = _world()
+    world.systems = [s for s in world.systems if isinstance(s, ThermodynamicsSystem)]
+    fork = world.fork()
+    restored = WorldSnapshot.capture(world).restore()
+    for _ in range(5):
+        fork.step(1.0)
+        restored.step(1.0)
+    assert _state(restored) == _state(fork)
+
+
+def test_snapshot_keeps_lod_observers():
+    world = _world()
+    world.systems = [s for s in world.systems if isinstance(s, ThermodynamicsSystem)]
+    world.physics.field_system = FieldSystem(lod_levels=2)
+    world.physics.observers.append(world.entities["e3"])
+    fork = world.fork()
+    restored = WorldSnapshot.from_bytes(WorldSnapshot.capture(world).to_bytes()).restore()
+    assert restored.physics.observers == [restored.entities["e3"]]
+    assert restored.physics.observers[0] is restored.entities["e3"]
+
+    for _ in range(3):
+        fork.step(1.0)
+        restored.step(1.0)
+    assert restored.physics.field_system.lod.foci == fork.physics.field_system.lod.foci
+    assert _state(restored) == _state(fork)
+
+
+def test_prophecy_many_is_deterministic_and_worker_independent():
+    world = _world()
+    dream = DreamSystem()
+    before = _state(world)
+    rng_state = random.getstate()
+
+    serial = dream.prophecy_many(world, horizons=[5, 2], variations=3, workers=1, seed=7)
+    parallel = dream.prophecy_many(world, horizons=[2, 5], variations=3, workers=2, seed=7)
+
+    assert serial == parallel
+    assert [(m.variation, m.horizon) for m in serial] == [(k, h) for k in range(3) for h in (2, 5)]
+    assert [m.tick for m in serial] == [102, 105] * 3
+    assert len({m.alignment for m in serial if m.horizon == 5}) > 1  # seeds diverge
+    assert _state(world) == before
+    assert random.getstate() == rng_state
+
+
+def test_prophecy_many_without_perturbation_matches_present_at_horizon_zero():
+    world = _world()
+    observer = GlobalConsciousness()
+    observer.calculate_metrics(world)
+
+    (metrics,) = DreamSystem().prophecy_many(world, horizons=[0], variations=1, workers=0, perturbation=0.0)
+    assert metrics.population == len(world.entities)
+    assert metrics.alignment == observer.alignment_score
+    assert metrics.total_amplitude == sum(e.soul.amplitude for e in world.entities.values())
+
+
+def test_prophecy_many_on_array_backed_world():
+    world = _world(array_backend=True)
+    before = _state(world)
+    metrics = DreamSystem().prophecy_many(world, horizons=[3], variations=2, workers=1, seed=7)
+    assert [m.tick for m in metrics] == [103, 103]
+    assert metrics == DreamSystem().prophecy_many(_world(), horizons=[3], variations=2, workers=1, seed=7)
+    assert _state(world) == before
@@ -0,0 +1,43 @@
+"""
+Tests for the allocation-free resonance forms (SoulTensor.resonance_value & co).
+"""
+
+import random
+
+import pytest
+
+from elysia_engine.tensor import SoulTensor
+from elysia_engine.tensor_array import SoulTensorArray
+
+
+def _souls(n, seed=3):
+    rng = random.Random(seed)
+    return [
+        SoulTensor(
+            amplitude=rng.uniform(1, 10),
+            frequency=rng.uniform(0.5, 3.0),
+            phase=rng.uniform(-7.0, 7.0),  # Unwrapped phases too
+            polarity=rng.choice((1.0, -1.0)),
+        )
+        for _ in range(n)
+    ]
+
+
+def test_resonance_value_matches_resonate():
+    souls = _souls(40)
+    for a in souls[:10]:
+        for b in souls:
+            assert a.resonance_value(b) == a.resonate(b)["resonance"]
+
+
+def test_batch_forms_match_pairwise():
+    probe, *others = _souls(50)
+    expected = [probe.resonance_value(o) for o in others]
+    assert probe.resonance_values(others) == expected
+    assert probe.resonance_values([]) == []
+
+    store = SoulTensorArray()
+    for soul in others:
+        store.attach(soul)
+    assert list(store.resonance_values(probe)) == pytest.approx(expected)
+    assert list(store.resonance_values(probe, rows=[3, 7])) == pytest.approx([expected[3], expected[7]])
@@ -0,0 +1,142 @@
+"""
+Tests for the round-robin, change-aware sediment layer (The Abyss).
+"""
+
+import pytest
+
+from elysia_engine.entities import Entity
+from elysia_engine.math_utils import Vector3
+from elysia_engine.physics import ABYSS_THRESHOLD, SEDIMENT_RATE, PhysicsWorld
+from elysia_engine.snapshot import WorldSnapshot
+from elysia_engine.tensor import SoulTensor
+from elysia_engine.world import World
+
+
+def _heavy(i):
+    # ~20 kB of data -> entropy ~200 -> mass ~100, far below the field
+    ent = Entity(id=f"s{i}", soul=SoulTensor(1.0, 1.618, 0.0), data={"scan": "x" * 20_000})
+    ent.physics.position = Vector3(1000.0 + 10 * i, 0.0, 0.0)
+    ent.physics.velocity = Vector3(1.0, 0.0, 0.0)
+    return ent
+
+
+def _abyss(n):
+    physics = PhysicsWorld()
+    ents = [_heavy(i) for i in range(n)]
+    for ent in ents:
+        physics.register_entity(ent)
+    physics.step(1.0)
+    assert len(physics.sediment_layer) == n and not physics.entities
+    return physics, ents
+
+
+def _count_entropy(monkeypatch, physics):
+    calls = []
+    original = physics.calculate_entropy
+    monkeypatch.setattr(physics, "calculate_entropy", lambda ent: calls.append(ent) or original(ent))
+    return calls
+
+
+def test_visits_are_spread_and_unchanged_sediments_skip_governance(monkeypatch):
+    physics, ents = _abyss(250)
+    calls = _count_entropy(monkeypatch, physics)
+
+    per_tick = []
+    for _ in range(SEDIMENT_RATE):
+        before = len(calls)
+        physics.step(1.0)
+        per_tick.append(len(calls) - before)
+    # First pass: every entry computes its entropy once, a few per tick
+    assert sum(per_tick) <= 250
+    assert max(per_tick) <= -(-250 // SEDIMENT_RATE)
+    assert all(entry.key is not None for entry in physics.sediment_layer._members.values())
+
+    calls.clear()
+    for _ in range(2 * SEDIMENT_RATE):
+        physics.step(1.0)
+    assert calls == []
+
+    ents[7].data["scan"] = "x" * 25_000
+    ents[9].bonds.append("s8")
+    ents[11].soul.frequency = 3.0
+    for _ in range(SEDIMENT_RATE):
+        physics.step(1.0)
+    assert {e.id for e in calls} == {"s7", "s9", "s11"}
+
+
+def test_lightened_sediment_rises_within_one_rate():
+    physics, ents = _abyss(20)
+    ents[3].data.clear()
+    for _ in range(SEDIMENT_RATE):
+        physics.step(1.0)
+    assert ents[3] in physics.entities
+    assert ents[3] not in physics.sediment_layer
+    assert ents[3].physics.mass <= ABYSS_THRESHOLD
+    assert len(physics.sediments) == 19
+
+
+def test_lazy_drift_matches_per_period_drift():
+    physics, ents = _abyss(5)
+    ent = ents[2]
+    entry = physics.sediment_layer._members[id(ent)]
+    start, v, settled = ent.physics.position.x, ent.physics.velocity.x, entry.settled
+
+    for _ in range(3 * SEDIMENT_RATE + 5):  # 5 sediments: each visited every 5 ticks
+        physics.step(1.0)
+
+    periods = (entry.settled - settled) // SEDIMENT_RATE
+    assert periods == 3
+    x = start
+    for _ in range(periods):
+        v *= 0.9 * 0.95  # drag (entropy > 10) then inertia damping
+        x += v
+    assert ent.physics.position.x == pytest.approx(x)
+    assert ent.physics.velocity.x == pytest.approx(v)
+
+
+def test_layer_survives_fork_and_snapshot():
+    physics, ents = _abyss(6)
+    world = World(physics=physics)
+    for ent in ents:
+        world.add_entity(ent)
+
+    for copy in (world.fork(), WorldSnapshot.capture(world).restore()):
+        sediments = copy.physics.sediments
+        assert [e.id for e in sediments] == [e.id for e in physics.sediments]
+        assert all(e is copy.entities[e.id] for e in sediments)
+        sediments[0].data.clear()
+        for _ in range(SEDIMENT_RATE):
+            copy.physics.step(1.0)
+        assert len(copy.physics.sediment_layer) == 5
+    assert len(physics.sediment_layer) == 6
+
+
+def test_nested_shrink_is_seen():
+    physics, ents = _abyss(4)
+    ents[0].data["scan"] = ["x"] * 20_000
+    for _ in range(SEDIMENT_RATE):
+        physics.step(1.0)
+    assert ents[0] in physics.sediment_layer
+
+    ents[0].data["scan"].clear()  # In place: no top-level write
+    for _ in range(SEDIMENT_RATE):
+        physics.step(1.0)
+    assert ents[0] in physics.entities
+
+
+def test_sediments_is_a_live_view():
+    physics, ents = _abyss(3)
+    extra = _heavy(9)
+    physics.sediments.append(extra)
+    assert extra in physics.sediment_layer and len(physics.sediments) == 4
+    assert physics.sediments[-1] is extra
+    assert len(physics.entities + physics.sediments) == 4
+
+    physics.sediments.remove(extra)
+    assert extra not in physics.sediment_layer
+    with pytest.raises(ValueError):
+        physics.sediments.remove(extra)
+    with pytest.raises(AttributeError):
+        physics.sediments.insert(0, extra)
+    physics.sediments.clear()
+    assert len(physics.sediment_layer) == 0
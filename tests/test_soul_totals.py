@@ -0,0 +1,107 @@
+"""
+Tests for the shared per-tick soul aggregate (World.soul_totals).
+"""
+
+import math
+import random
+
+from elysia_engine.consciousness import GlobalConsciousness
+from elysia_engine.entities import Entity
+from elysia_engine.math_utils import Vector3
+from elysia_engine.systems.fractal_evolution import CosmicResonanceField
+from elysia_engine.tensor import SoulTensor
+from elysia_engine.world import World
+
+
+def _world(n=50, seed=3):
+    rng = random.Random(seed)
+    world = World()
+    for i in range(n):
+        ent = Entity(id=f"e{i}")
+        if i % 7:
+            ent.soul = SoulTensor(
+                amplitude=rng.uniform(1, 30), frequency=rng.uniform(0.5, 3.0), phase=rng.uniform(0, 2 * math.pi)
+            )
+        world.add_entity(ent)
+    return world
+
+
+def test_metrics_match_direct_scan():
+    world = _world()
+    souls = [e.soul for e in world.entities.values() if e.soul]
+
+    vec = Vector3(0, 0, 0)
+    for soul in souls:
+        vec = vec + Vector3(math.cos(soul.phase), math.sin(soul.phase), 0)
+    observer = GlobalConsciousness()
+    observer.calculate_metrics(world)
+    assert observer.alignment_score == (vec * (1.0 / len(souls))).magnitude
+
+    state = CosmicResonanceField().calculate_field_state(world)
+    amplitude = 0.0
+    for soul in souls:
+        amplitude += soul.amplitude
+    assert state["entity_count"] == len(souls)
+    assert state["total_amplitude"] == amplitude
+    assert state["coherence"] == math.sqrt((vec.x / len(souls)) ** 2 + (vec.y / len(souls)) ** 2)
+
+
+def test_computed_once_per_tick_and_membership():
+    world = _world()
+    totals = world.soul_totals()
+    assert world.soul_totals() is totals
+
+    world.step(1.0)
+    stepped = world.soul_totals()
+    assert stepped is not totals
+    assert stepped.cos_sum != totals.cos_sum  # Phases moved
+
+    world.add_entity(Entity(id="late", soul=SoulTensor(amplitude=5.0, frequency=1.0, phase=0.0)))
+    grown = world.soul_totals()
+    assert grown.count == stepped.count + 1
+    assert grown.amplitude_sum == stepped.amplitude_sum + 5.0
+
+    del world.entities["late"]
+    assert world.soul_totals().count == stepped.count
+
+
+def test_empty_world():
+    world = World()
+    assert world.soul_totals().count == 0
+    observer = GlobalConsciousness()
+    observer.calculate_metrics(world)
+    assert observer.global_entropy == 0.0
+
+
+def test_fork_recomputes():
+    world = _world()
+    world.soul_totals()
+    future = world.fork()
+    future.entities["e1"].soul.phase += 1.0
+    assert future.soul_totals().cos_sum != world.soul_totals().cos_sum
+
+
+def test_soul_writes_within_a_tick():
+    world = _world()
+    field = CosmicResonanceField()
+    before = field.calculate_field_state(world)
+    for _ in range(200):
+        field.broadcast_pulse(world, intensity=10.0)
+    after = field.calculate_field_state(world)
+    assert after["coherence"] > 0.99 > before["coherence"]
+
+    observer = GlobalConsciousness()
+    observer.calculate_metrics(world)
+    for ent in world.entities.values():
+        if ent.soul:
+            ent.soul.phase = 1.0
+    observer.calculate_metrics(world)
+    assert math.isclose(observer.alignment_score, 1.0)
+
+    # Swapping a soul and writing amplitude are both seen
+    world.entities["e0"].soul = SoulTensor(amplitude=2.0, frequency=1.0, phase=1.0)
+    assert world.soul_totals().count == after["entity_count"] + 1
+    world.entities["e0"].soul.amplitude = 4.0
+    assert world.soul_totals().amplitude_sum == sum(
+        e.soul.amplitude for e in world.entities.values() if e.soul
+    )
@@ -0,0 +1,187 @@
+"""
+Tests for the uniform-grid neighbour index used by dimensional binding.
+"""
+
+import copy
+import math
+import random
+
+from elysia_engine.entities import Entity
+from elysia_engine.math_utils import Vector3
+from elysia_engine.physics import PhysicsWorld
+from elysia_engine.spatial import SpatialHashGrid
+from elysia_engine.tensor import SoulTensor
+
+
+def _brute_force_binding(physics: PhysicsWorld, entity: Entity) -> None:
+    """The original O(N) scan, kept as the reference behaviour."""
+    if not entity.soul or entity.soul.is_collapsed:
+        return
+    for other in physics.entities:
+        if other.id == entity.id:
+            continue
+        if not other.soul:
+            continue
+        dist = (entity.physics.position - other.physics.position).magnitude
+        if dist < 2.0:
+            res = entity.soul.resonate(other.soul)
+            if res["resonance"] > 0.9:
+                if other.id not in entity.bonds:
+                    entity.bonds.append(other.id)
+                    if entity.dimension == 0:
+                        entity.dimension = 1
+                if entity.id not in other.bonds:
+                    other.bonds.append(entity.id)
+                    if other.dimension == 0:
+                        other.dimension = 1
+                if len(entity.bonds) >= 2:
+                    entity.dimension = 2
+            if dist < 0.5 and res["resonance"] > 0.95:
+                entity.soul.entangle(other.soul)
+
+
+def _make_world(n: int, extent: float, seed: int) -> PhysicsWorld:
+    rng = random.Random(seed)
+    physics = PhysicsWorld()
+    for i in range(n):
+        ent = Entity(
+            id=f"e{i}",
+            soul=SoulTensor(
+                amplitude=rng.uniform(1, 30),
+                frequency=rng.uniform(0.5, 3.0),
+                phase=rng.choice([0.0, 0.05, 0.1, rng.uniform(0, 2 * math.pi)]),
+            ),
+        )
+        ent.physics.position = Vector3(
+            rng.uniform(-extent, extent),
+            rng.uniform(-extent, extent),
+            rng.uniform(-extent, extent),
+        )
+        physics.register_entity(ent)
+    return physics
+
+
+def _snapshot(physics: PhysicsWorld):
+    return [
+        (e.id, list(e.bonds), e.dimension, e.soul.phase)
+        for e in physics.entities
+    ]
+
+
+class TestSpatialHashGrid:
+    def test_neighbors_preserve_insertion_order(self):
+        grid = SpatialHashGrid(2.0, lambda p: p)
+        points = [Vector3(0.5, 0, 0), Vector3(-0.5, 0, 0), Vector3(5.5, 0, 0), Vector3(0.1, 0.1, 0)]
+        grid.rebuild(points)
+
+        found = grid.neighbors(Vector3(0, 0, 0), 2.0)
+        assert [id(p) for p in found] == [id(points[0]), id(points[1]), id(points[3])]
+
+    def test_rebuild_from_supplied_positions(self):
+        points = [Vector3(0.5, 0, 0), Vector3(-0.5, 0, 0), Vector3(5.5, 0, 0), Vector3(float("nan"), 0, 0)]
+        by_callback = SpatialHashGrid(2.0, lambda p: p)
+        by_callback.rebuild(points)
+        supplied = SpatialHashGrid(2.0, lambda p: p)
+        supplied.rebuild(points, [(p.x, p.y, p.z) for p in points])
+
+        assert supplied._cells == by_callback._cells and supplied._slots == by_callback._slots
+        assert supplied.neighbors(Vector3(0, 0, 0), 2.0) == points[:2]
+
+    def test_relocate_and_remove(self):
+        grid = SpatialHashGrid(1.0, lambda p: p)
+        p = Vector3(0, 0, 0)
+        grid.insert(p)
+        p.x = 10.0
+        grid.relocate(p)
+
+        assert grid.neighbors(Vector3(0, 0, 0), 1.0) == []
+        assert grid.neighbors(Vector3(10, 0, 0), 1.0) == [p]
+
+        grid.remove(p)
+        assert len(grid) == 0
+        assert grid.neighbors(Vector3(10, 0, 0), 1.0) == []
+
+    def test_non_finite_positions_are_never_neighbours(self):
+        grid = SpatialHashGrid(1.0, lambda p: p)
+        grid.insert(Vector3(float("inf"), 0, 0))
+        assert grid.neighbors(Vector3(0, 0, 0), 1.0) == []
+        assert grid.neighbors(Vector3(float("nan"), 0, 0), 1.0) == []
+
+
+class TestDimensionalBindingIndex:
+    def test_binding_matches_brute_force(self):
+        indexed = _make_world(300, 6.0, seed=7)
+        reference = copy.deepcopy(indexed)
+
+        for ent in indexed.entities:
+            indexed.check_dimensional_binding(ent)
+        for ent in reference.entities:
+            _brute_force_binding(reference, ent)
+
+        assert _snapshot(indexed) == _snapshot(reference)
+        assert any(e.bonds for e in indexed.entities)
+
+    def test_step_matches_brute_force(self):
+        indexed = _make_world(120, 4.0, seed=11)
+        reference = copy.deepcopy(indexed)
+        reference.check_dimensional_binding = lambda ent: _brute_force_binding(reference, ent)
+
+        for _ in range(5):
+            indexed.step(0.1)
+            reference.step(0.1)
+
+        assert _snapshot(indexed) == _snapshot(reference)
+
+    def test_net_force_path_tracks_movement(self):
+        physics = PhysicsWorld()
+        a = Entity(id="a", soul=SoulTensor(amplitude=1, frequency=1.0, phase=0.0))
+        b = Entity(id="b", soul=SoulTensor(amplitude=1, frequency=1.0, phase=0.0))
+        b.physics.position = Vector3(50, 0, 0)
+        physics.register_entity(a)
+        physics.register_entity(b)
+
+        # Move b next to a via the integration path, then ask for a's forces.
+        b.physics.velocity = Vector3(-49.5, 0, 0)
+        b.physics.step(1.0)
+        physics.notify_moved(b)
+        physics.get_net_force(a)
+
+        assert "b" in a.bonds
+
+
+def test_direct_position_writes_are_seen_by_binding():
+    for array_backend in (False, True):
+        physics = PhysicsWorld(array_backend=array_backend)
+        a = Entity(id="a", soul=SoulTensor(1.0, 1.0, 0.0))
+        b = Entity(id="b", soul=SoulTensor(1.0, 1.0, 0.0))
+        b.physics.position = Vector3(40.0, 0.0, 0.0)
+        physics.register_entity(a)
+        physics.register_entity(b)
+
+        # Moved after registration, outside any step
+        a.physics.position = Vector3(100.0, 0.0, 0.0)
+        b.physics.position = Vector3(100.5, 0.0, 0.0)
+        physics.check_dimensional_binding(a)
+        assert list(a.bonds) == ["b"] and list(b.bonds) == ["a"]
+
+        # Also through get_net_force (the Entity.apply_physics path)
+        b.physics.position = Vector3(-50.0, 0.0, 0.0)
+        c = Entity(id="c", soul=SoulTensor(1.0, 1.0, 0.0))
+        physics.register_entity(c)
+        c.physics.position = Vector3(-50.5, 0.0, 0.0)
+        physics.get_net_force(c)
+        assert "b" in c.bonds
+
+
+def test_entities_appended_directly_are_seen_by_binding():
+    physics = PhysicsWorld()
+    a = Entity(id="a", soul=SoulTensor(1.0, 1.0, 0.0))
+    b = Entity(id="b", soul=SoulTensor(1.0, 1.0, 0.0))
+    b.physics.position = Vector3(0.1, 0.0, 0.0)
+    physics.register_entity(a)
+    physics.refresh_neighbor_index()
+
+    # No position write follows the append
+    physics.entities.append(b)
+    physics.get_net_force(a)
+    assert "b" in a.bonds
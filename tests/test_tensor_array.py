@@ -0,0 +1,92 @@
+"""
+Tests for the vectorized SoulTensorArray.
+"""
+
+import math
+import random
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from elysia_engine.tensor import SoulTensor
+from elysia_engine.tensor_array import ArraySoulTensor, SoulTensorArray
+
+
+def _random_souls(n: int, seed: int = 3):
+    rng = random.Random(seed)
+    return [
+        SoulTensor(
+            amplitude=rng.uniform(0, 200),
+            frequency=rng.uniform(0, 5),
+            phase=rng.uniform(0, 2 * math.pi),
+            polarity=rng.choice([1.0, -1.0]),
+            is_collapsed=rng.random() < 0.2,
+        )
+        for _ in range(n)
+    ]
+
+
+class TestSoulTensorArray:
+    def test_handles_read_and_write_through(self):
+        store = SoulTensorArray(capacity=1)
+        soul = store.add(amplitude=10, frequency=2.0, phase=0.5)
+        other = store.add(amplitude=5, frequency=1.0, phase=0.0, polarity=-1.0)
+
+        soul.frequency = 3.0
+        soul.collapse()
+
+        assert isinstance(soul, SoulTensor)
+        assert store.frequency[soul.row] == 0.0
+        assert store.amplitude[soul.row] == pytest.approx(40.0)
+        assert bool(store.is_collapsed[soul.row]) is True
+        assert other.polarity == -1.0
+        assert soul.as_dict()["is_collapsed"] is True
+
+    def test_batched_step_matches_per_object_step(self):
+        souls = _random_souls(50)
+        store = SoulTensorArray()
+        handles = [store.attach(SoulTensor(**{
+            k: getattr(s, k) for k in ("amplitude", "frequency", "phase", "polarity", "is_collapsed")
+        })) for s in souls]
+
+        for _ in range(20):
+            for s in souls:
+                s.step(0.3)
+            store.step(0.3)
+
+        for s, h in zip(souls, handles):
+            assert h.phase == pytest.approx(s.phase)
+            assert h.coherence == pytest.approx(s.coherence)
+
+    def test_resonance_matrix_matches_resonate(self):
+        souls = _random_souls(12)
+        store = SoulTensorArray()
+        handles = [store.attach(s) for s in souls]
+
+        matrix = store.resonance_matrix()
+        assert matrix.shape == (12, 12)
+        for i, a in enumerate(handles):
+            for j, b in enumerate(handles):
+                assert matrix[i, j] == pytest.approx(a.resonate(b)["resonance"])
+
+    def test_release_skips_dead_rows(self):
+        store = SoulTensorArray()
+        a = store.add(amplitude=1, frequency=1.0, phase=0.0)
+        b = store.add(amplitude=1, frequency=1.0, phase=1.0)
+        store.release(a)
+
+        store.step(1.0)
+        assert len(store) == 1
+        assert store.resonance_matrix().shape == (1, 1)
+        assert b.phase == pytest.approx(2.0)
+
+    def test_entangled_peers_follow_driver(self):
+        store = SoulTensorArray()
+        a = store.add(amplitude=1, frequency=1.0, phase=0.0)
+        plain = SoulTensor(amplitude=1, frequency=0.0, phase=0.0)
+        a.entangle(plain)
+
+        store.step(1.0)
+        assert plain.phase == pytest.approx(a.phase)
+        assert isinstance(a, ArraySoulTensor)
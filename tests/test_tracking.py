@@ -0,0 +1,49 @@
+"""
+Tests for the change-tracked containers behind Entity.data / Entity.bonds.
+"""
+
+import copy
+import pickle
+
+from elysia_engine.entities import Entity
+from elysia_engine.tracking import TrackedDict, TrackedList, version_of
+
+
+def test_every_mutation_bumps_the_version():
+    d = TrackedDict(a=1)
+    for mutate in (
+        lambda: d.__setitem__("b", 2), lambda: d.__delitem__("b"), lambda: d.update(c=3),
+        lambda: d.setdefault("e", 5), lambda: d.pop("e"), lambda: d.popitem(), lambda: d.clear(),
+    ):
+        before = d.version
+        mutate()
+        assert d.version > before
+
+    items = TrackedList([3, 1])
+    for mutate in (
+        lambda: items.append(2), lambda: items.extend([5]), lambda: items.insert(0, 9), lambda: items.sort(),
+        lambda: items.reverse(), lambda: items.remove(9), lambda: items.pop(), lambda: items.__setitem__(0, 7),
+        lambda: items.clear(),
+    ):
+        before = items.version
+        mutate()
+        assert items.version > before
+
+
+def test_versions_are_never_reused():
+    a, b = TrackedDict(), TrackedDict()
+    assert a.version != b.version
+    assert version_of({}) is None
+
+
+def test_entity_keeps_data_and_bonds_tracked():
+    ent = Entity(id="e", data={"k": "v"}, bonds=["x"])
+    assert type(ent.data) is TrackedDict and type(ent.bonds) is TrackedList
+    old = ent.data.version
+    ent.data = {"k": "v"}
+    assert type(ent.data) is TrackedDict and ent.data.version != old
+    assert ent == Entity(id="e", data={"k": "v"}, bonds=["x"])
+
+    for clone in (copy.deepcopy(ent), pickle.loads(pickle.dumps(ent))):
+        assert type(clone.data) is TrackedDict and clone.data == {"k": "v"}
+        assert type(clone.bonds) is TrackedList and clone.bonds == ["x"]
@@ -0,0 +1,118 @@
+"""
+Tests for World.fork (fast isolated timeline copies).
+"""
+
+import pytest
+
+from elysia_engine.chronos import DreamSystem
+from elysia_engine.entities import Entity
+from elysia_engine.math_utils import Vector3
+from elysia_engine.physics import PhysicsWorld
+from elysia_engine.systems.fractal_evolution import FractalEvolutionSystem
+from elysia_engine.systems.thermodynamics import ThermodynamicsSystem
+from elysia_engine.tensor import SoulTensor
+from elysia_engine.world import World
+
+
+def _world(physics=None) -> World:
+    world = World(physics=physics or PhysicsWorld())
+    for i in range(12):
+        ent = Entity(
+            id=f"e{i}",
+            soul=SoulTensor(amplitude=5 + i, frequency=1.0 + 0.1 * i, phase=0.2 * i),
+            data={"tag": i, "history": [i]},
+            bonds=[f"e{(i + 1) % 12}"],
+        )
+        ent.physics.position = Vector3(i * 0.7, (i % 3) * 0.5, 0.0)
+        ent.physics.velocity = Vector3(0.1, 0.0, -0.1)
+        world.add_entity(ent)
+        world.physics.register_entity(ent)
+    world.entities["e0"].soul.entangled_peers.append(world.entities["e1"].soul)
+    world.entities["e1"].soul.entangled_peers.append(world.entities["e0"].soul)
+    world.add_system(ThermodynamicsSystem())
+    world.add_system(FractalEvolutionSystem())
+    return world
+
+
+def _state(world: World):
+    return {
+        eid: (
+            ent.physics.position.x, ent.physics.position.y, ent.physics.position.z,
+            ent.soul.amplitude, ent.soul.frequency, ent.soul.phase, ent.dimension,
+            sorted(ent.bonds), dict(ent.data, history=list(ent.data.get("history", []))),
+        )
+        for eid, ent in world.entities.items()
+    }
+
+
+def test_fork_is_isolated_in_both_directions():
+    world = _world()
+    before = _state(world)
+    fork = world.fork()
+
+    f0 = fork.entities["e0"]
+    f0.physics.position.x = 99.0
+    f0.soul.amplitude = 0.0
+    f0.data["history"].append("fork")
+    f0.data["new"] = True
+    f0.bonds.append("x")
+    assert _state(world) == before
+
+    parent0 = world.entities["e0"]
+    parent0.physics.velocity.y = 5.0
+    parent0.data["history"].append("parent")
+    assert fork.entities["e0"].physics.velocity.y == 0.0
+    assert fork.entities["e0"].data["history"] == [0, "fork"]
+
+
+def test_fork_keeps_internal_references_consistent():
+    world = _world()
+    fork = world.fork()
+
+    f0, f1 = fork.entities["e0"], fork.entities["e1"]
+    assert f0.soul.entangled_peers == [f1.soul]
+    assert f0.soul.entangled_peers[0] is f1.soul
+    assert [e.id for e in fork.physics.entities] == [e.id for e in world.physics.entities]
+    assert all(fork.entities[e.id] is e for e in fork.physics.entities)
+    assert fork.physics.neighbor_index.neighbors(f0.physics.position, 2.0)[0] in fork.physics.entities
+    assert f0 not in world.physics.neighbor_index
+    assert fork.systems[0] is not world.systems[0]
+
+
+def test_fork_evolves_exactly_like_clone():
+    world = _world()
+    world.physics.update_field()
+    fork, clone = world.fork(), world.clone()
+    for _ in range(5):
+        fork.step(1.0)
+        clone.step(1.0)
+    assert _state(fork) == _state(clone)
+
+
+def test_fork_drops_profiler():
+    world = _world()
+    world.enable_profiling()
+    fork = world.fork()
+    assert fork.profiler is None and fork.physics.profiler is None
+    assert world.physics.profiler is world.profiler
+
+
+def test_fork_copies_array_backend_store():
+    pytest.importorskip("numpy")
+    world = _world(PhysicsWorld(array_backend=True))
+    fork = world.fork()
+
+    store = fork.physics.state_store
+    assert store is not world.physics.state_store
+    assert fork.entities["e3"].physics.store is store
+
+    fork.entities["e3"].physics.position = Vector3(7.0, 7.0, 7.0)
+    assert world.entities["e3"].physics.position == Vector3(3 * 0.7, 0.0, 0.0)
+
+
+def test_prophecy_leaves_present_untouched():
+    world = _world()
+    before = _state(world)
+    future = DreamSystem().prophecy(world, horizon=5)
+    assert future.tick == world.tick + 5
+    assert _state(world) == before
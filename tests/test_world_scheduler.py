@@ -0,0 +1,77 @@
+"""
+Tests for the per-system tick-rate scheduler in World.step.
+"""
+
+from elysia_engine.systems import System
+from elysia_engine.world import World
+
+
+class RecordingSystem(System):
+    def __init__(self, name, log):
+        self.name = name
+        self.log = log
+
+    def step(self, world, dt):
+        self.log.append((world.tick, self.name, dt))
+
+
+class SlowSystem(RecordingSystem):
+    tick_period = 4
+
+
+def test_default_schedule_runs_every_tick_in_order():
+    log = []
+    world = World()
+    world.add_system(RecordingSystem("a", log))
+    world.add_system(RecordingSystem("b", log))
+
+    world.step(dt=0.5)
+    world.step(dt=0.5)
+
+    assert log == [(1, "a", 0.5), (1, "b", 0.5), (2, "a", 0.5), (2, "b", 0.5)]
+
+
+def test_period_accumulates_dt():
+    log = []
+    world = World()
+    world.add_system(RecordingSystem("slow", log), period=3, offset=0)
+
+    for _ in range(6):
+        world.step(dt=0.5)
+
+    assert [(t, dt) for t, _, dt in log] == [(3, 1.5), (6, 1.5)]
+
+
+def test_same_period_systems_are_staggered():
+    log = []
+    world = World()
+    for name in ("a", "b", "c", "d"):
+        world.add_system(SlowSystem(name, log))
+
+    for _ in range(4):
+        world.step(dt=1.0)
+
+    ticks = {name: tick for tick, name, _ in log}
+    assert sorted(ticks.values()) == [1, 2, 3, 4]
+    assert all(dt == 4.0 or tick < 4 for tick, _, dt in log)
+
+
+def test_order_overrides_registration_order():
+    log = []
+    world = World()
+    world.add_system(RecordingSystem("late", log), order=10)
+    world.add_system(RecordingSystem("early", log), order=-1)
+
+    world.step()
+
+    assert [name for _, name, _ in log] == ["early", "late"]
+
+
+def test_systems_appended_directly_still_run():
+    log = []
+    world = World()
+    world.systems.append(RecordingSystem("raw", log))
+
+    world.step()
+
+    assert log == [(1, "raw", 1.0)]